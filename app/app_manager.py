@@ -85,6 +85,9 @@ class App:
         self.update_checker = UpdateChecker(self)
         self.page.run_task(self.install_manager.check_env)
         if self.record_manager is not None:
+            self.page.run_task(self.record_manager.hydrate_recordings)
+            self.page.run_task(services.watch_user_config)
+            self.page.run_task(self.record_manager.stall_watchdog.run)
             self.page.run_task(self.record_manager.check_free_space)
         self.page.run_task(self._check_for_updates)
 
@@ -121,12 +124,12 @@ class App:
         except Exception:
             return None
 
-    def schedule_card_update(self, recording) -> None:
+    def schedule_card_update(self, recording, fields: set[str] | None = None) -> None:
         loop = self._get_session_loop()
         if loop is None:
             return
         try:
-            asyncio.run_coroutine_threadsafe(self.record_card_manager.update_card(recording), loop)
+            asyncio.run_coroutine_threadsafe(self.record_card_manager.update_card(recording, fields), loop)
         except Exception as exc:
             logger.debug(f"schedule_card_update dropped: {exc}")
 
@@ -154,6 +157,15 @@ class App:
         except Exception as exc:
             logger.debug(f"schedule_pubsub dropped: {exc}")
 
+    def schedule_filter_refresh(self) -> None:
+        loop = self._get_session_loop()
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.recordings.refresh_filter_area(), loop)
+        except Exception as exc:
+            logger.debug(f"schedule_filter_refresh dropped: {exc}")
+
     def initialize_pages(self):
         return {
             "settings": self.settings,
@@ -4,7 +4,7 @@ import os
 import shutil
 import tempfile
 import threading
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from ...utils.logger import logger
 
@@ -20,11 +20,16 @@ class ConfigManager:
         self.cookies_config_path = os.path.join(self.config_path, "cookies.json")
         self.about_config_path = os.path.join(self.config_path, "version.json")
         self.recordings_config_path = os.path.join(self.config_path, "recordings.json")
+        self.recordings_db_path = os.path.join(self.config_path, "recordings.db")
         self.accounts_config_path = os.path.join(self.config_path, "accounts.json")
         self.web_auth_config_path = os.path.join(self.config_path, "web_auth.json")
+        self.live_history_config_path = os.path.join(self.config_path, "live_history.json")
+        self.sessions_db_path = os.path.join(self.config_path, "sessions.db")
 
         os.makedirs(os.path.dirname(self.default_config_path), exist_ok=True)
         self.init()
+        # Baseline for detecting edits of user_settings.json made outside the app.
+        self._seen_signatures.setdefault(self.user_config_path, self._get_file_signature(self.user_config_path))
 
     def init(self):
         self.init_default_config()
@@ -33,6 +38,7 @@ class ConfigManager:
         self.init_accounts_config()
         self.init_recordings_config()
         self.init_web_auth_config()
+        self.init_live_history_config()
 
     @staticmethod
     def _init_config(config_path, default_config=None):
@@ -72,6 +78,10 @@ class ConfigManager:
         cookies_config = {}
         self._init_config(self.web_auth_config_path, cookies_config)
 
+    def init_live_history_config(self):
+        live_history_config = {}
+        self._init_config(self.live_history_config_path, live_history_config)
+
     @staticmethod
     def _load_config(config_path, error_message):
         """Load configuration from a JSON file."""
@@ -116,31 +126,81 @@ class ConfigManager:
     def load_web_auth_config(self):
         return self._load_config(self.web_auth_config_path, "An error occurred while loading web auth config")
 
+    def load_live_history_config(self):
+        return self._load_config(self.live_history_config_path, "An error occurred while loading live history config")
+
     _write_lock = threading.Lock()
+    # Parsed JSON files by path, together with the (mtime, size) signature of the file they were parsed from.
+    _cache: dict[str, tuple[tuple[int, int] | None, Any]] = {}
+    # Last known signature of watched files; writes by the app itself update it, so only outside edits show up.
+    _seen_signatures: dict[str, tuple[int, int] | None] = {}
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def _get_file_signature(config_path) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_cached_config(self, config_path, error_message):
+        """
+        Load a JSON file through the in-memory cache; it is only parsed again after its mtime or size changed.
+
+        The returned object is shared between callers and must not be modified.
+        """
+        signature = self._get_file_signature(config_path)
+        with self._cache_lock:
+            entry = self._cache.get(config_path)
+        if entry is not None and signature is not None and entry[0] == signature:
+            return entry[1]
+        data = self._load_config(config_path, error_message)
+        with self._cache_lock:
+            self._cache[config_path] = (signature, data)
+        return data
+
+    def poll_user_config(self) -> dict | None:
+        """Return the user config if ``user_settings.json`` was changed outside the app since the last poll."""
+        path = self.user_config_path
+        signature = self._get_file_signature(path)
+        with self._cache_lock:
+            last_signature = self._seen_signatures.get(path)
+            self._seen_signatures[path] = signature
+        if signature is None or signature == last_signature:
+            return None
+        data = self._load_cached_config(path, "An error occurred while loading user config")
+        # An empty or invalid file is most likely caught in the middle of being written.
+        return data if isinstance(data, dict) and data else None
+
+    @staticmethod
+    def _write_config_sync(config_path, content: str):
+        """Atomically replace a configuration file with ``content``."""
+        with ConfigManager._write_lock:
+            dir_name = os.path.dirname(config_path)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=".cfg_", dir=str(dir_name))
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(tmp_path, config_path)
+            except BaseException:
+                # Clean up temp file on failure.
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            with ConfigManager._cache_lock:
+                ConfigManager._cache.pop(config_path, None)
+                if config_path in ConfigManager._seen_signatures:
+                    ConfigManager._seen_signatures[config_path] = ConfigManager._get_file_signature(config_path)
 
     @staticmethod
     async def _save_config(config_path, config, success_message, error_message):
         """Save configuration to a JSON file (thread-safe, atomic write)."""
         try:
             content = json.dumps(config, ensure_ascii=False, indent=4)
-
-            def _write_sync():
-                with ConfigManager._write_lock:
-                    dir_name = os.path.dirname(config_path)
-                    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=".cfg_", dir=str(dir_name))
-                    try:
-                        with os.fdopen(fd, "w", encoding="utf-8") as f:
-                            f.write(content)
-                        os.replace(tmp_path, config_path)
-                    except BaseException:
-                        # Clean up temp file on failure.
-                        try:
-                            os.unlink(tmp_path)
-                        except OSError:
-                            pass
-                        raise
-
-            await asyncio.to_thread(_write_sync)
+            await asyncio.to_thread(ConfigManager._write_config_sync, config_path, content)
             logger.info(success_message)
         except Exception as e:
             logger.error(f"{error_message}: {e}")
@@ -153,6 +213,11 @@ class ConfigManager:
             error_message="An error occurred while saving recordings config",
         )
 
+    def save_recordings_config_sync(self, config):
+        """Blocking variant used by the recordings writer thread; errors are raised to the caller."""
+        content = json.dumps(config, ensure_ascii=False, indent=4)
+        self._write_config_sync(self.recordings_config_path, content)
+
     async def save_accounts_config(self, config):
         await self._save_config(
             self.accounts_config_path,
@@ -169,6 +234,11 @@ class ConfigManager:
             error_message="An error occurred while saving web auth config",
         )
 
+    def save_live_history_config_sync(self, config):
+        """Blocking variant used by the live history writer thread; errors are raised to the caller."""
+        content = json.dumps(config, ensure_ascii=False, indent=4)
+        self._write_config_sync(self.live_history_config_path, content)
+
     async def save_user_config(self, config):
         await self._save_config(
             self.user_config_path,
@@ -186,6 +256,8 @@ class ConfigManager:
         )
 
     def get_config_value(self, key: str, default: T = None) -> T:
-        user_config = self.load_user_config()
-        default_config = self.load_default_config()
+        user_config = self._load_cached_config(self.user_config_path, "An error occurred while loading user config")
+        default_config = self._load_cached_config(
+            self.default_config_path, "An error occurred while loading default config"
+        )
         return user_config.get(key, default_config.get(key, default))
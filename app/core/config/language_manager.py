@@ -52,7 +52,8 @@ class LanguageManager:
         Initialize the LanguageManager with settings and load the language configuration.
         """
         run_path = self.run_path or (self.app.run_path if self.app is not None else None) or ""
-        config_manager = ConfigManager(run_path)
+        owner = self.services or self.app
+        config_manager = getattr(owner, "config_manager", None) or ConfigManager(run_path)
         language_code = self._resolve_language_code() or "zh_CN"
         logger.info(f"Language Code: {language_code}")
         i18n_filename = f"{language_code}.json"
@@ -3,10 +3,13 @@ import os
 import time
 from typing import Optional
 
-import aiofiles
 import httpx
 
 from ...utils.logger import logger
+from .write_behind import DEFAULT_FLUSH_INTERVAL_SECONDS, TransferMeter, WriteBehindFile
+
+# Seconds between two speed lines in the log.
+SPEED_LOG_INTERVAL = 10
 
 
 class DirectStreamDownloader:
@@ -21,17 +24,23 @@ class DirectStreamDownloader:
         headers: Optional[dict[str, str]] = None,
         proxy: Optional[str] = None,
         chunk_size: int = 1024 * 16,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
     ):  # 16KB chunks
         self.record_url = record_url
         self.save_path = save_path
         self.headers = headers or {}
         self.proxy = proxy or None
         self.chunk_size = chunk_size
+        # Chunks are written in large blocks by a writer thread, at the latest after this many seconds.
+        self.flush_interval = flush_interval
+        self.meter = TransferMeter()
         self.stop_event = asyncio.Event()
         self.process = None
         self.download_task = None
         self.total_bytes = 0
+        self.data_received = asyncio.Event()
         self.start_time = None
+        self.error = None
 
     async def start_download(self) -> bool:
         self.start_time = time.time()
@@ -60,6 +69,7 @@ class DirectStreamDownloader:
                     # Accept 2xx status codes (200, 201, 206, etc.)
                     if not (200 <= response.status_code < 300):
                         logger.error(f"Request Stream Failed, Status Code: {response.status_code}")
+                        self.error = f"HTTP {response.status_code}"
                         return
 
                     # Log if redirect occurred
@@ -68,20 +78,27 @@ class DirectStreamDownloader:
                         final_url = str(response.url)
                         logger.info(f"Redirected {redirect_count} time(s) to: {final_url}")
 
-                    async with aiofiles.open(self.save_path, "wb") as f:
+                    f = await WriteBehindFile.open(self.save_path, flush_interval=self.flush_interval)
+                    try:
+                        speed_logged_at = time.monotonic()
                         async for chunk in response.aiter_bytes(self.chunk_size):
                             if self.stop_event.is_set():
                                 break
 
                             await f.write(chunk)
                             self.total_bytes += len(chunk)
+                            self.meter.add(len(chunk))
+                            self.data_received.set()
 
-                            # Please don't remove this comment code
-                            # elapsed = time.time() - self.start_time
-                            # if int(elapsed) % 10 == 0:
-                            #     mb_downloaded = self.total_bytes / (1024 * 1024)
-                            #     mb_per_sec = mb_downloaded / elapsed if elapsed > 0 else 0
-                            #     logger.info(f"Downloaded {mb_downloaded:.2f} MB, Speed: {mb_per_sec:.2f} MB/s")
+                            if time.monotonic() - speed_logged_at >= SPEED_LOG_INTERVAL:
+                                speed_logged_at = time.monotonic()
+                                mb_downloaded = self.total_bytes / (1024 * 1024)
+                                logger.debug(
+                                    f"Downloaded {mb_downloaded:.2f} MB, Speed: {self.meter.rate / 1024:.0f} KB/s, "
+                                    f"Average: {self.meter.average_rate / 1024:.0f} KB/s"
+                                )
+                    finally:
+                        await f.close()
 
             logger.success(f"Download Completed: {self.save_path}")
 
@@ -89,3 +106,4 @@ class DirectStreamDownloader:
             logger.info(f"Download Task Canceled: {self.record_url}")
         except Exception as e:
             logger.error(f"Download Error: {e}")
+            self.error = str(e)
@@ -108,7 +108,9 @@ class FFmpegCommandBuilder(abc.ABC):
             "-max_muxing_queue_size", config["max_muxing_queue_size"],
             "-correct_ts_overflow", "1",
             "-avoid_negative_ts", "1",
-            "-flush_packets", "1"
+            "-flush_packets", "1",
+            "-progress", "pipe:1",
+            "-nostats",
         ]
         # fmt: on
 
@@ -0,0 +1,92 @@
+import time
+from dataclasses import dataclass, field, replace
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_seconds(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+@dataclass
+class FFmpegProgress:
+    """One block of the ``-progress`` output of ffmpeg; unknown values (``N/A``) are None."""
+
+    frame: int = 0
+    fps: float | None = None
+    bitrate_kbps: float | None = None
+    total_size: int = 0
+    out_time_seconds: float = 0.0
+    dup_frames: int = 0
+    drop_frames: int = 0
+    speed: float | None = None
+    is_end: bool = False
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def format_rate(self) -> str:
+        """Transfer rate for the speed label of the recording card, e.g. ``312 KB/s | 85.2 MB``."""
+        rate = f"{self.bitrate_kbps / 8:.0f} KB/s" if self.bitrate_kbps is not None else "X KB/s"
+        return f"{rate} | {format_size(self.total_size)}"
+
+
+def _to_int(value: str) -> int | None:
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _to_float(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class FFmpegProgressParser:
+    """
+    Incremental parser for ``ffmpeg -progress pipe:1``.
+
+    ffmpeg writes ``key=value`` lines and ends every block with ``progress=continue`` (or ``progress=end``).
+    Lines are fed one at a time; ``feed`` returns a snapshot when a block is complete.
+    """
+
+    def __init__(self):
+        self._current = FFmpegProgress()
+
+    def feed(self, line: str) -> FFmpegProgress | None:
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            return None
+        value = value.strip()
+        current = self._current
+        if key == "progress":
+            current.is_end = value == "end"
+            current.updated_at = time.monotonic()
+            return replace(current)
+        if key == "frame":
+            current.frame = _to_int(value) or 0
+        elif key == "fps":
+            current.fps = _to_float(value)
+        elif key == "bitrate":
+            current.bitrate_kbps = _to_float(value.removesuffix("kbits/s"))
+        elif key == "total_size":
+            current.total_size = _to_int(value) or current.total_size
+        elif key == "out_time_us":
+            out_time_us = _to_int(value)
+            if out_time_us is not None and out_time_us >= 0:
+                current.out_time_seconds = out_time_us / 1_000_000
+        elif key == "dup_frames":
+            current.dup_frames = _to_int(value) or 0
+        elif key == "drop_frames":
+            current.drop_frames = _to_int(value) or 0
+        elif key == "speed":
+            current.speed = _to_float(value.removesuffix("x"))
+        return None
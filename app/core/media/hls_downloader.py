@@ -0,0 +1,303 @@
+import asyncio
+import importlib.util
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urljoin
+
+import aiofiles
+import httpx
+
+from ...utils.logger import logger
+from .write_behind import TransferMeter
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); without it the shared clients use HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Segments fetched at the same time when a recording starts or catches up.
+MAX_PARALLEL_SEGMENTS = 4
+# Segments before the live edge a recording starts with, like the default ``live_start_index`` of ffmpeg.
+LIVE_START_SEGMENTS = 3
+# Consecutive failed playlist reloads after which the download ends.
+MAX_PLAYLIST_ERRORS = 3
+SEGMENT_RETRIES = 2
+REQUEST_TIMEOUT_SECONDS = 15
+_BANDWIDTH_PATTERN = re.compile(r"BANDWIDTH=(\d+)")
+
+
+@dataclass
+class HLSSegment:
+    sequence: int
+    url: str
+    duration: float
+
+
+@dataclass
+class HLSPlaylist:
+    target_duration: float = 6.0
+    media_sequence: int = 0
+    discontinuity_sequence: int = 0
+    segments: list[HLSSegment] = field(default_factory=list)
+    # (bandwidth, url) of the variant streams of a master playlist.
+    variants: list[tuple[int, str]] = field(default_factory=list)
+    ended: bool = False
+    # Set for streams the engine cannot write as plain TS, e.g. encrypted or fMP4 segments.
+    unsupported: str | None = None
+
+
+def parse_playlist(text: str, base_url: str) -> HLSPlaylist:
+    """Parse a master or media playlist; segment and variant URLs are resolved against ``base_url``."""
+    playlist = HLSPlaylist()
+    duration = 0.0
+    bandwidth = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        tag, _, value = line.partition(":")
+        try:
+            if tag == "#EXT-X-TARGETDURATION":
+                playlist.target_duration = float(value)
+            elif tag == "#EXT-X-MEDIA-SEQUENCE":
+                playlist.media_sequence = int(value)
+            elif tag == "#EXT-X-DISCONTINUITY-SEQUENCE":
+                playlist.discontinuity_sequence = int(value)
+            elif tag == "#EXTINF":
+                duration = float(value.split(",", 1)[0])
+        except ValueError:
+            logger.debug(f"Ignoring malformed playlist line: {line}")
+        if tag == "#EXT-X-STREAM-INF":
+            match = _BANDWIDTH_PATTERN.search(value)
+            bandwidth = int(match.group(1)) if match else 0
+        elif tag == "#EXT-X-KEY" and "METHOD=NONE" not in value:
+            playlist.unsupported = "encrypted segments"
+        elif tag == "#EXT-X-MAP":
+            playlist.unsupported = "fMP4 segments"
+        elif line == "#EXT-X-ENDLIST":
+            playlist.ended = True
+        elif line.startswith("#"):
+            continue
+        elif bandwidth is not None:
+            playlist.variants.append((bandwidth, urljoin(base_url, line)))
+            bandwidth = None
+        else:
+            sequence = playlist.media_sequence + len(playlist.segments)
+            playlist.segments.append(HLSSegment(sequence, urljoin(base_url, line), duration))
+    return playlist
+
+
+class SharedClients:
+    """
+    HTTP/2 clients shared by the running HLS downloads, one per proxy and event loop, so the segments of
+    rooms served by the same CDN reuse connections instead of opening new ones per recording.
+    """
+
+    def __init__(self):
+        # (event loop, proxy) -> [client, number of downloads using it]
+        self._clients: dict[tuple, list] = {}
+
+    def acquire(self, proxy: Optional[str]) -> httpx.AsyncClient:
+        key = (asyncio.get_running_loop(), proxy)
+        entry = self._clients.get(key)
+        if entry is None:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE, proxy=proxy, timeout=REQUEST_TIMEOUT_SECONDS, follow_redirects=True
+            )
+            entry = self._clients[key] = [client, 0]
+        entry[1] += 1
+        return entry[0]
+
+    async def release(self, proxy: Optional[str]) -> None:
+        key = (asyncio.get_running_loop(), proxy)
+        entry = self._clients.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._clients[key]
+            await entry[0].aclose()
+
+
+shared_clients = SharedClients()
+
+
+class HLSStreamDownloader:
+    """
+    Record an HLS live stream without ffmpeg.
+
+    The media playlist is reloaded about once per target duration. New segments are fetched in parallel over
+    a shared HTTP/2 client, de-duplicated by media sequence number and appended in order to one TS file.
+    Encrypted and fMP4 streams are not supported and need the ffmpeg recorder.
+    """
+
+    def __init__(
+        self,
+        record_url: str,
+        save_path: str,
+        headers: Optional[dict[str, str]] = None,
+        proxy: Optional[str] = None,
+        max_parallel_segments: int = MAX_PARALLEL_SEGMENTS,
+    ):
+        self.record_url = record_url
+        self.save_path = save_path
+        self.headers = headers or {}
+        self.proxy = proxy or None
+        self.max_parallel_segments = max_parallel_segments
+        self.stop_event = asyncio.Event()
+        self.download_task = None
+        self.total_bytes = 0
+        self.data_received = asyncio.Event()
+        self.meter = TransferMeter()
+        self.start_time = None
+        self.error = None
+        # Media sequence number of the next segment to write; earlier segments are duplicates.
+        self.next_sequence = None
+        self.discontinuity_sequence = 0
+        self.segments_written = 0
+        self.segments_skipped = 0
+
+    async def start_download(self) -> bool:
+        self.start_time = time.time()
+        self.download_task = asyncio.create_task(self._download_stream())
+        return True
+
+    async def stop_download(self) -> None:
+        if not self.stop_event.is_set():
+            self.stop_event.set()
+            if self.download_task:
+                try:
+                    await asyncio.wait_for(self.download_task, timeout=10.0)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Download Timeout: {self.record_url}")
+                except Exception as e:
+                    logger.error(f"Download Error: {e}")
+
+    async def _download_stream(self) -> None:
+        client = shared_clients.acquire(self.proxy)
+        try:
+            os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
+            playlist_url = self.record_url
+            playlist = await self._fetch_playlist(client, playlist_url)
+            if playlist.variants:
+                playlist_url = max(playlist.variants)[1]
+                logger.info(f"Selected HLS variant: {playlist_url}")
+                playlist = await self._fetch_playlist(client, playlist_url)
+            if playlist.unsupported:
+                self.error = f"Unsupported HLS stream: {playlist.unsupported}"
+                logger.error(f"{self.error}, use the ffmpeg recorder for this room: {self.record_url}")
+                return
+
+            async with aiofiles.open(self.save_path, "wb") as f:
+                while playlist is not None:
+                    segments = self._select_new_segments(playlist)
+                    await self._write_segments(client, f, segments)
+                    if playlist.ended or self.stop_event.is_set():
+                        break
+                    # Reload after a target duration, or half of it when nothing was new (RFC 8216, 6.3.4).
+                    delay = playlist.target_duration if segments else playlist.target_duration / 2
+                    playlist = await self._reload_playlist(client, playlist_url, delay)
+
+            logger.success(f"Download Completed: {self.save_path}")
+
+        except asyncio.CancelledError:
+            logger.info(f"Download Task Canceled: {self.record_url}")
+        except Exception as e:
+            logger.error(f"Download Error: {e}")
+            self.error = str(e)
+        finally:
+            await shared_clients.release(self.proxy)
+
+    async def _fetch_playlist(self, client: httpx.AsyncClient, url: str) -> HLSPlaylist:
+        response = await client.get(url, headers=self.headers)
+        response.raise_for_status()
+        return parse_playlist(response.text, str(response.url))
+
+    async def _reload_playlist(self, client: httpx.AsyncClient, url: str, delay: float) -> HLSPlaylist | None:
+        """Fetch the playlist again after ``delay`` seconds; None when stopped or when reloading keeps failing."""
+        for attempt in range(1, MAX_PLAYLIST_ERRORS + 1):
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=delay)
+                return None
+            except asyncio.TimeoutError:
+                pass
+            try:
+                return await self._fetch_playlist(client, url)
+            except httpx.HTTPError as e:
+                logger.warning(f"Reload HLS playlist failed ({attempt}/{MAX_PLAYLIST_ERRORS}): {e}")
+                if attempt == MAX_PLAYLIST_ERRORS:
+                    self.error = f"Playlist reload failed: {e}"
+            delay = min(delay, 1.0)
+        return None
+
+    def _select_new_segments(self, playlist: HLSPlaylist) -> list[HLSSegment]:
+        segments = playlist.segments
+        restarted = self.next_sequence is not None and self._is_restarted(playlist)
+        self.discontinuity_sequence = playlist.discontinuity_sequence
+        if self.next_sequence is None:
+            # Start close to the live edge instead of replaying the whole playlist window.
+            return segments if playlist.ended else segments[-LIVE_START_SEGMENTS:]
+        if restarted:
+            # Everything in the playlist of a restarted origin is new; the sequence is re-anchored as it is written.
+            logger.warning(
+                f"HLS stream restarted at media sequence {playlist.media_sequence} "
+                f"(expected {self.next_sequence}): {self.record_url}"
+            )
+            return segments
+        new_segments = [segment for segment in segments if segment.sequence >= self.next_sequence]
+        if new_segments and new_segments[0].sequence > self.next_sequence:
+            missed = new_segments[0].sequence - self.next_sequence
+            self.segments_skipped += missed
+            logger.warning(f"{missed} HLS segments left the playlist before they were fetched: {self.record_url}")
+        return new_segments
+
+    def _is_restarted(self, playlist: HLSPlaylist) -> bool:
+        """
+        Whether the origin started counting again: the discontinuity sequence went backwards, or the newest
+        segment is more than a playlist window behind the ones already written. A playlist only a segment or
+        two behind is a stale reload, e.g. from another CDN edge, and must not be recorded twice.
+        """
+        if playlist.discontinuity_sequence < self.discontinuity_sequence:
+            return True
+        segments = playlist.segments
+        return bool(segments) and segments[-1].sequence + len(segments) < self.next_sequence
+
+    async def _fetch_segment(self, client: httpx.AsyncClient, segment: HLSSegment) -> bytes | None:
+        for attempt in range(SEGMENT_RETRIES + 1):
+            try:
+                response = await client.get(segment.url, headers=self.headers)
+                response.raise_for_status()
+                return response.content
+            except httpx.HTTPError as e:
+                if attempt == SEGMENT_RETRIES:
+                    logger.warning(f"Skipping HLS segment {segment.sequence}: {e}")
+        return None
+
+    async def _write_segments(self, client: httpx.AsyncClient, file, segments: list[HLSSegment]) -> None:
+        """Fetch ``segments`` in parallel and append them to ``file`` in media sequence order."""
+        if not segments:
+            return
+        semaphore = asyncio.Semaphore(self.max_parallel_segments)
+
+        async def fetch(segment: HLSSegment) -> bytes | None:
+            async with semaphore:
+                return await self._fetch_segment(client, segment)
+
+        tasks = [asyncio.create_task(fetch(segment)) for segment in segments]
+        try:
+            for segment, task in zip(segments, tasks):
+                data = await task
+                if self.stop_event.is_set():
+                    break
+                if data is None:
+                    self.segments_skipped += 1
+                else:
+                    await file.write(data)
+                    self.total_bytes += len(data)
+                    self.meter.add(len(data))
+                    self.segments_written += 1
+                    self.data_received.set()
+                self.next_sequence = segment.sequence + 1
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,188 @@
+import asyncio
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+from ...utils.logger import logger
+
+DEFAULT_FLUSH_BYTES = 1024 * 1024
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_BUFFERED_BYTES = 8 * 1024 * 1024
+
+
+class WriteBehindFile:
+    """
+    Buffered write-behind for one output file.
+
+    Chunks are gathered in memory and written as one block by the file's own writer thread once ``flush_bytes``
+    are buffered or ``flush_interval`` seconds passed, instead of one executor round trip per chunk. The thread
+    also opens and closes the file, so a slow or hung target only holds up the downloads writing to it.
+    ``write`` waits while more than ``max_buffered_bytes`` are not on disk yet, which bounds the memory of
+    a download that outpaces the disk. A failed write is raised by the next ``write`` or by ``close``.
+
+    Create instances with ``await WriteBehindFile.open(path)``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+    ):
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.max_buffered_bytes = max(max_buffered_bytes, flush_bytes)
+        self.loop = asyncio.get_running_loop()
+        # Blocks for the writer thread; None tells it to close the file and exit.
+        self._queue = queue.SimpleQueue()
+        self._opened = self.loop.create_future()
+        self._closed = self.loop.create_future()
+        self._chunks: deque[bytes] = deque()
+        self._buffered_bytes = 0  # gathered, not handed to the writer thread yet
+        self._pending_bytes = 0  # gathered or queued, not written yet
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._flush_handle = None
+        self._error = None
+        self.bytes_written = 0
+
+    @classmethod
+    async def open(cls, path: str, **kwargs) -> "WriteBehindFile":
+        """Start the writer thread of a new file at ``path`` and wait until it opened the file."""
+        file = cls(path, **kwargs)
+        threading.Thread(target=file._run, name="WriteBehind", daemon=True).start()
+        try:
+            await file._opened
+        except asyncio.CancelledError:
+            # The thread may still open the file, it closes it again on the sentinel.
+            file._queue.put(None)
+            raise
+        return file
+
+    def _run(self) -> None:
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        except OSError as e:
+            self._call_soon(self._resolve, self._opened, e)
+            return
+        self._call_soon(self._resolve, self._opened, None)
+        while (block := self._queue.get()) is not None:
+            error = None
+            try:
+                view = memoryview(block)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            except OSError as e:
+                error = e
+            self._call_soon(self._on_written, len(block), error)
+        error = None
+        try:
+            os.close(fd)
+        except OSError as e:
+            error = e
+        self._call_soon(self._resolve, self._closed, error)
+
+    def _call_soon(self, callback, *args) -> None:
+        try:
+            self.loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # The event loop of the file is closed, nobody is waiting for the result.
+            pass
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, error: OSError | None) -> None:
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
+    async def write(self, data: bytes) -> None:
+        if self._error is not None:
+            raise self._error
+        self._chunks.append(data)
+        self._buffered_bytes += len(data)
+        self._pending_bytes += len(data)
+        self._drained.clear()
+        if self._buffered_bytes >= self.flush_bytes:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self.flush_interval, self.flush)
+        if self._pending_bytes > self.max_buffered_bytes:
+            await self._drained.wait()
+
+    def flush(self) -> None:
+        """Hand the gathered chunks to the writer thread."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._chunks:
+            return
+        block = b"".join(self._chunks)
+        self._chunks.clear()
+        self._buffered_bytes = 0
+        self._queue.put(block)
+
+    def _on_written(self, size: int, error: OSError | None) -> None:
+        self._pending_bytes -= size
+        if error is None:
+            self.bytes_written += size
+        elif self._error is None:
+            logger.error(f"Write failed: {self.path}, {error}")
+            self._error = error
+        if self._pending_bytes <= self.max_buffered_bytes // 2 or self._error is not None:
+            self._drained.set()
+
+    async def close(self) -> None:
+        """Write everything gathered so far, close the file and stop the writer thread."""
+        self.flush()
+        self._queue.put(None)
+        # The thread reports every queued block before the file is closed.
+        await self._closed
+        if self._error is not None:
+            raise self._error
+
+
+class TransferMeter:
+    """Bytes per second over a sliding window of recent samples."""
+
+    def __init__(self, window: float = 5.0):
+        self.window = window
+        self.total_bytes = 0
+        self.started_at = time.monotonic()
+        self._samples: deque[tuple[float, int]] = deque()
+
+    def add(self, size: int) -> None:
+        now = time.monotonic()
+        self.total_bytes += size
+        samples = self._samples
+        if samples and now - samples[-1][0] < 0.1:
+            # Chunks arriving within 100ms share one sample, so the deque stays small at high rates.
+            samples[-1] = (samples[-1][0], samples[-1][1] + size)
+        else:
+            samples.append((now, size))
+        while samples and now - samples[0][0] > self.window:
+            samples.popleft()
+
+    @property
+    def rate(self) -> float:
+        """Bytes per second over the window, or since the start when it is shorter."""
+        now = time.monotonic()
+        samples = self._samples
+        while samples and now - samples[0][0] > self.window:
+            samples.popleft()
+        elapsed = min(self.window, now - self.started_at)
+        if elapsed <= 0:
+            return 0.0
+        return sum(size for _, size in samples) / elapsed
+
+    @property
+    def average_rate(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.total_bytes / elapsed if elapsed > 0 else 0.0
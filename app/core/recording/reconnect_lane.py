@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from ...models.recording.recording_status_model import RecordingStatus
+from ...utils.logger import logger
+from ..scheduling.rate_limiter import TokenBucketLimiter
+from .stream_manager import LiveStreamRecorder
+
+# Delays before each reconnect attempt; the first one is immediate.
+RECONNECT_RETRY_DELAYS = (0, 2, 5)
+# Per platform limits of the reconnect lane, separate from the limiter used by routine live checks.
+RECONNECT_REQUESTS_PER_SECOND = 1.0
+RECONNECT_BURST = 3
+RECONNECT_CONCURRENCY = 2
+
+
+@dataclass
+class ReconnectStats:
+    count: int = 0
+    last_gap: float = 0.0
+    max_gap: float = 0.0
+    total_gap: float = 0.0
+
+
+class ReconnectLane:
+    """
+    Fast restart of recordings whose recorder exited without being asked to.
+
+    Instead of a full ``check_if_live`` behind the routine checks, the lane fetches the stream again right
+    away, with its own per platform limiter, and starts a new recorder when the room is still live. The
+    gap between the old recorder's exit and the new one receiving data is measured per room.
+    """
+
+    def __init__(self, recording_manager):
+        self.recording_manager = recording_manager
+        self.services = recording_manager.services
+        self._limiters: dict[str, TokenBucketLimiter] = {}
+        self._in_progress: set[str] = set()
+        self._stats: dict[str, ReconnectStats] = {}
+        self._lock = threading.Lock()
+
+    def _get_limiter(self, platform_key: str | None) -> TokenBucketLimiter:
+        key = platform_key or ""
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = TokenBucketLimiter(
+                    key, RECONNECT_REQUESTS_PER_SECOND, RECONNECT_BURST, RECONNECT_CONCURRENCY
+                )
+            return limiter
+
+    def get_stats(self, rec_id: str) -> ReconnectStats | None:
+        with self._lock:
+            return self._stats.get(rec_id)
+
+    def record_gap(self, recording, gap: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(recording.rec_id, ReconnectStats())
+            stats.count += 1
+            stats.last_gap = gap
+            stats.max_gap = max(stats.max_gap, gap)
+            stats.total_gap += gap
+        logger.info(f"Reconnected after a {gap:.1f}s gap: {recording.url}")
+
+    def _can_reconnect(self, recording) -> bool:
+        return (
+            self.services.recording_enabled
+            and recording.monitor_status
+            and not recording.manually_stopped
+            and recording.rec_id not in self.recording_manager.active_recorders
+        )
+
+    async def reconnect(
+        self,
+        recording,
+        ended_at: float,
+        on_ended: Callable[[], Awaitable[None]],
+        on_failed: Callable[[], Awaitable[None]],
+    ) -> None:
+        """
+        Restart the recording of a room whose recorder exited at ``ended_at``, a ``time.monotonic`` value.
+
+        ``on_ended`` runs when the room is no longer live, ``on_failed`` when the stream could not be
+        fetched after all attempts.
+        """
+        with self._lock:
+            if recording.rec_id in self._in_progress:
+                return
+            self._in_progress.add(recording.rec_id)
+        manager = self.recording_manager
+        try:
+            if recording.rec_id in manager.active_recorders:
+                return
+            if not self._can_reconnect(recording):
+                await on_ended()
+                return
+            recording.status_info = RecordingStatus.PREPARING_RECORDING
+            self.services.broadcast_card_update(recording)
+            for delay in RECONNECT_RETRY_DELAYS:
+                if delay:
+                    await asyncio.sleep(delay)
+                if recording.rec_id in manager.active_recorders:
+                    return
+                if not self._can_reconnect(recording):
+                    await on_ended()
+                    return
+                recording_info = manager.get_recording_info(recording)
+                platform_key = recording_info["platform_key"]
+                # The lane has its own rate limits, but an open circuit stops it like the routine checks.
+                breaker = manager.circuit_breakers.get(platform_key)
+                if not breaker.allow_request():
+                    logger.warning(f"Not reconnecting, platform {platform_key} is unavailable: {recording.url}")
+                    await on_failed()
+                    return
+                recorder = LiveStreamRecorder(self.services, recording, recording_info)
+                try:
+                    async with self._get_limiter(platform_key).acquire():
+                        stream_info = await recorder.fetch_stream()
+                except BaseException:
+                    breaker.release_probe()
+                    raise
+                # Throttling seen here also slows down the routine checks of the platform.
+                manager.rate_limiter.get(platform_key).report_result(recorder.fetch_error)
+                if not stream_info or not stream_info.anchor_name:
+                    breaker.record_failure()
+                    logger.warning(f"Reconnect could not fetch stream data, retrying: {recording.url}")
+                    continue
+                breaker.record_success()
+                if not stream_info.is_live:
+                    logger.info(f"Not reconnecting, the live stream has ended: {recording.url}")
+                    await on_ended()
+                    return
+
+                logger.info(
+                    f"Reconnecting {time.monotonic() - ended_at:.1f}s after the recorder exited: {recording.url}"
+                )
+                recording.live_title = stream_info.title
+                recorder.reconnect_gap_from = ended_at
+                recording.loop_time_seconds = manager.loop_time_seconds
+                manager.start_update(recording)
+                self.services.run_coro(recorder.start_recording(stream_info))
+                return
+
+            logger.error(f"Reconnect failed after {len(RECONNECT_RETRY_DELAYS)} attempts: {recording.url}")
+            await on_failed()
+        finally:
+            with self._lock:
+                self._in_progress.discard(recording.rec_id)
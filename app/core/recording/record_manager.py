@@ -1,6 +1,11 @@
 import asyncio
+import copy
+import itertools
+import json
+import random
 import threading
-from collections import defaultdict
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
 
 from ...messages import desktop_notify, message_pusher
@@ -10,11 +15,37 @@ from ...utils import utils
 from ...utils.logger import logger
 from ..platforms.platform_handlers import get_platform_info
 from ..runtime.process_manager import BackgroundService
+from ..scheduling.circuit_breaker import PlatformCircuitBreakers
+from ..scheduling.live_check_scheduler import LiveCheckScheduler, get_phase
+from ..scheduling.live_history import LiveHistory
+from ..scheduling.rate_limiter import PlatformRateLimiter
+from ..scheduling.single_flight import SingleFlight, normalize_room_url
+from .reconnect_lane import ReconnectLane
+from .recording_storage import SQLiteRecordingStorage, create_recording_storage
+from .recording_store import RecordingStore
+from .recordings_writer import DEFAULT_WRITE_WINDOW_SECONDS, DebouncedWriter
+from .session_history import SessionHistory
+from .stall_watchdog import StallWatchdog
 from .stream_manager import LiveStreamRecorder
 
+# Relative random spread applied to failure backoff delays, so failing rooms do not retry in lockstep.
+FAILURE_BACKOFF_JITTER = 0.2
+DEFAULT_FAILURE_BACKOFF_MAX_SECONDS = 3600
+# Initial checks of a batch are spread over this many seconds per room, up to one polling interval.
+RAMP_SECONDS_PER_ROOM = 0.5
+# Successful stream info fetched for a room URL is reused by checks of the same URL for this long.
+STREAM_INFO_TTL_SECONDS = 5
+# Recordings loaded synchronously at startup; the rest is hydrated in the background in batches.
+STARTUP_FIRST_PAGE_SIZE = 100
+HYDRATE_BATCH_SIZE = 500
+# Recording settings that a running recorder only picks up when it restarts.
+RESTART_FIELDS = ("quality", "record_format", "video_bitrate", "hls_use_native_engine")
+
 
 class GlobalRecordingState:
-    recordings = []
+    store = RecordingStore()
+    # Guards mutations spanning the store, the live check scheduler and the live history. It is only held
+    # for in-memory work and never across an await, so the backend loop and the session loops can share it.
     lock = threading.Lock()
 
 
@@ -24,14 +55,46 @@ class RecordingManager:
         self.settings = services.settings_config
         self.periodic_task_started = False
         self.loop_time_seconds = None
+        self.live_check_scheduler = LiveCheckScheduler()
+        self.live_history = LiveHistory(services.config_manager)
+        self.session_history = SessionHistory(services.config_manager)
+        self.recording_storage = create_recording_storage(
+            services.config_manager, self.settings.user_config.get("recordings_storage")
+        )
+        # rec_ids to upsert and to delete with the next save of the SQLite storage, in the order they changed.
+        self._unsaved_ids: dict[str, None] = {}
+        self._deleted_ids: dict[str, None] = {}
+        self._unsaved_lock = threading.Lock()
+        self.recordings_writer = DebouncedWriter(
+            name="recordings",
+            snapshot=self._take_unsaved_changes,
+            write=self._write_recordings,
+            get_window=lambda: self.settings.user_config.get(
+                "recordings_save_window_seconds", DEFAULT_WRITE_WINDOW_SECONDS
+            ),
+        )
         self.services.language_manager.add_observer(self)
+        self._pending_records = None
+        self._hydration_claimed = False
+        self._persist_after_hydration = False
+        self.hydrated = threading.Event()
+        # Callbacks ``(batch, done)`` told about every hydrated batch, see ``subscribe_hydration``.
+        self._hydration_listeners: list[Callable[[list[Recording], bool], None]] = []
         self.load_recordings()
         self._ = {}
         self.load()
         self.initialize_dynamic_state()
-        max_concurrent = int(self.settings.user_config.get("platform_max_concurrent_requests", 3))
-        self.platform_semaphores = defaultdict(lambda: asyncio.Semaphore(max_concurrent))
+        self.rate_limiter = PlatformRateLimiter(self.settings.user_config)
+        self.live_check_flights = SingleFlight()
+        self.stream_info_flights = SingleFlight(
+            ttl=STREAM_INFO_TTL_SECONDS, cacheable=lambda result: bool(result[0] and result[0].anchor_name)
+        )
+        self.circuit_breakers = PlatformCircuitBreakers(
+            self.settings.user_config, on_state_change=lambda _breaker: self.services.broadcast_filter_refresh()
+        )
         self.active_recorders = {}
+        self.stall_watchdog = StallWatchdog(self, self.settings.user_config)
+        self.reconnect_lane = ReconnectLane(self)
 
     @property
     def app(self):
@@ -39,8 +102,13 @@ class RecordingManager:
         return bridges[0] if bridges else None
 
     @property
-    def recordings(self):
-        return GlobalRecordingState.recordings
+    def recordings(self) -> tuple[Recording, ...]:
+        """Snapshot of the recordings; it is not affected by later additions or removals."""
+        return GlobalRecordingState.store.to_list()
+
+    @property
+    def recording_store(self) -> RecordingStore:
+        return GlobalRecordingState.store
 
     @recordings.setter
     def recordings(self, value):
@@ -52,46 +120,365 @@ class RecordingManager:
             self._.update(language.get(key, {}))
 
     def load_recordings(self):
-        """Load recordings from a JSON file into objects."""
-        recordings_data = self.services.config_manager.load_recordings_config()
-        if not GlobalRecordingState.recordings:
-            GlobalRecordingState.recordings = [Recording.from_dict(rec) for rec in recordings_data]
-        logger.info(f"Live Recordings: Loaded {len(self.recordings)} items")
+        """
+        Load the first page of recordings from the configured storage into objects.
+
+        The remaining records are decoded lazily and added by ``hydrate_recordings``, so startup time does
+        not grow with the number of rooms.
+        """
+        if GlobalRecordingState.store:
+            self.hydrated.set()
+            return
+        records = self.recording_storage.iter_records()
+        for record in itertools.islice(records, STARTUP_FIRST_PAGE_SIZE):
+            GlobalRecordingState.store.add(Recording.from_dict(record))
+        self._pending_records = records
+        logger.info(f"Live Recordings: Loaded first {len(self.recordings)} items")
+
+    @property
+    def is_hydrated(self) -> bool:
+        return self.hydrated.is_set()
+
+    def subscribe_hydration(
+        self, callback: Callable[[list[Recording], bool], None]
+    ) -> tuple[tuple[Recording, ...], bool]:
+        """
+        Return the recordings loaded so far and whether hydration has finished.
+
+        Until it has, ``callback(batch, done)`` is called with every batch added afterwards, and once with
+        ``done`` set at the end. The callback runs on the hydrating loop and must hand the batch over to its
+        own loop itself.
+        """
+        with GlobalRecordingState.lock:
+            if not self.is_hydrated:
+                self._hydration_listeners.append(callback)
+            return self.recordings, self.is_hydrated
+
+    def unsubscribe_hydration(self, callback: Callable[[list[Recording], bool], None]):
+        with GlobalRecordingState.lock:
+            if callback in self._hydration_listeners:
+                self._hydration_listeners.remove(callback)
+
+    def _notify_hydration(self, batch: list[Recording], done: bool):
+        for callback in self._hydration_listeners:
+            try:
+                callback(batch, done)
+            except Exception as e:
+                logger.debug(f"Hydration listener failed: {e}")
+        if done:
+            self._hydration_listeners.clear()
+
+    async def hydrate_recordings(self):
+        """Load the recordings left over by ``load_recordings`` in batches, yielding to the loop in between."""
+        with GlobalRecordingState.lock:
+            if self._hydration_claimed:
+                return
+            self._hydration_claimed = True
+        records, self._pending_records = self._pending_records, None
+        try:
+            while records is not None:
+                batch = [Recording.from_dict(record) for record in itertools.islice(records, HYDRATE_BATCH_SIZE)]
+                if not batch:
+                    break
+                with GlobalRecordingState.lock:
+                    for recording in batch:
+                        GlobalRecordingState.store.add(recording)
+                    self._initialize_recordings_state(batch, len(self.recordings))
+                    self._notify_hydration(batch, False)
+                await asyncio.sleep(0)
+        except Exception as e:
+            logger.error(f"Failed to load recordings: {e}")
+        finally:
+            with GlobalRecordingState.lock:
+                self.hydrated.set()
+                persist = self._persist_after_hydration
+                self._notify_hydration([], True)
+            logger.info(f"Live Recordings: Loaded {len(self.recordings)} items")
+            if persist:
+                await self.persist_recordings(force=True)
+
+    def apply_settings_change(self, keys: set[str]):
+        """Apply changed user settings to the recordings and the live check machinery."""
+        if keys & {"folder_name_platform", "folder_name_author", "folder_name_time", "folder_name_title"}:
+            for recording in self.recordings:
+                recording.recording_dir = None
+            self.services.run_coro(self.persist_recordings())
+        if keys & {"loop_time_seconds", "adaptive_polling_enabled"}:
+            self.initialize_dynamic_state()
+        if keys & {
+            "platform_max_concurrent_requests",
+            "platform_requests_per_second",
+            "platform_request_burst",
+            "platform_rate_limits",
+        }:
+            self.rate_limiter.reload()
 
     def initialize_dynamic_state(self):
         """Initialize dynamic state for all recordings."""
         loop_time_seconds = self.settings.user_config.get("loop_time_seconds")
         self.loop_time_seconds = int(loop_time_seconds or 300)
-        for recording in self.recordings:
+        recordings = self.recordings
+        self._initialize_recordings_state(recordings, len(recordings))
+
+    def _initialize_recordings_state(self, recordings, room_count: int):
+        first_check_delay = self.get_first_check_delay()
+        ramp_window = self.get_ramp_window(room_count)
+        for recording in recordings:
             recording.loop_time_seconds = self.loop_time_seconds
             recording.update_title(self._.get(recording.quality, recording.quality))
             recording.showed_checking_status = True
+            self.live_history.track(recording.rec_id)
+            if recording.rec_id in self.live_check_scheduler:
+                self.schedule_live_check(recording)
+            else:
+                self.schedule_live_check(recording, first_check_delay + self.get_ramp_delay(recording, ramp_window))
+
+    def get_first_check_delay(self) -> int:
+        # Cards trigger an immediate check on creation when this is enabled, so the scheduler
+        # only has to pick the rooms up one polling interval later.
+        check_live_on_browser_refresh = self.settings.user_config.get("check_live_on_browser_refresh", True)
+        return self.loop_time_seconds if check_live_on_browser_refresh else 0
+
+    def is_ramp_enabled(self) -> bool:
+        return bool(self.settings.user_config.get("live_check_ramp_enabled", True))
+
+    def get_ramp_window(self, room_count: int) -> float:
+        """Seconds over which the initial checks of ``room_count`` rooms are spread."""
+        if not self.is_ramp_enabled() or room_count <= 1:
+            return 0
+        return min(self.loop_time_seconds, (room_count - 1) * RAMP_SECONDS_PER_ROOM)
+
+    @staticmethod
+    def get_ramp_delay(recording: Recording, ramp_window: float) -> float:
+        """Deterministic offset of a room's initial check within the ramp window."""
+        return get_phase(recording.rec_id) * ramp_window
+
+    def get_polling_interval(self, recording: Recording) -> int:
+        """Get the polling interval of a recording, adapted to its live history when enabled."""
+        base_interval = recording.loop_time_seconds or self.loop_time_seconds
+        if recording.is_live or not self.settings.user_config.get("adaptive_polling_enabled", True):
+            return base_interval
+        return self.live_history.get_polling_interval(recording.rec_id, base_interval)
+
+    def schedule_live_check(self, recording: Recording, delay: float | None = None):
+        """Queue the next live check of a monitored recording, by default one polling interval from now."""
+        if not recording.monitor_status:
+            self.live_check_scheduler.unschedule(recording.rec_id)
+            return
+        retry_delay = recording.next_retry_at - time.time() if recording.next_retry_at else 0
+        if delay is None:
+            interval = self.get_polling_interval(recording)
+            base_interval = recording.loop_time_seconds or self.loop_time_seconds
+            if retry_delay <= 0 and interval == base_interval and self.is_ramp_enabled():
+                # Keep each room on its own phase slot, so periodic checks do not drift into clumps.
+                # Adapted intervals are left alone, they already target a specific time.
+                self.live_check_scheduler.schedule_aligned(recording.rec_id, interval, recording)
+                return
+            delay = interval
+        self.live_check_scheduler.schedule(recording.rec_id, max(delay, retry_delay), recording)
+
+    def get_failure_backoff(self, recording: Recording) -> float:
+        """Get the jittered exponential backoff delay after the recording's consecutive check failures."""
+        base_interval = recording.loop_time_seconds or self.loop_time_seconds
+        try:
+            max_backoff = int(self.settings.user_config.get("check_failure_backoff_max_seconds") or 0)
+        except (TypeError, ValueError):
+            max_backoff = 0
+        max_backoff = max(max_backoff or DEFAULT_FAILURE_BACKOFF_MAX_SECONDS, base_interval)
+        exponent = min(max(recording.check_failure_count - 1, 0), 16)
+        delay = min(base_interval * 2**exponent, max_backoff)
+        jittered = delay * random.uniform(1 - FAILURE_BACKOFF_JITTER, 1 + FAILURE_BACKOFF_JITTER)
+        return min(max(jittered, base_interval), max_backoff)
+
+    def record_check_failure(self, recording: Recording):
+        """Count a failed live check and back the recording off exponentially."""
+        recording.check_failure_count += 1
+        delay = self.get_failure_backoff(recording)
+        recording.next_retry_at = time.time() + delay
+        logger.info(
+            f"Live check failed {recording.check_failure_count} time(s) in a row, next retry in {delay:.0f}s: "
+            f"{recording.url}"
+        )
+        self.schedule_live_check(recording)
+        self.services.run_coro(self.persist_recordings())
+
+    def reset_check_failures(self, recording: Recording, persist: bool = True):
+        if not recording.check_failure_count and not recording.next_retry_at:
+            return
+        recording.check_failure_count = 0
+        recording.next_retry_at = None
+        if persist:
+            self.services.run_coro(self.persist_recordings())
 
     async def add_recording(self, recording):
+        await self.add_recordings([recording])
+
+    async def add_recordings(self, recordings: list[Recording]):
+        """Add several recordings in one transaction and persist them once."""
+        if not recordings:
+            return
+        first_check_delay = self.get_first_check_delay()
         with GlobalRecordingState.lock:
-            GlobalRecordingState.recordings.append(recording)
-            await self.persist_recordings()
+            for recording in recordings:
+                GlobalRecordingState.store.add(recording)
+                self.live_history.track(recording.rec_id)
+                self.schedule_live_check(recording, first_check_delay)
+        self._queue_row_changes(saved=[recording.rec_id for recording in recordings])
+        await self.persist_recordings(force=True)
 
     async def remove_recording(self, recording: Recording):
+        await self.remove_recordings([recording])
+
+    async def remove_recordings(self, recordings: list[Recording]):
+        """Remove several recordings in one transaction and persist the remaining ones once."""
+        removed = []
         with GlobalRecordingState.lock:
-            GlobalRecordingState.recordings.remove(recording)
-            await self.persist_recordings()
+            for recording in recordings:
+                if recording is None or not GlobalRecordingState.store.remove(recording):
+                    continue
+                self.live_check_scheduler.unschedule(recording.rec_id)
+                self.live_history.remove(recording.rec_id)
+                removed.append(recording)
+        if removed:
+            self._queue_row_changes(deleted=[recording.rec_id for recording in removed])
+            await self.persist_recordings(force=True)
+        for recording in removed:
+            logger.info(f"Delete Items: {recording.rec_id}-{recording.streamer_name}")
 
     async def clear_all_recordings(self):
         with GlobalRecordingState.lock:
-            GlobalRecordingState.recordings.clear()
-            await self.persist_recordings()
+            removed = [recording.rec_id for recording in GlobalRecordingState.store.to_list()]
+            GlobalRecordingState.store.clear()
+            self.live_check_scheduler.clear()
+            self.live_history.clear()
+        self._queue_row_changes(deleted=removed)
+        await self.persist_recordings(force=True)
+
+    async def persist_recordings(self, force: bool = False):
+        """
+        Schedule a write of the recordings if a persistent field of any recording changed.
 
-    async def persist_recordings(self):
-        """Persist recordings to a JSON file."""
-        data_to_save = [rec.to_dict() for rec in self.recordings]
-        await self.services.config_manager.save_recordings_config(data_to_save)
+        The writer coalesces requests into one write per window. ``force`` is used when recordings
+        were added or removed, which the per-recording dirty fields do not reflect. Only the recordings
+        the store reports as changed are looked at, not the whole list.
+        """
+        changed = [
+            recording.rec_id
+            for recording in self.recording_store.pop_persist_dirty()
+            if recording.pop_dirty_persistent()
+        ]
+        self._queue_row_changes(saved=changed)
+        if not (changed or force):
+            return
+        with GlobalRecordingState.lock:
+            if not self.is_hydrated:
+                # Writing now would drop the recordings that are not loaded yet.
+                self._persist_after_hydration = True
+                return
+        self.recordings_writer.mark_dirty()
+
+    def _queue_row_changes(self, saved: list[str] = (), deleted: list[str] = ()) -> None:
+        with self._unsaved_lock:
+            for rec_id in saved:
+                self._deleted_ids.pop(rec_id, None)
+                self._unsaved_ids[rec_id] = None
+            for rec_id in deleted:
+                self._unsaved_ids.pop(rec_id, None)
+                self._deleted_ids[rec_id] = None
+
+    def _take_unsaved_changes(self) -> tuple[list[dict], list[str]]:
+        """
+        Snapshot for the recordings writer: the changed recordings and the removed rec_ids since the last save
+        for the SQLite storage, which writes only those rows; every recording for the JSON storage.
+        """
+        with self._unsaved_lock:
+            saved, self._unsaved_ids = self._unsaved_ids, {}
+            deleted, self._deleted_ids = self._deleted_ids, {}
+        if not isinstance(self.recording_storage, SQLiteRecordingStorage):
+            return [rec.to_dict() for rec in self.recordings], []
+        store = self.recording_store
+        records = [recording.to_dict() for rec_id in saved if (recording := store.get(rec_id)) is not None]
+        return records, list(deleted)
+
+    def _write_recordings(self, changes: tuple[list[dict], list[str]]) -> None:
+        records, deleted = changes
+        if not isinstance(self.recording_storage, SQLiteRecordingStorage):
+            self.recording_storage.save(records)
+            return
+        try:
+            self.recording_storage.save_rows(records, deleted)
+        except Exception:
+            # The writer retries with the next snapshot, which has to include these rows again unless they
+            # changed in the meantime.
+            with self._unsaved_lock:
+                for record in records:
+                    if record["rec_id"] not in self._deleted_ids:
+                        self._unsaved_ids.setdefault(record["rec_id"])
+                for rec_id in deleted:
+                    if rec_id not in self._unsaved_ids:
+                        self._deleted_ids.setdefault(rec_id)
+            raise
+
+    def flush_recordings(self):
+        """Write pending recording changes to the storage immediately."""
+        self.recordings_writer.flush()
+
+    def export_recordings_json(self, path: str | None = None) -> str:
+        """Export the recordings in the ``recordings.json`` format and return the written path."""
+        self.flush_recordings()
+        if isinstance(self.recording_storage, SQLiteRecordingStorage):
+            return self.recording_storage.export_json(path)
+        path = path or self.services.config_manager.recordings_config_path
+        if path != self.services.config_manager.recordings_config_path:
+            content = json.dumps(self.recording_storage.load(), ensure_ascii=False, indent=4)
+            self.services.config_manager._write_config_sync(path, content)
+        return path
 
     async def update_recording_card(self, recording: Recording, updated_info: dict):
         """Update an existing recording object and persist changes to a JSON file."""
         if recording:
-            recording.update(updated_info)
-            self.services.run_coro(self.persist_recordings())
+            await self.update_recordings([(recording, updated_info)])
+
+    async def update_recordings(self, updates: list[tuple[Recording, dict]]):
+        """Apply ``(recording, updated_info)`` changes to several recordings and persist them once."""
+        if not updates:
+            return
+        with GlobalRecordingState.lock:
+            for recording, updated_info in updates:
+                restart = recording.is_recording and any(
+                    key in updated_info and updated_info[key] != getattr(recording, key) for key in RESTART_FIELDS
+                )
+                recording.update(updated_info)
+                if "url" in updated_info:
+                    self.reset_check_failures(recording, persist=False)
+                self.schedule_live_check(recording)
+                if restart:
+                    self.services.run_coro(self.restart_recording(recording))
+        self.services.run_coro(self.persist_recordings())
+
+    async def restart_recording(self, recording: Recording):
+        """
+        Restart a running recording with freshly fetched stream data, e.g. after its quality changed. With
+        ``restart_handoff_enabled`` the running recorder keeps recording until the new one receives data.
+        """
+        if recording.rec_id not in self.active_recorders:
+            return
+        recording_info = self.get_recording_info(recording)
+        recorder = LiveStreamRecorder(self.services, recording, recording_info)
+        limiter = self.rate_limiter.get(recording_info["platform_key"])
+        async with limiter.acquire():
+            stream_info = await recorder.fetch_stream()
+        limiter.report_result(recorder.fetch_error)
+        if not stream_info or not stream_info.is_live:
+            logger.warning(f"Not restarting recording, no live stream data: {recording.url}")
+            return
+        if recording.rec_id not in self.active_recorders or recording.manually_stopped:
+            return
+
+        logger.info(f"Restarting recording with new settings: {recording.url}")
+        recording.title = f"{recording.streamer_name} - {self._[recording.quality]}"
+        recording.display_title = f"[{self._['is_live']}] {recording.title}"
+        await recorder.start_recording(stream_info)
 
     @staticmethod
     async def _update_recording(
@@ -106,9 +493,13 @@ class RecordingManager:
         for attr, value in attrs_update.items():
             setattr(recording, attr, value)
 
-    async def start_monitor_recording(self, recording: Recording, auto_save: bool = True):
+    async def start_monitor_recording(
+        self, recording: Recording, auto_save: bool = True, check_delay: float | None = None
+    ):
         """
         Start monitoring a single recording if it is not already being monitored.
+
+        :param check_delay: Delay of the first live check, which runs immediately when not given.
         """
         if not recording.monitor_status:
             recording.is_checking = True
@@ -123,9 +514,11 @@ class RecordingManager:
             )
 
             self.services.broadcast_card_update(recording)
-            self.services.broadcast_pubsub("update", recording)
 
-            self.services.run_coro(self.check_if_live(recording))
+            if check_delay:
+                self.schedule_live_check(recording, check_delay)
+            else:
+                self.services.run_coro(self.check_if_live(recording))
 
             if auto_save:
                 self.services.run_coro(self.persist_recordings())
@@ -143,8 +536,8 @@ class RecordingManager:
                 selected=False,
             )
             self.stop_recording(recording, manually_stopped=True)
+            self.live_check_scheduler.unschedule(recording.rec_id)
             self.services.broadcast_card_update(recording)
-            self.services.broadcast_pubsub("update", recording)
             if auto_save:
                 self.services.run_coro(self.persist_recordings())
 
@@ -155,9 +548,13 @@ class RecordingManager:
         selected_recordings = await self.get_selected_recordings()
         pre_start_monitor_recordings = selected_recordings or self.recordings
         cards_obj = self._get_visible_cards_obj()
+        ramp_window = self.get_ramp_window(len(pre_start_monitor_recordings))
         for recording in pre_start_monitor_recordings:
             if self._is_card_visible(cards_obj, recording):
-                self.services.run_coro(self.start_monitor_recording(recording, auto_save=False))
+                check_delay = self.get_ramp_delay(recording, ramp_window)
+                self.services.run_coro(
+                    self.start_monitor_recording(recording, auto_save=False, check_delay=check_delay)
+                )
         self.services.run_coro(self.persist_recordings())
         logger.info(f"Batch Start Monitor Recordings: {[i.rec_id for i in pre_start_monitor_recordings]}")
 
@@ -196,29 +593,21 @@ class RecordingManager:
         return getattr(card, "visible", True)
 
     async def get_selected_recordings(self):
-        return [recording for recording in self.recordings if recording.selected]
-
-    async def remove_recordings(self, recordings: list[Recording]):
-        """Remove a recording from the list and update the JSON file."""
-        for recording in recordings:
-            if recording in self.recordings:
-                await self.remove_recording(recording)
-                logger.info(f"Delete Items: {recording.rec_id}-{recording.streamer_name}")
+        return self.recording_store.get_selected()
 
     def find_recording_by_id(self, rec_id: str):
         """Find a recording by its ID (hash of dict representation)."""
-        for rec in self.recordings:
-            if rec.rec_id == rec_id:
-                return rec
-        return None
+        return self.recording_store.get(rec_id)
 
     async def check_all_live_status(self):
-        """Check the live status of all recordings and update their display titles."""
-        for recording in self.recordings:
-            if recording.monitor_status and not recording.is_recording:
-                is_exceeded = utils.is_time_interval_exceeded(recording.detection_time, recording.loop_time_seconds)
-                if not recording.detection_time or is_exceeded:
-                    self.services.run_coro(self.check_if_live(recording))
+        """Dispatch live checks for the recordings whose next check deadline has passed."""
+        for _rec_id, recording in self.live_check_scheduler.pop_due():
+            if not recording.monitor_status:
+                continue
+            # Keep the room queued even if the check below returns early (busy recorder, no disk space).
+            self.schedule_live_check(recording)
+            if self.services.recording_enabled and not recording.is_recording:
+                self.services.run_coro(self.check_if_live(recording))
 
     _periodic_task_running = False
 
@@ -230,22 +619,25 @@ class RecordingManager:
     def set_periodic_task_running(cls, value=True):
         cls._periodic_task_running = value
 
+    async def run_live_check_scheduler(self):
+        """Wake up exactly when the next recording is due and dispatch the due checks."""
+        logger.info(f"Starting live check scheduler with {len(self.live_check_scheduler)} queued recordings")
+        while True:
+            await self.live_check_scheduler.wait_until_due()
+            try:
+                await self.check_all_live_status()
+            except Exception as e:
+                logger.error(f"Live check scheduler tick failed: {e}")
+
     async def setup_periodic_live_check(self, interval: int = 180):
-        """Set up a periodic task to check live status."""
+        """Set up the live check scheduler and the periodic free space check."""
 
         async def periodic_check():
             logger.info("Starting periodic live check background task")
+            asyncio.create_task(self.run_live_check_scheduler())
             while True:
-                immediate_check_on_startup = self.services.settings_config.user_config.get(
-                    "check_live_on_browser_refresh", True
-                )
-                if immediate_check_on_startup:
-                    await asyncio.sleep(interval)
                 await self.check_free_space()
-                if self.services.recording_enabled:
-                    await self.check_all_live_status()
-                if not immediate_check_on_startup:
-                    await asyncio.sleep(interval)
+                await asyncio.sleep(interval)
 
         if not RecordingManager.is_periodic_task_running():
             RecordingManager.set_periodic_task_running(True)
@@ -257,7 +649,10 @@ class RecordingManager:
 
     async def check_if_live(self, recording: Recording):
         """Check if the live stream is available, fetch stream data and update is_live status."""
+        # Overlapping triggers (card creation, the scheduler, a manual toggle) share one running check.
+        await self.live_check_flights.do(recording.rec_id, lambda: self._check_if_live(recording))
 
+    async def _check_if_live(self, recording: Recording):
         recording.manually_stopped = False
         if recording.is_recording or recording.stopping_in_progress:
             logger.debug(f"Skip check_if_live because recording is busy: {recording.url}")
@@ -271,11 +666,13 @@ class RecordingManager:
             recording.display_title = f"[{self._['monitor_stopped']}] {recording.title}"
             recording.status_info = RecordingStatus.STOPPED_MONITORING
             recording.is_checking = False
+            self.live_check_scheduler.unschedule(recording.rec_id)
             self.services.broadcast_card_update(recording)
             return
 
-        recording.detection_time = datetime.now().time()
+        recording.detection_time = datetime.now()
         recording.is_checking = True
+        self.schedule_live_check(recording)
 
         if not recording.showed_checking_status:
             recording.status_info = RecordingStatus.STATUS_CHECKING
@@ -298,51 +695,74 @@ class RecordingManager:
                 recording.is_live = False
                 recording.is_checking = False
                 logger.info(f"Skip Detection: {recording.url} not in scheduled check range {scheduled_time_range_list}")
+                if scheduled_time_range_list:
+                    next_window_delay = min(
+                        utils.get_seconds_until_time_range_start(time_range) for time_range in scheduled_time_range_list
+                    )
+                    self.live_check_scheduler.schedule_wall_clock(recording.rec_id, next_window_delay, recording)
                 self.services.broadcast_card_update(recording)
                 return
 
-        recording.status_info = RecordingStatus.STATUS_CHECKING
-        platform, platform_key = get_platform_info(recording.url)
-
-        if platform and platform_key and (recording.platform is None or recording.platform_key is None):
-            recording.platform = platform
-            recording.platform_key = platform_key
-            self.services.run_coro(self.persist_recordings())
-
-        if self.settings.user_config.get("language") != "zh_CN":
-            platform = platform_key
-
-        output_dir = self.settings.get_video_save_path()
-        await self.check_free_space(output_dir)
+        await self.check_free_space(self.settings.get_video_save_path())
         if not self.services.recording_enabled:
             recording.is_checking = False
             recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
             return
-        recording_info = {
-            "platform": platform,
-            "platform_key": platform_key,
-            "live_url": recording.url,
-            "output_dir": output_dir,
-            "segment_record": recording.segment_record,
-            "segment_time": recording.segment_time,
-            "save_format": recording.record_format,
-            "quality": recording.quality,
-            "video_bitrate": recording.video_bitrate,
-        }
 
-        semaphore = self.platform_semaphores[platform_key]
-        recorder = LiveStreamRecorder(self.services, recording, recording_info)
-        async with semaphore:
-            stream_info = await recorder.fetch_stream()
-            logger.info(f"Stream Data: {stream_info}")
+        platform, platform_key = get_platform_info(recording.url)
+        breaker = self.circuit_breakers.get(platform_key)
+        if not breaker.allow_request():
+            retry_after = breaker.get_retry_after()
+            logger.debug(f"Defer live check for {retry_after:.0f}s, platform {platform_key} is unavailable")
+            recording.is_checking = False
+            self.live_check_scheduler.schedule(recording.rec_id, retry_after, recording)
+            return
+
+        # From here on the check may hold the half-open probe, which has to be given back if it ends early.
+        try:
+            recording.status_info = RecordingStatus.STATUS_CHECKING
+
+            if platform and platform_key and (recording.platform is None or recording.platform_key is None):
+                recording.platform = platform
+                recording.platform_key = platform_key
+                self.services.run_coro(self.persist_recordings())
+
+            recording_info = self.get_recording_info(recording)
+            limiter = self.rate_limiter.get(platform_key)
+            recorder = LiveStreamRecorder(self.services, recording, recording_info)
+
+            async def fetch_stream_info():
+                async with limiter.acquire():
+                    _stream_info = await recorder.fetch_stream()
+                    logger.info(f"Stream Data: {_stream_info}")
+                return _stream_info, recorder.fetch_error
+
+            # Rooms sharing a URL and quality share one in-flight request and its result.
+            fetch_key = (normalize_room_url(recording.url), recording.quality)
+            (stream_info, fetch_error), is_fetcher = await self.stream_info_flights.do(fetch_key, fetch_stream_info)
+        except BaseException:
+            breaker.release_probe()
+            raise
+        if is_fetcher:
+            limiter.report_result(fetch_error)
+        else:
+            logger.debug(f"Reuse stream data fetched for the same room: {recording.url}")
+        # Each check gets its own copy, it is modified below.
+        stream_info = copy.copy(stream_info) if stream_info else stream_info
         if not stream_info or not stream_info.anchor_name:
+            if is_fetcher:
+                breaker.record_failure()
+            else:
+                breaker.release_probe()
             logger.error(f"Fetch stream data failed: {recording.url}")
+            self.record_check_failure(recording)
             recording.is_checking = False
             recording.status_info = RecordingStatus.LIVE_STATUS_CHECK_ERROR
             if recording.monitor_status:
                 self.services.broadcast_card_update(recording)
-                self.services.broadcast_pubsub("update", recording)
             return
+        breaker.record_success()
+        self.reset_check_failures(recording)
         if self.settings.user_config.get("remove_emojis"):
             stream_info.anchor_name = utils.clean_name(stream_info.anchor_name, self._["live_room"])
 
@@ -355,6 +775,7 @@ class RecordingManager:
 
             if not recording.is_live:
                 recording.is_live = stream_info.is_live
+                self.live_history.record_live_start(recording.rec_id)
                 recording.notified_live_start = False
                 recording.notified_live_end = False
 
@@ -400,6 +821,7 @@ class RecordingManager:
                     recording.loop_time_seconds = int(notify_loop_time or 600)
                 else:
                     recording.loop_time_seconds = self.loop_time_seconds
+                self.schedule_live_check(recording)
 
                 recording.cumulative_duration = timedelta()
                 recording.last_duration = timedelta()
@@ -409,6 +831,7 @@ class RecordingManager:
             recording.is_recording = False
             if recording.is_live:
                 recording.is_live = False
+                self.live_history.record_live_end(recording.rec_id)
                 asyncio.create_task(recorder.end_message_push())
 
             recording.status_info = RecordingStatus.MONITORING
@@ -425,9 +848,25 @@ class RecordingManager:
 
         recording.is_checking = False
         self.services.broadcast_card_update(recording)
-        self.services.broadcast_pubsub("update", recording)
         return
 
+    def get_recording_info(self, recording: Recording) -> dict:
+        """Recorder settings of a recording, as passed to ``LiveStreamRecorder``."""
+        platform, platform_key = get_platform_info(recording.url)
+        if self.settings.user_config.get("language") != "zh_CN":
+            platform = platform_key
+        return {
+            "platform": platform,
+            "platform_key": platform_key,
+            "live_url": recording.url,
+            "output_dir": self.settings.get_video_save_path(),
+            "segment_record": recording.segment_record,
+            "segment_time": recording.segment_time,
+            "save_format": recording.record_format,
+            "quality": recording.quality,
+            "video_bitrate": recording.video_bitrate,
+        }
+
     @staticmethod
     def start_update(recording: Recording):
         """Start the recording process."""
@@ -0,0 +1,238 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+
+from ...utils.logger import logger
+
+STORAGE_JSON = "json"
+STORAGE_SQLITE = "sqlite"
+# Whitespace and the comma between two elements of the recordings array.
+_JSON_SEPARATOR = re.compile(r"\s*,?\s*")
+
+
+class JsonRecordingStorage:
+    """Recordings stored as one JSON array in ``recordings.json``; every save rewrites the whole file."""
+
+    def __init__(self, config_manager):
+        self.config_manager = config_manager
+
+    def load(self) -> list[dict]:
+        data = self.config_manager.load_recordings_config()
+        return data if isinstance(data, list) else []
+
+    def iter_records(self) -> Iterator[dict]:
+        """Yield the recordings one by one, decoding the JSON array incrementally."""
+        path = self.config_manager.recordings_config_path
+        try:
+            with open(path, encoding="utf-8") as file:
+                text = file.read()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"An error occurred while loading recordings config: {e}")
+            return
+
+        index = _JSON_SEPARATOR.match(text).end()
+        if not text.startswith("[", index):
+            # Not an array (e.g. the initial empty object), nothing to load.
+            return
+        decoder = json.JSONDecoder()
+        index += 1
+        while True:
+            index = _JSON_SEPARATOR.match(text, index).end()
+            if index >= len(text) or text[index] == "]":
+                return
+            try:
+                record, index = decoder.raw_decode(text, index)
+            except json.JSONDecodeError:
+                logger.error(f"Invalid JSON format in file: {path}")
+                return
+            if isinstance(record, dict):
+                yield record
+
+    def save(self, records: list[dict]) -> None:
+        self.config_manager.save_recordings_config_sync(records)
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteRecordingStorage:
+    """
+    Recordings stored one row per recording in ``recordings.db``.
+
+    ``save_rows`` upserts the rows of the recordings that changed and deletes the rows of removed ones,
+    leaving every other row alone. ``save`` takes the full list like the JSON storage and is only used for
+    full rewrites. On first use an existing ``recordings.json`` is imported once; ``export_json`` writes the
+    rows back in the JSON format.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS recordings (
+            rec_id TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            url TEXT,
+            platform_key TEXT,
+            monitor_status INTEGER,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_recordings_url ON recordings (url);
+        CREATE INDEX IF NOT EXISTS idx_recordings_platform_key ON recordings (platform_key);
+        CREATE INDEX IF NOT EXISTS idx_recordings_monitor_status ON recordings (monitor_status);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, config_manager, db_path: str | None = None, migrate: bool = True):
+        self.config_manager = config_manager
+        self.db_path = db_path or config_manager.recordings_db_path
+        self._lock = threading.Lock()
+        # Serialized row data and position by rec_id, as last written.
+        self._rows: dict[str, tuple[str, int]] = {}
+        self._next_position = 0
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        if migrate:
+            self.migrate_from_json()
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _get_json_mtime(self) -> str:
+        path = self.config_manager.recordings_config_path
+        return str(os.path.getmtime(path)) if os.path.exists(path) else ""
+
+    def migrate_from_json(self) -> None:
+        """
+        Import ``recordings.json`` if it changed since it was last imported or exported, that is on first
+        use and after the app ran with the JSON storage in between.
+        """
+        json_mtime = self._get_json_mtime()
+        with self._lock:
+            if not json_mtime or self._get_meta("json_mtime") == json_mtime:
+                return
+            data = self.config_manager.load_recordings_config()
+            records = data if isinstance(data, list) else []
+            with self._conn:
+                self._conn.execute("DELETE FROM recordings")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?, ?, ?)",
+                    [self._to_row(record, position) for position, record in enumerate(records)],
+                )
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('json_mtime', ?)", (json_mtime,))
+        logger.info(f"Imported {len(records)} recordings from recordings.json into {self.db_path}")
+
+    @staticmethod
+    def _serialize(record: dict) -> str:
+        return json.dumps(record, ensure_ascii=False, sort_keys=True)
+
+    def _to_row(self, record: dict, position: int) -> tuple:
+        return (
+            record["rec_id"],
+            position,
+            record.get("url"),
+            record.get("platform_key"),
+            int(bool(record.get("monitor_status"))),
+            self._serialize(record),
+        )
+
+    def iter_records(self) -> Iterator[dict]:
+        """Yield the recordings in order, decoding each row only when it is consumed."""
+        with self._lock:
+            rows = self._conn.execute("SELECT rec_id, position, data FROM recordings ORDER BY position").fetchall()
+            self._rows.clear()
+            self._next_position = rows[-1][1] + 1 if rows else 0
+        for rec_id, position, data in rows:
+            try:
+                record = json.loads(data)
+            except json.JSONDecodeError:
+                logger.error(f"Invalid recording row in {self.db_path}: {rec_id}")
+                continue
+            with self._lock:
+                self._rows[rec_id] = (data, position)
+            yield record
+
+    def load(self) -> list[dict]:
+        return list(self.iter_records())
+
+    def save(self, records: list[dict]) -> None:
+        """Rewrite the table to hold exactly ``records``; unchanged rows are still skipped."""
+        with self._lock:
+            removed = self._rows.keys() - {record["rec_id"] for record in records}
+        self.save_rows(records, removed)
+
+    def save_rows(self, records: list[dict], removed: Iterable[str] = ()) -> None:
+        """Upsert the rows of ``records`` and delete the rows of the ``removed`` rec_ids."""
+        with self._lock:
+            changed = []
+            rows = {}
+            next_position = self._next_position
+            for record in records:
+                rec_id = record["rec_id"]
+                data = self._serialize(record)
+                previous = rows.get(rec_id) or self._rows.get(rec_id)
+                if previous is None:
+                    position = next_position
+                    next_position += 1
+                else:
+                    position = previous[1]
+                    if previous[0] == data:
+                        continue
+                rows[rec_id] = (data, position)
+                changed.append(self._to_row(record, position))
+            removed = [(rec_id,) for rec_id in removed if rec_id in self._rows and rec_id not in rows]
+            if not changed and not removed:
+                return
+
+            with self._conn:
+                if removed:
+                    self._conn.executemany("DELETE FROM recordings WHERE rec_id = ?", removed)
+                if changed:
+                    self._conn.executemany("INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?, ?, ?)", changed)
+            for (rec_id,) in removed:
+                del self._rows[rec_id]
+            self._rows.update(rows)
+            self._next_position = next_position
+        logger.debug(f"Recordings database: {len(changed)} rows written, {len(removed)} rows deleted")
+
+    def export_json(self, path: str | None = None) -> str:
+        """Write all rows to ``path`` (``recordings.json`` by default) in the JSON storage format."""
+        path = path or self.config_manager.recordings_config_path
+        records = self.load()
+        content = json.dumps(records, ensure_ascii=False, indent=4)
+        self.config_manager._write_config_sync(path, content)
+        if path == self.config_manager.recordings_config_path:
+            with self._lock, self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('json_mtime', ?)", (self._get_json_mtime(),))
+        logger.info(f"Exported {len(records)} recordings to {path}")
+        return path
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_recording_storage(config_manager, backend: str | None):
+    """Create the storage configured by the ``recordings_storage`` setting, falling back to JSON."""
+    if (backend or STORAGE_JSON).lower() == STORAGE_SQLITE:
+        try:
+            return SQLiteRecordingStorage(config_manager)
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Failed to open recordings database, falling back to recordings.json: {e}")
+    db_files = [config_manager.recordings_db_path, config_manager.recordings_db_path + "-wal"]
+    db_mtime = max((os.path.getmtime(path) for path in db_files if os.path.exists(path)), default=0)
+    json_path = config_manager.recordings_config_path
+    if db_mtime and (not os.path.exists(json_path) or db_mtime > os.path.getmtime(json_path)):
+        # Switched back from SQLite: bring recordings.json up to date before using it.
+        try:
+            storage = SQLiteRecordingStorage(config_manager, migrate=False)
+            storage.export_json()
+            storage.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Failed to export recordings database to recordings.json: {e}")
+    return JsonRecordingStorage(config_manager)
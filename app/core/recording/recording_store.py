@@ -0,0 +1,185 @@
+import threading
+from collections.abc import Iterable
+
+from ...models.recording.recording_model import Recording
+from ...ui.filters.recording_filters import RecordingFilters
+from ..scheduling.single_flight import normalize_room_url
+
+
+def get_status_buckets(recording: Recording) -> frozenset[str]:
+    """Status filters of the recordings page that a recording passes, using the predicates of the filters."""
+    return frozenset(
+        bucket
+        for bucket, matches in RecordingFilters.STATUS_FILTER_MAP.items()
+        if bucket != "all" and matches(recording)
+    )
+
+
+class RecordingStore:
+    """
+    Ordered collection of recordings with indexes by ``rec_id``, URL, platform and status.
+
+    Recordings are kept in an insertion-ordered dict, so lookups, additions and removals are O(1).
+    Status and selection are derived from mutable attributes; a recording calls ``reindex`` on its store
+    whenever one of its indexed fields changes.
+
+    Readers get copy-on-write snapshots: ``to_list`` returns an immutable tuple that is replaced, never
+    modified, by later writes, and index lookups return copies. The internal lock is only held for the
+    in-memory update itself, so the store is safe to use from any thread or event loop.
+    """
+
+    def __init__(self, recordings: Iterable[Recording] = ()):
+        self._by_id: dict[str, Recording] = {}
+        self._by_url: dict[str, dict[str, Recording]] = {}
+        self._by_platform: dict[str, dict[str, Recording]] = {}
+        self._by_status: dict[str, dict[str, Recording]] = {}
+        self._selected: dict[str, Recording] = {}
+        # Recordings with persistent changes not picked up by ``pop_persist_dirty`` yet.
+        self._persist_dirty: dict[str, Recording] = {}
+        # Index keys each recording is currently filed under: (url, platform_key, status buckets).
+        self._keys: dict[str, tuple[str, str | None, frozenset[str]]] = {}
+        self._snapshot: tuple[Recording, ...] | None = None
+        self._lock = threading.RLock()
+        for recording in recordings:
+            self.add(recording)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __contains__(self, recording: Recording) -> bool:
+        return self._by_id.get(getattr(recording, "rec_id", None)) is recording
+
+    def to_list(self) -> tuple[Recording, ...]:
+        """Snapshot of the recordings in insertion order, shared by readers until the next addition or removal."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self._by_id.values())
+        return snapshot
+
+    @staticmethod
+    def _index_add(index: dict[str, dict[str, Recording]], key, recording: Recording) -> None:
+        index.setdefault(key, {})[recording.rec_id] = recording
+
+    @staticmethod
+    def _index_remove(index: dict[str, dict[str, Recording]], key, rec_id: str) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(rec_id, None)
+            if not bucket:
+                del index[key]
+
+    def _file(self, recording: Recording) -> None:
+        keys = (normalize_room_url(recording.url), recording.platform_key, get_status_buckets(recording))
+        self._keys[recording.rec_id] = keys
+        self._index_add(self._by_url, keys[0], recording)
+        self._index_add(self._by_platform, keys[1], recording)
+        for bucket in keys[2]:
+            self._index_add(self._by_status, bucket, recording)
+        if recording.selected:
+            self._selected[recording.rec_id] = recording
+
+    def _unfile(self, rec_id: str) -> None:
+        keys = self._keys.pop(rec_id, None)
+        if keys is None:
+            return
+        self._index_remove(self._by_url, keys[0], rec_id)
+        self._index_remove(self._by_platform, keys[1], rec_id)
+        for bucket in keys[2]:
+            self._index_remove(self._by_status, bucket, rec_id)
+        self._selected.pop(rec_id, None)
+
+    def add(self, recording: Recording) -> None:
+        with self._lock:
+            previous = self._by_id.get(recording.rec_id)
+            if previous is not None:
+                self._unfile(recording.rec_id)
+                previous._store = None
+            self._by_id[recording.rec_id] = recording
+            self._file(recording)
+            recording._store = self
+            if recording.is_persist_dirty:
+                self._persist_dirty[recording.rec_id] = recording
+            self._snapshot = None
+
+    def remove(self, recording: Recording) -> bool:
+        with self._lock:
+            if self._by_id.get(recording.rec_id) is not recording:
+                return False
+            del self._by_id[recording.rec_id]
+            self._unfile(recording.rec_id)
+            self._persist_dirty.pop(recording.rec_id, None)
+            recording._store = None
+            self._snapshot = None
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            for recording in self._by_id.values():
+                recording._store = None
+            self._by_id.clear()
+            self._by_url.clear()
+            self._by_platform.clear()
+            self._by_status.clear()
+            self._selected.clear()
+            self._keys.clear()
+            self._persist_dirty.clear()
+            self._snapshot = None
+
+    def reindex(self, recording: Recording) -> None:
+        """Refile a recording after one of its indexed fields changed."""
+        with self._lock:
+            if self._by_id.get(recording.rec_id) is not recording:
+                return
+            self._unfile(recording.rec_id)
+            self._file(recording)
+
+    def mark_persist_dirty(self, recording: Recording) -> None:
+        with self._lock:
+            if self._by_id.get(recording.rec_id) is recording:
+                self._persist_dirty[recording.rec_id] = recording
+
+    def pop_persist_dirty(self) -> list[Recording]:
+        """Return and reset the recordings whose persistent fields changed since the last call."""
+        with self._lock:
+            dirty, self._persist_dirty = self._persist_dirty, {}
+        return list(dirty.values())
+
+    def get(self, rec_id: str) -> Recording | None:
+        return self._by_id.get(rec_id)
+
+    def get_by_url(self, url: str) -> list[Recording]:
+        key = normalize_room_url(url)
+        with self._lock:
+            return list(self._by_url.get(key, {}).values())
+
+    def get_by_platform(self, platform_key: str | None) -> list[Recording]:
+        with self._lock:
+            return list(self._by_platform.get(platform_key, {}).values())
+
+    def get_by_status(self, bucket: str) -> list[Recording]:
+        with self._lock:
+            return list(self._by_status.get(bucket, {}).values())
+
+    def count_by_status(self, bucket: str) -> int:
+        return len(self._by_status.get(bucket, ()))
+
+    def get_selected(self) -> list[Recording]:
+        with self._lock:
+            selected = list(self._selected.values())
+        return [recording for recording in selected if recording.selected]
+
+    def get_platform_names(self) -> dict[str, str]:
+        """Platform display names by ``platform_key`` of the platforms that have recordings."""
+        names = {}
+        with self._lock:
+            for platform_key, bucket in self._by_platform.items():
+                platform = next((rec.platform for rec in bucket.values() if rec.platform), None)
+                if platform_key and platform:
+                    names[platform_key] = platform
+        return names
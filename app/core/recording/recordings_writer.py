@@ -0,0 +1,154 @@
+import atexit
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ...utils.logger import logger
+
+DEFAULT_WRITE_WINDOW_SECONDS = 2.0
+
+
+@dataclass
+class WriterStats:
+    requests: int = 0
+    writes: int = 0
+    failed_writes: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def coalesced(self) -> int:
+        return max(0, self.requests - self.writes - self.failed_writes)
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.writes if self.writes else 0.0
+
+
+class DebouncedWriter:
+    """
+    Coalescing writer for a persisted state, such as the recordings or the live history.
+
+    ``mark_dirty`` only flags the state as changed and arms a timer; when the window elapses the
+    current state is snapshotted and written once, no matter how many changes came in meanwhile. The
+    window starts at the first change, so a steady stream of changes still results in one write per
+    window. ``flush`` writes pending changes immediately and is called on shutdown. ``name`` labels the
+    log lines of the writer.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        snapshot: Callable[[], Any],
+        write: Callable[[Any], None],
+        get_window: Callable[[], float] | None = None,
+    ):
+        self.snapshot = snapshot
+        self.write = write
+        self.get_window = get_window or (lambda: DEFAULT_WRITE_WINDOW_SECONDS)
+        self.name = name
+        self.stats = WriterStats()
+        self._dirty = False
+        self._closed = False
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        # Serializes snapshot + write so an older snapshot never overwrites a newer one.
+        self._write_lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def _get_window(self) -> float:
+        try:
+            return max(0.0, float(self.get_window()))
+        except (TypeError, ValueError):
+            return DEFAULT_WRITE_WINDOW_SECONDS
+
+    def mark_dirty(self) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self._dirty = True
+            if self._closed:
+                write_now = True
+            elif self._timer is None:
+                window = self._get_window()
+                write_now = window <= 0
+                if not write_now:
+                    self._timer = threading.Timer(window, self._on_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+            else:
+                write_now = False
+        if write_now:
+            self.flush()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self) -> bool:
+        """Write pending changes now; returns whether a write happened."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return False
+                self._dirty = False
+
+            started = time.perf_counter()
+            try:
+                self.write(self.snapshot())
+            except Exception as e:
+                with self._lock:
+                    self._dirty = True
+                    self.stats.failed_writes += 1
+                logger.error(f"An error occurred while writing {self.name}: {e}")
+                return False
+
+            latency = time.perf_counter() - started
+            with self._lock:
+                stats = self.stats
+                stats.writes += 1
+                stats.last_latency = latency
+                stats.max_latency = max(stats.max_latency, latency)
+                stats.total_latency += latency
+            logger.debug(
+                f"{self.name.capitalize()} written in {latency * 1000:.1f}ms "
+                f"({stats.coalesced} changes coalesced so far)"
+            )
+            return True
+
+    def shutdown(self) -> None:
+        """Flush pending changes and write every later change immediately."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.flush()
+        stats = self.stats
+        logger.info(
+            f"{self.name.capitalize()} writer: {stats.requests} save requests, {stats.writes} writes, "
+            f"avg {stats.avg_latency * 1000:.1f}ms, max {stats.max_latency * 1000:.1f}ms"
+        )
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = self.stats
+            return {
+                "requests": stats.requests,
+                "writes": stats.writes,
+                "failed_writes": stats.failed_writes,
+                "coalesced": stats.coalesced,
+                "pending": self._dirty,
+                "last_latency": stats.last_latency,
+                "avg_latency": stats.avg_latency,
+                "max_latency": stats.max_latency,
+            }
@@ -0,0 +1,313 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+
+from ...utils.logger import logger
+
+# Interval at which a running session's bytes, segments and output files are written.
+SESSION_UPDATE_INTERVAL_SECONDS = 30
+FAILURE_INTERRUPTED = "interrupted"
+FAILURE_STALLED = "stalled"
+
+
+@dataclass
+class RecordingSession:
+    id: int
+    rec_id: str
+    streamer_name: str | None
+    platform: str | None
+    platform_key: str | None
+    url: str | None
+    started_at: float
+    ended_at: float | None = None
+    bytes: int = 0
+    segments: int = 0
+    output_paths: list[str] = field(default_factory=list)
+    exit_code: int | None = None
+    failure_reason: str | None = None
+    # Session this one took over from through a hand-off restart, and the seconds both outputs contain.
+    handoff_from: int | None = None
+    overlap_seconds: float = 0.0
+    # Seconds without data when the session was stopped as stalled, including the restart until data came back.
+    stall_seconds: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return (self.ended_at or time.time()) - self.started_at
+
+    @property
+    def is_running(self) -> bool:
+        return self.ended_at is None
+
+
+@dataclass
+class StallStats:
+    stall_count: int = 0
+    time_lost: float = 0.0
+    last_stall_at: float | None = None
+
+
+def collect_output_files(save_path: str, known: list[str] | None = None) -> list[str]:
+    """
+    Output files of a recording, without listing its directory.
+
+    Segmented recordings use a ``%03d`` pattern in ``save_path``; segments are numbered consecutively, so
+    only the indexes after the ``known`` ones are probed.
+    """
+    if "%" not in os.path.basename(save_path):
+        return [save_path] if os.path.exists(save_path) else []
+    paths = list(known or [])
+    index = len(paths)
+    while True:
+        try:
+            path = save_path % index
+        except (TypeError, ValueError):
+            return paths
+        if not os.path.exists(path):
+            return paths
+        paths.append(path)
+        index += 1
+
+
+def resolve_output_path(path: str) -> str | None:
+    """Existing file for a recorded output path, following a later conversion to mp4."""
+    if os.path.exists(path):
+        return path
+    converted = os.path.splitext(path)[0] + ".mp4"
+    return converted if os.path.exists(converted) else None
+
+
+class SessionHistory:
+    """
+    One row per recording session in ``sessions.db``.
+
+    Recorders open a row when ffmpeg or the direct downloader starts, update bytes, segments and output
+    files while recording and close it with the exit code and failure reason. The indexes by streamer,
+    platform and start time serve the recording card and the storage page without walking the file system.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            rec_id TEXT NOT NULL,
+            streamer_name TEXT,
+            platform TEXT,
+            platform_key TEXT,
+            url TEXT,
+            started_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            ended_at REAL,
+            bytes INTEGER NOT NULL DEFAULT 0,
+            segments INTEGER NOT NULL DEFAULT 0,
+            output_paths TEXT NOT NULL DEFAULT '[]',
+            exit_code INTEGER,
+            failure_reason TEXT,
+            handoff_from INTEGER,
+            overlap_seconds REAL NOT NULL DEFAULT 0,
+            stall_seconds REAL NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_sessions_rec_id ON sessions (rec_id, started_at);
+        CREATE INDEX IF NOT EXISTS idx_sessions_streamer ON sessions (streamer_name, started_at);
+        CREATE INDEX IF NOT EXISTS idx_sessions_platform_key ON sessions (platform_key, started_at);
+        CREATE INDEX IF NOT EXISTS idx_sessions_started_at ON sessions (started_at);
+    """
+    COLUMNS = (
+        "id, rec_id, streamer_name, platform, platform_key, url, started_at, ended_at, "
+        "bytes, segments, output_paths, exit_code, failure_reason, handoff_from, overlap_seconds, stall_seconds"
+    )
+
+    def __init__(self, config_manager, db_path: str | None = None):
+        self.db_path = db_path or config_manager.sessions_db_path
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            self._close_interrupted_sessions()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open session history database, sessions will not be recorded: {e}")
+            self._conn = None
+
+    def _write(self, sql: str, params: tuple = ()) -> int | None:
+        """Run a write statement, returning the id of the inserted row."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock, self._conn:
+                return self._conn.execute(sql, params).lastrowid
+        except sqlite3.Error as e:
+            logger.error(f"Session history database error: {e}")
+            return None
+
+    def _read(self, sql: str, params: tuple = ()) -> list[tuple]:
+        if self._conn is None:
+            return []
+        try:
+            with self._lock:
+                return self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Session history database error: {e}")
+            return []
+
+    def _close_interrupted_sessions(self) -> None:
+        """Sessions still open from a previous run ended at their last update."""
+        with self._conn:
+            cursor = self._conn.execute(
+                "UPDATE sessions SET ended_at = updated_at, failure_reason = COALESCE(failure_reason, ?) "
+                "WHERE ended_at IS NULL",
+                (FAILURE_INTERRUPTED,),
+            )
+        if cursor.rowcount:
+            logger.info(f"Session History: Closed {cursor.rowcount} sessions interrupted by the last shutdown")
+
+    def start_session(self, recording, output_paths: list[str] | None = None) -> int | None:
+        now = time.time()
+        return self._write(
+            "INSERT INTO sessions (rec_id, streamer_name, platform, platform_key, url, started_at, updated_at, "
+            "output_paths) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                recording.rec_id,
+                recording.streamer_name,
+                recording.platform,
+                recording.platform_key,
+                recording.url,
+                now,
+                now,
+                json.dumps(output_paths or [], ensure_ascii=False),
+            ),
+        )
+
+    def update_session(self, session_id: int | None, total_bytes: int, output_paths: list[str]) -> None:
+        if session_id is None:
+            return
+        self._write(
+            "UPDATE sessions SET updated_at = ?, bytes = ?, segments = ?, output_paths = ? WHERE id = ?",
+            (time.time(), total_bytes, len(output_paths), json.dumps(output_paths, ensure_ascii=False), session_id),
+        )
+
+    def end_session(
+        self,
+        session_id: int | None,
+        total_bytes: int,
+        output_paths: list[str],
+        exit_code: int | None = None,
+        failure_reason: str | None = None,
+    ) -> None:
+        if session_id is None:
+            return
+        now = time.time()
+        self._write(
+            "UPDATE sessions SET updated_at = ?, ended_at = ?, bytes = ?, segments = ?, output_paths = ?, "
+            "exit_code = ?, failure_reason = ? WHERE id = ?",
+            (
+                now,
+                now,
+                total_bytes,
+                len(output_paths),
+                json.dumps(output_paths, ensure_ascii=False),
+                exit_code,
+                failure_reason,
+                session_id,
+            ),
+        )
+
+    def mark_handoff(self, session_id: int | None, previous_session_id: int | None, overlap_seconds: float) -> None:
+        """Record that a session took over from ``previous_session_id``, overlapping it by ``overlap_seconds``."""
+        if session_id is None or previous_session_id is None:
+            return
+        self._write(
+            "UPDATE sessions SET handoff_from = ?, overlap_seconds = ? WHERE id = ?",
+            (previous_session_id, max(0.0, overlap_seconds), session_id),
+        )
+
+    def add_stall_time(self, session_id: int | None, seconds: float) -> None:
+        """Add ``seconds`` without data to a session stopped by the stall watchdog."""
+        if session_id is None:
+            return
+        self._write(
+            "UPDATE sessions SET stall_seconds = stall_seconds + ? WHERE id = ?", (max(0.0, seconds), session_id)
+        )
+
+    def get_stall_stats(self, rec_id: str) -> StallStats | None:
+        """Stalls of a recording over its whole session history, None when it never stalled."""
+        rows = self._read(
+            "SELECT COUNT(*), COALESCE(SUM(stall_seconds), 0), MAX(ended_at) FROM sessions "
+            "WHERE rec_id = ? AND failure_reason = ?",
+            (rec_id, FAILURE_STALLED),
+        )
+        if not rows or not rows[0][0]:
+            return None
+        return StallStats(*rows[0])
+
+    def query(
+        self,
+        rec_id: str | None = None,
+        streamer_name: str | None = None,
+        platform_key: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+    ) -> list[RecordingSession]:
+        """Sessions matching all given filters, newest first. ``since``/``until`` bound the start time."""
+        conditions, params = [], []
+        for column, value in (("rec_id", rec_id), ("streamer_name", streamer_name), ("platform_key", platform_key)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("started_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("started_at < ?")
+            params.append(until)
+        sql = f"SELECT {self.COLUMNS} FROM sessions"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY started_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._to_session(row) for row in self._read(sql, tuple(params))]
+
+    def count(self, rec_id: str) -> int:
+        rows = self._read("SELECT COUNT(*) FROM sessions WHERE rec_id = ?", (rec_id,))
+        return rows[0][0] if rows else 0
+
+    def get_streamer_names(self) -> list[str]:
+        rows = self._read(
+            "SELECT DISTINCT streamer_name FROM sessions WHERE streamer_name IS NOT NULL ORDER BY streamer_name"
+        )
+        return [row[0] for row in rows]
+
+    def get_platform_names(self) -> dict[str, str]:
+        """Platform display names by ``platform_key`` of the platforms that have sessions."""
+        rows = self._read("SELECT platform_key, MAX(platform) FROM sessions WHERE platform_key IS NOT NULL GROUP BY 1")
+        return {platform_key: platform or platform_key for platform_key, platform in rows}
+
+    def get_latest_output(self, rec_id: str) -> str | None:
+        """Most recent existing output file of a recording."""
+        for session in self.query(rec_id=rec_id, limit=5):
+            for path in reversed(session.output_paths):
+                resolved = resolve_output_path(path)
+                if resolved:
+                    return resolved
+        return None
+
+    @staticmethod
+    def _to_session(row: tuple) -> RecordingSession:
+        try:
+            output_paths = json.loads(row[10])
+        except (TypeError, json.JSONDecodeError):
+            output_paths = []
+        return RecordingSession(*row[:10], output_paths, *row[11:])
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+
+from ...utils.logger import logger
+from .session_history import StallStats
+
+DEFAULT_STALL_TIMEOUT_SECONDS = 60
+STALL_CHECK_INTERVAL_SECONDS = 5
+
+
+class StallWatchdog:
+    """
+    Restart recorders whose output stops growing.
+
+    A single periodic check looks at the bytes written by every active recorder, taken from the ffmpeg
+    progress stream, the direct downloader or the size of the output files. A recorder that writes
+    nothing for ``stall_timeout_seconds`` (0 disables the watchdog) is stopped and the room is checked
+    again with freshly fetched stream data, instead of waiting for ffmpeg's read timeout or forever.
+
+    The time lost is added to the stalled session in the session history: the seconds from the last
+    progress until the stall was detected, plus the time the restarted recorder needed to write again.
+    """
+
+    def __init__(self, recording_manager, user_config: dict):
+        self.recording_manager = recording_manager
+        self.user_config = user_config
+        # rec_id -> (recorder, bytes written, monotonic time the byte count last changed)
+        self._progress: dict[str, tuple[object, int, float]] = {}
+        # rec_id -> (monotonic time of the restart, id of the stalled session), until the new recorder writes data
+        self._restarting: dict[str, tuple[float, int | None]] = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def get_timeout(self) -> float:
+        try:
+            return max(0.0, float(self.user_config.get("stall_timeout_seconds", DEFAULT_STALL_TIMEOUT_SECONDS)))
+        except (TypeError, ValueError):
+            return DEFAULT_STALL_TIMEOUT_SECONDS
+
+    def get_stats(self, rec_id: str) -> StallStats | None:
+        """Stalls of a recording from the session history; this queries the database."""
+        return self.recording_manager.session_history.get_stall_stats(rec_id)
+
+    async def run(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        while True:
+            await asyncio.sleep(STALL_CHECK_INTERVAL_SECONDS)
+            try:
+                for recorder in await asyncio.to_thread(self.check):
+                    recorder.restart_stalled()
+            except Exception as e:
+                logger.error(f"Stall watchdog check failed: {e}")
+
+    def check(self, now: float | None = None) -> list:
+        """Update the progress of the active recorders and return the ones that stalled."""
+        now = time.monotonic() if now is None else now
+        timeout = self.get_timeout()
+        active = dict(self.recording_manager.active_recorders)
+        stalled = []
+        with self._lock:
+            for rec_id in self._progress.keys() - active.keys():
+                del self._progress[rec_id]
+            if not timeout:
+                self._progress.clear()
+                return stalled
+
+        session_history = self.recording_manager.session_history
+        for rec_id, recorder in active.items():
+            if recorder.should_stop or recorder.stalled:
+                continue
+            written = recorder.get_bytes_written()
+            restarted = stalled_for = None
+            with self._lock:
+                entry = self._progress.get(rec_id)
+                if entry is None or entry[0] is not recorder or entry[1] != written:
+                    self._progress[rec_id] = (recorder, written, now)
+                    restarted = self._restarting.pop(rec_id, None) if written else None
+                elif now - entry[2] >= timeout:
+                    del self._progress[rec_id]
+                    stalled_for = now - entry[2]
+                    self._restarting[rec_id] = (now, recorder.session_id)
+            if restarted is not None:
+                restarted_at, stalled_session_id = restarted
+                session_history.add_stall_time(stalled_session_id, now - restarted_at)
+            if stalled_for is None:
+                continue
+            session_history.add_stall_time(recorder.session_id, stalled_for)
+            logger.warning(f"Recording stalled, no data for {stalled_for:.0f}s at {written} bytes: {recorder.live_url}")
+            stalled.append(recorder)
+        return stalled
@@ -4,19 +4,25 @@ import shutil
 import subprocess
 import sys
 import time
+import urllib.parse
 from datetime import datetime
 from typing import TypeVar
 
 from ...messages import desktop_notify, message_pusher
+from ...models.media.video_format_model import VideoFormat
 from ...models.media.video_quality_model import VideoQuality
 from ...models.recording.recording_status_model import RecordingStatus
 from ...utils import utils
 from ...utils.logger import logger
 from ..media import ffmpeg_builders
 from ..media.direct_downloader import DirectStreamDownloader
+from ..media.ffmpeg_progress import FFmpegProgress, FFmpegProgressParser, format_size
+from ..media.hls_downloader import HLSStreamDownloader
+from ..media.write_behind import DEFAULT_FLUSH_INTERVAL_SECONDS
 from ..platforms import platform_handlers
 from ..platforms.platform_handlers import StreamData
 from ..runtime.process_manager import BackgroundService
+from .session_history import FAILURE_STALLED, SESSION_UPDATE_INTERVAL_SECONDS, collect_output_files
 
 T = TypeVar("T")
 
@@ -25,6 +31,9 @@ class LiveStreamRecorder:
     DEFAULT_SEGMENT_TIME = "1800"
     DEFAULT_SAVE_FORMAT = "mp4"
     DEFAULT_QUALITY = VideoQuality.OD
+    DEFAULT_SPEED = "X KB/s"
+    # Minimum seconds between two card updates driven by the ffmpeg progress stream.
+    PROGRESS_PUSH_INTERVAL = 3
 
     def __init__(self, services, recording, recording_info):
         self.services = services
@@ -33,6 +42,18 @@ class LiveStreamRecorder:
         self.recording_info = recording_info
         self.subprocess_start_info = services.subprocess_start_up_info
         self.should_stop = False  # manually stopped
+        self.stalled = False  # stopped by the stall watchdog, restarted right away
+        # Monotonic exit time of the previous recorder when started by the reconnect lane, to measure the gap.
+        self.reconnect_gap_from = None
+        # Hand-off restart: the running recorder this one replaces once its output receives data, and the
+        # recorder that replaced this one. A recorder that does not own the recording leaves its state alone.
+        self.handoff_from = None
+        self.handed_off_to = None
+        self.owns_recording = True
+        self.save_file_path = None
+        # Set to wake the supervision of a running recording; see ``wake``.
+        self.wake_event = asyncio.Event()
+        self.supervisor_loop = None
 
         self.user_config = self.settings.user_config
         self.account_config = self.settings.accounts_config
@@ -49,8 +70,16 @@ class LiveStreamRecorder:
         self.save_format = self._get_info("save_format", default=self.DEFAULT_SAVE_FORMAT).lower()
         self.proxy = self.is_use_proxy()
         self.direct_downloader = None
+        # Set when the native HLS engine records an MP4 recording as TS, which is remuxed to MP4 afterwards.
+        self.remux_hls_to_mp4 = False
+        self.fetch_error = None
         self.min_valid_recording_duration = 25
         self.recording_start_time = 0
+        self.session_id = None
+        self.session_outputs = []
+        self.session_started_at = None
+        self.session_updated_at = 0
+        self.progress_pushed_at = 0
         os.makedirs(self.output_dir, exist_ok=True)
         self.services.language_manager.add_observer(self)
         self._ = {}
@@ -160,7 +189,6 @@ class LiveStreamRecorder:
         try:
             self.services.recording_manager.stop_recording(self.recording)
             self.services.broadcast_card_update(self.recording)
-            self.services.broadcast_pubsub("update", self.recording)
             self.services.broadcast_snack(record_name + " " + error_msg, duration=duration)
         except Exception as e:
             logger.debug(f"Failed to update UI: {e}")
@@ -179,12 +207,12 @@ class LiveStreamRecorder:
             logger.success(stop_msg or f"Live recording has stopped: {record_name}")
         else:
             logger.success(complete_msg or f"Live recording completed: {record_name}")
+            self.services.recording_manager.live_history.record_live_end(self.recording.rec_id)
             asyncio.create_task(self.end_message_push())
 
         try:
             self.recording.update({"display_title": display_title})
             self.services.broadcast_card_update(self.recording)
-            self.services.broadcast_pubsub("update", self.recording)
         except Exception as e:
             logger.debug(f"Failed to update UI: {e}")
 
@@ -234,6 +262,33 @@ class LiveStreamRecorder:
 
         return self.save_format, False
 
+    def _get_flush_interval(self) -> float:
+        value = self.user_config.get("direct_download_flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS)
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return DEFAULT_FLUSH_INTERVAL_SECONDS
+        return max(0.1, value)
+
+    def _use_hls_engine(self, record_url: str) -> bool:
+        """
+        HLS sources of recordings set to the native engine are downloaded without ffmpeg, into one TS file;
+        audio formats still need ffmpeg. MP4 recordings are remuxed once the download ends.
+        """
+        if not self.recording.hls_use_native_engine or self.save_format.upper() not in VideoFormat.get_formats():
+            return False
+        if ".m3u8" not in urllib.parse.urlparse(record_url).path:
+            return False
+        if self.save_format == "mp4":
+            self.remux_hls_to_mp4 = True
+            logger.info(f"Native HLS engine records to TS, remuxing to MP4 when finished: {self.live_url}")
+        elif self.save_format != "ts":
+            logger.warning(
+                f"Native HLS engine records to TS, the {self.save_format.upper()} format is not used: {self.live_url}"
+            )
+        self.save_format = "ts"
+        return True
+
     async def fetch_stream(self) -> StreamData | None:
         logger.info(f"Live URL: {self.live_url}")
         logger.info(f"Use Proxy: {self.proxy or None}")
@@ -252,6 +307,7 @@ class LiveStreamRecorder:
             logger.error(f"No handler found for platform: {self.recording.url}")
             return
         stream_info = await handler.get_stream_info(self.live_url)
+        self.fetch_error = utils.last_traced_error.get()
         self.recording.is_checking = False
         return stream_info
 
@@ -261,41 +317,61 @@ class LiveStreamRecorder:
         """
 
         self.save_format, use_direct_download = self._get_record_format(stream_info)
+        record_url = self._get_record_url(stream_info)
+        use_hls_engine = not use_direct_download and self._use_hls_engine(record_url)
         filename = self._get_filename(stream_info)
         self.output_dir = self._get_output_dir(stream_info)
-        save_path = self._get_save_path(filename, use_direct_download)
+        save_path = self._get_save_path(filename, use_direct_download or use_hls_engine)
         logger.info(f"Save Path: {save_path}")
         self.recording.recording_dir = os.path.dirname(save_path)
         os.makedirs(self.recording.recording_dir, exist_ok=True)
-        record_url = self._get_record_url(stream_info)
         self.set_preview_url(stream_info)
 
         try:
             if self.recording.rec_id in self.services.recording_manager.active_recorders:
                 old_recorder = self.services.recording_manager.active_recorders[self.recording.rec_id]
-                logger.warning(
-                    f"Found existing recorder instance for {self.recording.rec_id}, id: {id(old_recorder)}, stopping it"
-                )
-                old_recorder.request_stop()
+                if self.user_config.get("restart_handoff_enabled", True) and not old_recorder._is_stop_requested():
+                    # The old recorder keeps recording until this one receives data, so the restart loses no frames.
+                    logger.info(
+                        f"Found existing recorder instance for {self.recording.rec_id}, id: {id(old_recorder)}, "
+                        f"handing off once the new output receives data"
+                    )
+                    self.handoff_from = old_recorder
+                else:
+                    logger.warning(
+                        f"Found existing recorder instance for {self.recording.rec_id}, id: {id(old_recorder)}, "
+                        f"stopping it"
+                    )
+                    old_recorder.request_stop()
 
-                await asyncio.sleep(1)
+                    await asyncio.sleep(1)
 
             self.services.recording_manager.active_recorders[self.recording.rec_id] = self
             logger.info(f"Saved recorder instance for {self.recording.rec_id}, id: {id(self)}")
         except Exception as e:
             logger.error(f"Failed to save recorder instance: {e}")
 
-        if use_direct_download:
-            logger.info(f"Use Direct Downloader to Download FLV Stream: {record_url}")
+        if use_direct_download or use_hls_engine:
             headers = {}
             header_params = self.get_headers_params(record_url, self.platform_key)
             if header_params:
                 key, value = header_params.split(":", 1)
                 headers[key] = value
 
-            self.direct_downloader = DirectStreamDownloader(
-                record_url=record_url, save_path=save_path, headers=headers, proxy=self.proxy
-            )
+            if use_hls_engine:
+                logger.info(f"Use Native HLS Engine to Download HLS Stream: {record_url}")
+                self.direct_downloader = HLSStreamDownloader(
+                    record_url=record_url, save_path=save_path, headers=headers, proxy=self.proxy
+                )
+            else:
+                logger.info(f"Use Direct Downloader to Download FLV Stream: {record_url}")
+                self.direct_downloader = DirectStreamDownloader(
+                    record_url=record_url,
+                    save_path=save_path,
+                    headers=headers,
+                    proxy=self.proxy,
+                    flush_interval=self._get_flush_interval(),
+                )
 
             self.services.run_coro(
                 self.start_direct_download(
@@ -333,7 +409,8 @@ class LiveStreamRecorder:
 
     async def remove_active_recorder(self):
         try:
-            if self.recording.rec_id in self.services.recording_manager.active_recorders:
+            # After a hand-off the entry belongs to the new recorder.
+            if self.services.recording_manager.active_recorders.get(self.recording.rec_id) is self:
                 del self.services.recording_manager.active_recorders[self.recording.rec_id]
                 logger.info(f"Removed recorder from active_recorders: {self.recording.rec_id}")
         except Exception as e:
@@ -342,13 +419,259 @@ class LiveStreamRecorder:
     async def recheck_live_status(self):
         if not self.should_stop:
             # not manually stopped
-            recording_duration = time.time() - self.recording_start_time
+            recording_duration = time.monotonic() - self.recording_start_time
             if recording_duration > self.min_valid_recording_duration:
                 if self.services.recording_enabled and not self.is_flv_preferred_platform:
                     self.services.run_coro(self.services.recording_manager.check_if_live(self.recording))
             else:
                 self.recording.status_info = RecordingStatus.RECORDING_ERROR
 
+    def _write_session(
+        self,
+        save_path: str,
+        total_bytes: int | None = None,
+        end: bool = False,
+        exit_code: int | None = None,
+        failure_reason: str | None = None,
+    ) -> None:
+        """Refresh the output files of the current session and write them to the session history."""
+        session_history = self.services.recording_manager.session_history
+        if self.session_id is None:
+            self.session_outputs = []
+            self.session_id = session_history.start_session(self.recording)
+            return
+
+        self.session_outputs = collect_output_files(save_path, self.session_outputs)
+        if total_bytes is None:
+            total_bytes = 0
+            for path in self.session_outputs:
+                try:
+                    total_bytes += os.path.getsize(path)
+                except OSError:
+                    pass
+        if end:
+            session_history.end_session(self.session_id, total_bytes, self.session_outputs, exit_code, failure_reason)
+            self.session_id = None
+        else:
+            session_history.update_session(self.session_id, total_bytes, self.session_outputs)
+        self.session_updated_at = time.time()
+
+    async def start_session(self, save_path: str) -> None:
+        self.session_started_at = time.time()
+        try:
+            await asyncio.to_thread(self._write_session, save_path)
+        except Exception as e:
+            logger.error(f"Failed to start recording session: {e}")
+        self.session_updated_at = time.time()
+
+    async def update_session(self, save_path: str, total_bytes: int | None = None) -> None:
+        """Write the session progress at most every ``SESSION_UPDATE_INTERVAL_SECONDS``."""
+        if self.session_id is None or time.time() - self.session_updated_at < SESSION_UPDATE_INTERVAL_SECONDS:
+            return
+        try:
+            await asyncio.to_thread(self._write_session, save_path, total_bytes)
+        except Exception as e:
+            logger.error(f"Failed to update recording session: {e}")
+
+    async def end_session(
+        self,
+        save_path: str,
+        total_bytes: int | None = None,
+        exit_code: int | None = None,
+        failure_reason: str | None = None,
+    ) -> None:
+        if self.session_id is None:
+            return
+        session_id = self.session_id
+        try:
+            await asyncio.to_thread(self._write_session, save_path, total_bytes, True, exit_code, failure_reason)
+            successor = self.handed_off_to
+            if successor is not None and successor.session_started_at is not None:
+                # Both outputs contain the time between the start of the new session and the end of this one.
+                await asyncio.to_thread(
+                    self.services.recording_manager.session_history.mark_handoff,
+                    successor.session_id,
+                    session_id,
+                    time.time() - successor.session_started_at,
+                )
+        except Exception as e:
+            logger.error(f"Failed to end recording session: {e}")
+
+    async def _read_progress(self, stream: asyncio.StreamReader | None, save_path: str) -> None:
+        """
+        Parse the ``-progress`` stream of ffmpeg into ``recording.progress`` while it runs. The progress
+        blocks also drive the session history updates, so a running recording needs no timer.
+        """
+        if stream is None:
+            return
+        parser = FFmpegProgressParser()
+        async for line in stream:
+            progress = parser.feed(line.decode(errors="replace"))
+            if progress is not None:
+                self._on_progress(progress)
+                await self.update_session(save_path)
+
+    def _on_progress(self, progress: FFmpegProgress) -> None:
+        # The segment muxer reports no total size; muxed output time means the output received data as well.
+        if progress.total_size or progress.out_time_seconds > 0:
+            self._on_output_data()
+        # During a hand-off only the recorder that owns the recording shows its progress.
+        if self.handoff_from is not None or not self.owns_recording:
+            return
+        self.recording.progress = progress
+        if progress.updated_at - self.progress_pushed_at < self.PROGRESS_PUSH_INTERVAL:
+            return
+        self.progress_pushed_at = progress.updated_at
+        self.recording.speed = progress.format_rate()
+        try:
+            self.services.broadcast_card_update(self.recording)
+        except Exception as e:
+            logger.debug(f"Failed to update UI: {e}")
+
+    def _push_download_speed(self) -> None:
+        """Show the measured download speed on the card, like the ffmpeg progress of other recordings."""
+        downloader = self.direct_downloader
+        if self.handoff_from is not None or not self.owns_recording:
+            return
+        self.recording.speed = f"{downloader.meter.rate / 1024:.0f} KB/s | {format_size(downloader.total_bytes)}"
+        try:
+            self.services.broadcast_card_update(self.recording)
+        except Exception as e:
+            logger.debug(f"Failed to update UI: {e}")
+
+    def _reset_progress(self) -> None:
+        self.recording.progress = None
+        self.progress_pushed_at = 0
+        if self.recording.speed != self.DEFAULT_SPEED:
+            self.recording.speed = self.DEFAULT_SPEED
+            try:
+                self.services.broadcast_card_update(self.recording)
+            except Exception as e:
+                logger.debug(f"Failed to update UI: {e}")
+
+    def wake(self) -> None:
+        """Make the recorder re-check its stop conditions now; safe to call from any thread or event loop."""
+        loop = self.supervisor_loop
+        if loop is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            self.wake_event.set()
+            return
+        try:
+            loop.call_soon_threadsafe(self.wake_event.set)
+        except RuntimeError:
+            # The loop is closed, nothing is waiting anymore.
+            pass
+
+    def _is_stop_requested(self) -> bool:
+        return self.should_stop or self.stalled or self.recording.force_stop or not self.services.recording_enabled
+
+    def get_bytes_written(self) -> int:
+        """
+        Bytes written so far, from the downloader, the ffmpeg progress stream or the output files. The segment
+        muxer has no single output and reports no total size, so segmented recordings use the file sizes.
+        """
+        if self.direct_downloader is not None:
+            return self.direct_downloader.total_bytes
+        progress = self.recording.progress
+        if progress is not None and progress.total_size:
+            return progress.total_size
+        if not self.save_file_path:
+            return 0
+        total_bytes = 0
+        for path in collect_output_files(self.save_file_path):
+            try:
+                total_bytes += os.path.getsize(path)
+            except OSError:
+                pass
+        return total_bytes
+
+    def restart_stalled(self) -> None:
+        """Stop a recording that no longer receives data; it is restarted with fresh stream data."""
+        logger.warning(f"Stopping stalled recorder for restart: {self.live_url}, rec_id: {self.recording.rec_id}")
+        self.stalled = True
+        self.wake()
+
+    def _should_reconnect(self, stop_requested: bool) -> bool:
+        """
+        Whether the room goes to the reconnect lane: the recorder stalled, or it exited by itself (CDN
+        hiccup, expired URL) after recording for a while.
+        """
+        if self.stalled:
+            return True
+        return not stop_requested and time.monotonic() - self.recording_start_time > self.min_valid_recording_duration
+
+    async def reconnect(self, record_name: str, failed: bool = False) -> None:
+        """Hand the room to the reconnect lane, which restarts it with freshly fetched stream data."""
+        manager = self.services.recording_manager
+
+        async def on_ended():
+            await self._handle_recording_finished(record_name)
+
+        async def on_failed():
+            if failed:
+                self._handle_recording_error(record_name, self._["record_stream_error"])
+            else:
+                await self._handle_recording_finished(record_name)
+                self.services.run_coro(manager.check_if_live(self.recording))
+
+        self.services.run_coro(manager.reconnect_lane.reconnect(self.recording, time.monotonic(), on_ended, on_failed))
+
+    def _complete_handoff(self) -> None:
+        old_recorder, self.handoff_from = self.handoff_from, None
+        if old_recorder is None:
+            return
+        logger.info(f"Hand-off complete, stopping previous recorder id: {id(old_recorder)}: {self.live_url}")
+        old_recorder.owns_recording = False
+        old_recorder.handed_off_to = self
+        old_recorder.request_stop()
+
+    def _abort_handoff(self) -> None:
+        """Give the recording back to the recorder this one was to replace, when it exits before receiving data."""
+        old_recorder, self.handoff_from = self.handoff_from, None
+        if old_recorder is None:
+            return
+        logger.warning(f"Hand-off target exited before receiving data, keeping the previous recorder: {self.live_url}")
+        self.owns_recording = False
+        active_recorders = self.services.recording_manager.active_recorders
+        if old_recorder._is_stop_requested():
+            old_recorder.wake()
+        elif active_recorders.get(self.recording.rec_id, self) is self:
+            active_recorders[self.recording.rec_id] = old_recorder
+
+    def _on_output_data(self) -> None:
+        """The output received data: finish a pending hand-off and measure the reconnect gap."""
+        self._complete_handoff()
+        self._report_reconnect_gap()
+
+    async def _wait_for_output_data(self, data_received: asyncio.Event) -> None:
+        await data_received.wait()
+        self._on_output_data()
+
+    def _report_reconnect_gap(self) -> None:
+        if self.reconnect_gap_from is not None:
+            gap, self.reconnect_gap_from = time.monotonic() - self.reconnect_gap_from, None
+            self.services.recording_manager.reconnect_lane.record_gap(self.recording, gap)
+
+    async def _wait_for_stop(self, done: asyncio.Future, timeout: float | None = None) -> bool:
+        """
+        Wait until ``done`` completes, a stop is requested through ``wake`` or ``timeout`` elapses, without
+        polling. Returns whether a stop was requested.
+        """
+        self.wake_event.clear()
+        if self._is_stop_requested():
+            return True
+        wake_task = asyncio.create_task(self.wake_event.wait())
+        try:
+            await asyncio.wait({done, wake_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            wake_task.cancel()
+        return self._is_stop_requested()
+
     @staticmethod
     async def _capture_stream_tail(
         stream: asyncio.StreamReader | None,
@@ -380,88 +703,105 @@ class LiveStreamRecorder:
 
         logger.info(f"Starting ffmpeg recording - recorder id: {id(self)}, rec_id: {self.recording.rec_id}")
         self.should_stop = False
+        self.supervisor_loop = asyncio.get_running_loop()
         process = None
         stderr_task = None
+        progress_task = None
+        exit_task = None
+        save_file_path = self.save_file_path = ffmpeg_command[-1]
 
         try:
-            save_file_path = ffmpeg_command[-1]
-
             process = await asyncio.create_subprocess_exec(
                 *ffmpeg_command,
                 stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 startupinfo=self.subprocess_start_info,
             )
             stderr_task = asyncio.create_task(self._capture_stream_tail(process.stderr))
+            progress_task = asyncio.create_task(self._read_progress(process.stdout, save_file_path))
+            exit_task = asyncio.create_task(process.wait())
 
             self.services.process_manager.add_process(process)
             self.recording.status_info = RecordingStatus.RECORDING
             self.recording.record_url = record_url
             logger.info(f"Recording in Progress: {live_url}")
             logger.log("STREAM", f"Recording Stream URL: {record_url}")
-            self.recording_start_time = time.time()
-
-            while True:
-                if self.should_stop or self.recording.force_stop or not self.services.recording_enabled:
-                    logger.info(f"Preparing to End Recording: {live_url}")
-                    await self.remove_active_recorder()
+            self.recording_start_time = time.monotonic()
+            await self.start_session(save_file_path)
+
+            # Sleeps until ffmpeg exits or a stop is requested; the session is updated by the progress stream.
+            stop_requested = await self._wait_for_stop(exit_task)
+            self._abort_handoff()
+            if stop_requested:
+                logger.info(f"Preparing to End Recording: {live_url}")
+                await self.remove_active_recorder()
+                if self.owns_recording:
                     self.recording.is_recording = False
-                    try:
-                        if os.name == "nt":
-                            if process.stdin:
-                                process.stdin.write(b"q")
-                                await process.stdin.drain()
-                                await asyncio.sleep(5)
-                        else:
-                            import signal
-
-                            process.send_signal(signal.SIGINT)
-                            # process.terminate()
-                            await asyncio.sleep(5)
-
+                try:
+                    if process.returncode is not None:
+                        pass
+                    elif os.name == "nt":
                         if process.stdin:
-                            process.stdin.close()
+                            process.stdin.write(b"q")
+                            await process.stdin.drain()
+                    else:
+                        import signal
 
-                        await asyncio.wait_for(process.wait(), timeout=15.0)
-                    except asyncio.TimeoutError:
-                        logger.warning(f"FFmpeg process did not exit gracefully, forcing termination: {live_url}")
-                        process.kill()
-                        await process.wait()
+                        process.send_signal(signal.SIGINT)
+                        # process.terminate()
+                    await asyncio.wait({exit_task}, timeout=5)
 
-                    self.recording.force_stop = False
-                    break
+                    if process.stdin:
+                        process.stdin.close()
 
-                if process.returncode is not None:
-                    logger.info(f"Exit loop recording (normal 0 | abnormal 1): code={process.returncode}, {live_url}")
-                    await self.remove_active_recorder()
-                    self.recording.is_recording = False
-                    break
+                    await asyncio.wait_for(asyncio.shield(exit_task), timeout=15.0)
+                except asyncio.TimeoutError:
+                    logger.warning(f"FFmpeg process did not exit gracefully, forcing termination: {live_url}")
+                    process.kill()
+                    await process.wait()
 
-                await asyncio.sleep(1)
+                self.recording.force_stop = False
+            else:
+                logger.info(f"Exit loop recording (normal 0 | abnormal 1): code={process.returncode}, {live_url}")
+                await self.remove_active_recorder()
+                if self.owns_recording:
+                    self.recording.is_recording = False
 
             await process.wait()
             stderr = await stderr_task
             return_code = process.returncode
             safe_return_codes = {0, 255}
+            failure_reason = None
 
             if return_code not in safe_return_codes:
                 error_output = stderr.decode(errors="replace").strip()
                 if error_output:
-                    logger.error(f"FFmpeg Stderr Output: {error_output.splitlines()[-1]}")
+                    failure_reason = error_output.splitlines()[-1]
+                    logger.error(f"FFmpeg Stderr Output: {failure_reason}")
+                failure_reason = failure_reason or f"ffmpeg exited with code {return_code}"
+            if self.stalled:
+                failure_reason = FAILURE_STALLED
+            await self.end_session(save_file_path, exit_code=return_code, failure_reason=failure_reason)
+
+            reconnect = self.owns_recording and self._should_reconnect(stop_requested)
+            if reconnect:
+                await self.reconnect(record_name, failed=return_code not in safe_return_codes)
+            elif return_code not in safe_return_codes and self.owns_recording:
                 if not self.recording.is_recording:
                     self._handle_recording_error(record_name, self._["record_stream_error"])
 
             if return_code in safe_return_codes:
-                if not self.recording.is_recording:
-                    await self._handle_recording_finished(record_name)
+                if self.owns_recording:
+                    if not self.recording.is_recording and not reconnect:
+                        await self._handle_recording_finished(record_name)
 
-                if not self.services.recording_enabled:
-                    self.recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
-                    self.services.run_coro(self.stop_recording_notify())
+                    if not self.services.recording_enabled:
+                        self.recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
+                        self.services.run_coro(self.stop_recording_notify())
 
-                if not self.recording.manually_stopped:
-                    await self.recheck_live_status()
+                    if not self.recording.manually_stopped and not reconnect:
+                        await self.recheck_live_status()
 
                 if self.user_config.get("convert_to_mp4") and self.save_format == "ts":
                     if self.segment_record:
@@ -510,7 +850,10 @@ class LiveStreamRecorder:
 
         except Exception as e:
             logger.error(f"An error occurred during the subprocess execution: {e}")
-            self._handle_recording_error(record_name, self._["no_ffmpeg_tip"], duration=4000)
+            self._abort_handoff()
+            if self.owns_recording:
+                self._handle_recording_error(record_name, self._["no_ffmpeg_tip"], duration=4000)
+            await self.end_session(save_file_path, failure_reason=str(e))
             return False
         finally:
             if process is not None and process.returncode is None:
@@ -521,7 +864,13 @@ class LiveStreamRecorder:
                     pass
             if stderr_task is not None:
                 await asyncio.gather(stderr_task, return_exceptions=True)
-            self.recording.record_url = None
+            if progress_task is not None:
+                await asyncio.gather(progress_task, return_exceptions=True)
+            if exit_task is not None and not exit_task.done():
+                exit_task.cancel()
+            if self.owns_recording:
+                self._reset_progress()
+                self.recording.record_url = None
 
         return True
 
@@ -712,45 +1061,71 @@ class LiveStreamRecorder:
 
         logger.info(f"Starting direct download - recorder id: {id(self)}, rec_id: {self.recording.rec_id}")
         self.should_stop = False
+        self.supervisor_loop = asyncio.get_running_loop()
+        self.save_file_path = save_file_path
+        data_task = None
 
         try:
             await self.direct_downloader.start_download()
+            data_task = asyncio.create_task(self._wait_for_output_data(self.direct_downloader.data_received))
 
             self.recording.status_info = RecordingStatus.RECORDING
             self.recording.record_url = record_url
             logger.info(f"Direct Downloading: {live_url}")
             logger.log("STREAM", f"Direct Download Stream URL: {record_url}")
-            self.recording_start_time = time.time()
+            self.recording_start_time = time.monotonic()
+            await self.start_session(save_file_path)
 
+            download_task = self.direct_downloader.download_task
+            stop_requested = False
             while True:
-                if self.should_stop or self.recording.force_stop or not self.services.recording_enabled:
+                # Wakes up on a stop request, when the download ends, or to show the speed and write the session.
+                stop_requested = await self._wait_for_stop(download_task, timeout=self.PROGRESS_PUSH_INTERVAL)
+                if stop_requested:
                     logger.info(f"Prepare to end direct download: {live_url}")
+                    self._abort_handoff()
                     await self.remove_active_recorder()
-                    self.recording.is_recording = False
+                    if self.owns_recording:
+                        self.recording.is_recording = False
                     await self.direct_downloader.stop_download()
                     self.recording.force_stop = False
                     break
 
-                await asyncio.sleep(1)
-
-                if self.direct_downloader.download_task and self.direct_downloader.download_task.done():
+                if download_task.done():
                     break
+                self._push_download_speed()
+                await self.update_session(save_file_path, self.direct_downloader.total_bytes)
 
+            failure_reason = FAILURE_STALLED if self.stalled else self.direct_downloader.error
+            await self.end_session(save_file_path, self.direct_downloader.total_bytes, failure_reason=failure_reason)
+            self._abort_handoff()
             await self.remove_active_recorder()
-            self.recording.is_recording = False
 
-            if not self.recording.is_recording:
-                await self._handle_recording_finished(
-                    record_name,
-                    stop_msg=f"Direct Downloading Stopped: {record_name}",
-                    complete_msg=f"Direct Downloading Completed: {record_name}",
-                )
+            if self.owns_recording:
+                self.recording.is_recording = False
+                reconnect = self._should_reconnect(stop_requested)
+                if reconnect:
+                    await self.reconnect(record_name, failed=self.direct_downloader.error is not None)
+                elif not self.recording.is_recording:
+                    await self._handle_recording_finished(
+                        record_name,
+                        stop_msg=f"Direct Downloading Stopped: {record_name}",
+                        complete_msg=f"Direct Downloading Completed: {record_name}",
+                    )
 
-            if not self.services.recording_enabled:
-                self.recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
-                self.services.run_coro(self.stop_recording_notify())
+                if not self.services.recording_enabled:
+                    self.recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
+                    self.services.run_coro(self.stop_recording_notify())
 
-            await self.recheck_live_status()
+                if not reconnect:
+                    await self.recheck_live_status()
+
+            # TS files of the native HLS engine are remuxed like the ones recorded by ffmpeg.
+            converts_to_mp4 = save_type == "ts" and (
+                bool(self.user_config.get("convert_to_mp4")) or self.remux_hls_to_mp4
+            )
+            if converts_to_mp4 and self.direct_downloader.total_bytes:
+                self.services.run_coro(self.converts_mp4(save_file_path, self.user_config["delete_original"]))
 
             if self.user_config.get("execute_custom_script") and script_command:
                 logger.info("Prepare to execute custom script in the background")
@@ -762,24 +1137,31 @@ class LiveStreamRecorder:
                             save_file_path,
                             save_type,
                             False,
-                            False,
+                            converts_to_mp4,
                         )
                     )
                     logger.success("Successfully added script execution")
                 except Exception as e:
                     logger.error(f"Failed to execute custom script: {e}")
                     await self.custom_script_execute(
-                        script_command, record_name, save_file_path, save_type, False, False
+                        script_command, record_name, save_file_path, save_type, False, converts_to_mp4
                     )
 
             return True
 
         except Exception as e:
             logger.error(f"Error occurred during direct download: {e}")
-            self._handle_recording_error(record_name, self._["record_stream_error"])
+            self._abort_handoff()
+            if self.owns_recording:
+                self._handle_recording_error(record_name, self._["record_stream_error"])
+            await self.end_session(save_file_path, self.direct_downloader.total_bytes, failure_reason=str(e))
             return False
         finally:
-            self.recording.record_url = None
+            if data_task is not None and not data_task.done():
+                data_task.cancel()
+            if self.owns_recording:
+                self._reset_progress()
+                self.recording.record_url = None
 
     async def stop_recording_notify(self):
         if desktop_notify.should_push_notification(self.app):
@@ -824,5 +1206,8 @@ class LiveStreamRecorder:
 
         old_value = self.should_stop
         self.should_stop = True
+        # Stopped before taking over: the recorder it was to replace stops as well.
+        self._complete_handoff()
+        self.wake()
 
         logger.info(f"Set should_stop from {old_value} to {self.should_stop} for recorder: {self.recording.rec_id}")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import threading
 import weakref
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
@@ -12,6 +13,9 @@ from ..config.language_manager import LanguageManager
 from ..config.settings_config import SettingsConfig
 from .process_manager import AsyncProcessManager
 
+# Seconds between checks of user_settings.json for changes made outside the app.
+CONFIG_WATCH_INTERVAL_SECONDS = 2
+
 if TYPE_CHECKING:
     from ..recording.record_manager import RecordingManager
 
@@ -20,7 +24,7 @@ if TYPE_CHECKING:
 class UIBridge(Protocol):
     """Contract implemented by session-scoped ``App`` instances."""
 
-    def schedule_card_update(self, recording) -> None: ...
+    def schedule_card_update(self, recording, fields: set[str] | None = None) -> None: ...
 
     def schedule_card_remove(self, recordings) -> None: ...
 
@@ -28,6 +32,8 @@ class UIBridge(Protocol):
 
     def schedule_pubsub(self, topic: str, payload: Any) -> None: ...
 
+    def schedule_filter_refresh(self) -> None: ...
+
 
 class BackendServices:
     _instance: BackendServices | None = None
@@ -40,7 +46,7 @@ class BackendServices:
 
         self.process_manager = AsyncProcessManager()
         self.subprocess_start_up_info = utils.get_startup_info()
-        self.recording_enabled = True
+        self._recording_enabled = True
 
         # Filled in by ``bootstrap``.
         self.recording_manager: RecordingManager | None = None
@@ -52,6 +58,8 @@ class BackendServices:
         self._ui_bridges: weakref.WeakSet[UIBridge] = weakref.WeakSet()
         self._bridges_lock = threading.Lock()
 
+        self._config_watch_started = False
+
         # Background loop (only created in web mode).
         self._backend_loop: asyncio.AbstractEventLoop | None = None
         self._backend_thread: threading.Thread | None = None
@@ -95,6 +103,9 @@ class BackendServices:
                 if self.recording_manager is not None:
                     rm = self.recording_manager
                     interval = int(rm.loop_time_seconds or 180)
+                    loop.create_task(rm.hydrate_recordings())
+                    loop.create_task(self.watch_user_config())
+                    loop.create_task(rm.stall_watchdog.run())
                     loop.create_task(rm.check_free_space())
                     loop.create_task(rm.setup_periodic_live_check(interval))
                 logger.info("BackendServices background loop started")
@@ -121,6 +132,18 @@ class BackendServices:
         except Exception as exc:  # pragma: no cover - defensive
             logger.warning(f"Failed to stop BackendServices loop: {exc}")
 
+    @property
+    def recording_enabled(self) -> bool:
+        return self._recording_enabled
+
+    @recording_enabled.setter
+    def recording_enabled(self, value: bool) -> None:
+        self._recording_enabled = value
+        if not value and self.recording_manager is not None:
+            # Recorders sleep until woken, so tell them to stop now instead of at their next check.
+            for recorder in list(self.recording_manager.active_recorders.values()):
+                recorder.wake()
+
     @property
     def backend_loop(self) -> asyncio.AbstractEventLoop | None:
         return self._backend_loop
@@ -152,6 +175,35 @@ class BackendServices:
                 pass
             return None
 
+    async def watch_user_config(self) -> None:
+        """Apply edits of ``user_settings.json`` made outside the app, e.g. in a mounted Docker volume."""
+        with self._bridges_lock:
+            if self._config_watch_started:
+                return
+            self._config_watch_started = True
+        while True:
+            await asyncio.sleep(CONFIG_WATCH_INTERVAL_SECONDS)
+            try:
+                new_config = await asyncio.to_thread(self.config_manager.poll_user_config)
+                if new_config:
+                    self.apply_user_config(new_config)
+            except Exception as exc:
+                logger.error(f"Failed to reload user settings: {exc}")
+
+    def apply_user_config(self, new_config: dict) -> None:
+        """Update the shared user config in place, so every holder of the dict sees the new values."""
+        user_config = self.settings_config.user_config
+        all_keys = user_config.keys() | new_config.keys()
+        changed_keys = {key for key in all_keys if user_config.get(key) != new_config.get(key)}
+        if not changed_keys:
+            return
+        for key in user_config.keys() - new_config.keys():
+            user_config.pop(key, None)
+        user_config.update(copy.deepcopy(new_config))
+        logger.info(f"Reloaded user settings changed on disk: {sorted(changed_keys)}")
+        if self.recording_manager is not None:
+            self.recording_manager.apply_settings_change(changed_keys)
+
     def register_ui_bridge(self, bridge: UIBridge) -> None:
         with self._bridges_lock:
             self._ui_bridges.add(bridge)
@@ -165,9 +217,13 @@ class BackendServices:
             return list(self._ui_bridges)
 
     def broadcast_card_update(self, recording) -> None:
+        # Sessions only refresh the parts of the card affected by the fields changed since the last push.
+        fields = recording.pop_dirty_display()
+        if not fields:
+            return
         for bridge in self.snapshot_bridges():
             try:
-                bridge.schedule_card_update(recording)
+                bridge.schedule_card_update(recording, fields)
             except Exception as exc:
                 logger.debug(f"broadcast_card_update failed for {bridge}: {exc}")
 
@@ -191,3 +247,10 @@ class BackendServices:
                 bridge.schedule_pubsub(topic, payload)
             except Exception as exc:
                 logger.debug(f"broadcast_pubsub failed for {bridge}: {exc}")
+
+    def broadcast_filter_refresh(self) -> None:
+        for bridge in self.snapshot_bridges():
+            try:
+                bridge.schedule_filter_refresh()
+            except Exception as exc:
+                logger.debug(f"broadcast_filter_refresh failed for {bridge}: {exc}")
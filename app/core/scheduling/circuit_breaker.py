@@ -0,0 +1,145 @@
+import threading
+import time
+from collections.abc import Callable
+
+from ...utils.logger import logger
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN_SECONDS = 120
+# While the half-open probe is running, other rooms of the platform retry after this many seconds.
+HALF_OPEN_RETRY_SECONDS = 15
+
+
+class CircuitState:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for the live status checks of one platform.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and checks are refused for
+    ``cooldown_seconds``. The first check after the cooldown is let through as a half-open probe:
+    its success closes the circuit, its failure opens it for another cooldown.
+    """
+
+    def __init__(
+        self,
+        platform_key: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+        on_state_change: Callable[["CircuitBreaker"], None] | None = None,
+        clock=time.monotonic,
+    ):
+        self.platform_key = platform_key
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.on_state_change = on_state_change
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def _set_state(self, state: str) -> bool:
+        if self.state == state:
+            return False
+        self.state = state
+        return True
+
+    def _notify(self) -> None:
+        logger.info(f"Circuit breaker for platform {self.platform_key} is now {self.state}")
+        if self.on_state_change:
+            try:
+                self.on_state_change(self)
+            except Exception as e:
+                logger.debug(f"Circuit breaker state change callback failed: {e}")
+
+    def allow_request(self) -> bool:
+        """Whether a check may run now; in the half-open state only one probe is let through."""
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.OPEN:
+                if self.clock() - self.opened_at < self.cooldown_seconds:
+                    return False
+                changed = self._set_state(CircuitState.HALF_OPEN)
+                self.probe_in_flight = False
+            else:
+                changed = False
+            if self.probe_in_flight:
+                return False
+            self.probe_in_flight = True
+        if changed:
+            self._notify()
+        return True
+
+    def get_retry_after(self) -> float:
+        """Seconds after which a refused check should be retried."""
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                return max(0.0, self.opened_at + self.cooldown_seconds - self.clock())
+            if self.state == CircuitState.HALF_OPEN:
+                return HALF_OPEN_RETRY_SECONDS
+            return 0.0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            self.probe_in_flight = False
+            changed = self._set_state(CircuitState.CLOSED)
+        if changed:
+            self._notify()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            changed = False
+            if self.state == CircuitState.HALF_OPEN or (
+                self.state == CircuitState.CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.opened_at = self.clock()
+                changed = self._set_state(CircuitState.OPEN)
+            self.probe_in_flight = False
+        if changed:
+            self._notify()
+
+    def release_probe(self) -> None:
+        """Give the probe slot back when an admitted check finished without an outcome."""
+        with self._lock:
+            self.probe_in_flight = False
+
+
+class PlatformCircuitBreakers:
+    """Circuit breakers keyed by ``platform_key``, configured from user settings."""
+
+    def __init__(self, user_config: dict, on_state_change: Callable[[CircuitBreaker], None] | None = None):
+        self.user_config = user_config
+        self.on_state_change = on_state_change
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _get_setting(self, key: str, default: int) -> int:
+        try:
+            value = int(self.user_config.get(key) or default)
+            return value if value > 0 else default
+        except (TypeError, ValueError):
+            return default
+
+    def get(self, platform_key: str | None) -> CircuitBreaker:
+        key = platform_key or "unknown"
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(key, on_state_change=self.on_state_change)
+        breaker.failure_threshold = self._get_setting("circuit_breaker_failure_threshold", DEFAULT_FAILURE_THRESHOLD)
+        breaker.cooldown_seconds = self._get_setting("circuit_breaker_cooldown_seconds", DEFAULT_COOLDOWN_SECONDS)
+        return breaker
+
+    def get_tripped(self) -> list[CircuitBreaker]:
+        """Breakers that are currently open or half-open."""
+        with self._lock:
+            return [breaker for breaker in self._breakers.values() if breaker.state != CircuitState.CLOSED]
@@ -0,0 +1,148 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import math
+import threading
+import time
+from typing import Any
+
+# Deadlines derived from the wall clock (e.g. the start of a scheduled recording window) are capped to this
+# many seconds, so a system clock change is picked up on the next re-evaluation instead of being waited out.
+WALL_CLOCK_RESYNC_SECONDS = 900
+
+
+def get_phase(rec_id: str) -> float:
+    """Deterministic position of a room within a polling interval, in [0, 1), derived from its ``rec_id``."""
+    digest = hashlib.md5(str(rec_id).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+class LiveCheckScheduler:
+    """
+    Min-heap of next live-check deadlines keyed by ``rec_id``.
+
+    Rescheduling a room pushes a new heap entry and leaves the previous one behind as a stale
+    entry, which is skipped lazily when it reaches the top of the heap. This keeps ``schedule``
+    and ``unschedule`` at O(log n) / O(1) and a tick proportional to the number of due rooms.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[float, int, Any]] = {}
+        self._counter = itertools.count()
+        self._epoch = clock()
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, rec_id: str) -> bool:
+        return rec_id in self._entries
+
+    def schedule(self, rec_id: str, delay: float, payload: Any = None) -> float:
+        """Schedule (or reschedule) a room to be due ``delay`` seconds from now."""
+        return self.schedule_at(rec_id, self.clock() + max(0.0, float(delay or 0)), payload)
+
+    def schedule_wall_clock(self, rec_id: str, delay: float, payload: Any = None) -> float:
+        """Schedule a room for a delay computed from the wall clock, re-evaluating at least every resync period."""
+        return self.schedule(rec_id, min(float(delay), WALL_CLOCK_RESYNC_SECONDS), payload)
+
+    def schedule_aligned(self, rec_id: str, interval: float, payload: Any = None) -> float:
+        """
+        Schedule a room at its own phase slot of a grid with the given interval.
+
+        The slot is the first one at least half an interval away, so the actual delay is between 0.5 and
+        1.5 intervals. Rooms keep their slots however long their checks take, so checks stay evenly spread.
+        """
+        interval = max(1.0, float(interval))
+        slot_origin = self._epoch + get_phase(rec_id) * interval
+        earliest = self.clock() + interval / 2
+        deadline = slot_origin + math.ceil((earliest - slot_origin) / interval) * interval
+        return self.schedule_at(rec_id, deadline, payload)
+
+    def schedule_at(self, rec_id: str, deadline: float, payload: Any = None) -> float:
+        """Schedule (or reschedule) a room to be due at the given clock deadline."""
+        with self._lock:
+            seq = next(self._counter)
+            heapq.heappush(self._heap, (deadline, seq, rec_id))
+            self._entries[rec_id] = (deadline, seq, payload)
+            is_new_head = self._heap[0][1] == seq
+        if is_new_head:
+            self._notify()
+        return deadline
+
+    def unschedule(self, rec_id: str) -> None:
+        with self._lock:
+            self._entries.pop(rec_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+            self._entries.clear()
+
+    def get_deadline(self, rec_id: str) -> float | None:
+        entry = self._entries.get(rec_id)
+        return entry[0] if entry else None
+
+    def get_remaining(self, rec_id: str) -> float | None:
+        """Seconds until the room is due, or None if it is not queued."""
+        deadline = self.get_deadline(rec_id)
+        return None if deadline is None else max(0.0, deadline - self.clock())
+
+    def _discard_stale_head(self) -> None:
+        while self._heap:
+            _, seq, rec_id = self._heap[0]
+            entry = self._entries.get(rec_id)
+            if entry is not None and entry[1] == seq:
+                return
+            heapq.heappop(self._heap)
+
+    def next_deadline(self) -> float | None:
+        with self._lock:
+            self._discard_stale_head()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float | None = None) -> list[tuple[str, Any]]:
+        """Remove and return ``(rec_id, payload)`` for every room whose deadline has passed."""
+        now = self.clock() if now is None else now
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, rec_id = heapq.heappop(self._heap)
+                entry = self._entries.get(rec_id)
+                if entry is None or entry[1] != seq:
+                    continue
+                del self._entries[rec_id]
+                due.append((rec_id, entry[2]))
+        return due
+
+    async def wait_until_due(self) -> None:
+        """Sleep until the earliest deadline is reached or an earlier one is scheduled."""
+        self._loop = asyncio.get_running_loop()
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+        while True:
+            deadline = self.next_deadline()
+            now = self.clock()
+            if deadline is not None and deadline <= now:
+                return
+            self._wakeup.clear()
+            timeout = None if deadline is None else deadline - now
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _notify(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass
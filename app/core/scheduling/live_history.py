@@ -0,0 +1,184 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from ...utils.logger import logger
+from ..recording.recordings_writer import DebouncedWriter
+
+# Number of recorded live sessions before the learned schedule is trusted.
+MIN_SESSIONS_FOR_POLICY = 3
+# A room that has been observed for this long without reaching the session threshold is adapted anyway,
+# so rooms that are almost never live are backed off too.
+LEARNING_PERIOD_SECONDS = 7 * 24 * 3600
+MAX_SESSIONS_PER_ROOM = 60
+# A live start this soon after the previous end is treated as the same session (stream hiccup, manual restart).
+SESSION_MERGE_GAP_SECONDS = 15 * 60
+# Open sessions and very long sessions only mark this many hours as live.
+MAX_SESSION_HOURS = 12
+# Poll at the base interval from this many hours before a usual start hour.
+START_WINDOW_LEAD_HOURS = 1
+LIVE_HOUR_BACKOFF_FACTOR = 2
+IDLE_BACKOFF_FACTOR = 12
+MAX_IDLE_INTERVAL_SECONDS = 3600
+
+
+@dataclass
+class LiveProfile:
+    """Learned live schedule of a single room, by local hour of the day."""
+
+    session_count: int = 0
+    observed_seconds: float = 0
+    start_hours: dict[int, int] = field(default_factory=dict)
+    live_hours: set[int] = field(default_factory=set)
+    hot_hours: set[int] = field(default_factory=set)
+
+    @property
+    def is_learned(self) -> bool:
+        return self.session_count >= MIN_SESSIONS_FOR_POLICY or self.observed_seconds >= LEARNING_PERIOD_SECONDS
+
+    @property
+    def usual_start_hours(self) -> list[int]:
+        return sorted(self.start_hours, key=lambda hour: (-self.start_hours[hour], hour))
+
+
+class LiveHistory:
+    """
+    Live start/end events per room and the polling policy derived from them.
+
+    Sessions are stored as ``[start_ts, end_ts]`` epoch seconds (``end_ts`` is None while live) in a
+    separate ``live_history.json`` so that the recordings file is not rewritten on every live event.
+    Every change is written shortly after it happens by a debounced writer, ``shutdown`` flushes it on exit.
+    """
+
+    def __init__(self, config_manager):
+        self.config_manager = config_manager
+        self._rooms: dict[str, dict] = {}
+        self._profiles: dict[str, LiveProfile] = {}
+        self._lock = threading.Lock()
+        self.writer = DebouncedWriter(
+            name="live history", snapshot=self._snapshot, write=config_manager.save_live_history_config_sync
+        )
+        self.load()
+
+    def load(self):
+        data = self.config_manager.load_live_history_config()
+        for rec_id, room in (data or {}).items():
+            if not isinstance(room, dict):
+                continue
+            sessions = [list(s) for s in room.get("sessions", []) if isinstance(s, list) and len(s) == 2]
+            self._rooms[rec_id] = {"first_seen": room.get("first_seen") or time.time(), "sessions": sessions}
+        logger.info(f"Live History: Loaded {len(self._rooms)} rooms")
+
+    def _snapshot(self) -> dict:
+        with self._lock:
+            return {
+                rec_id: {"first_seen": room["first_seen"], "sessions": [list(s) for s in room["sessions"]]}
+                for rec_id, room in self._rooms.items()
+            }
+
+    def shutdown(self) -> None:
+        """Write pending changes now, before the process exits."""
+        self.writer.shutdown()
+
+    def _get_room(self, rec_id: str) -> tuple[dict, bool]:
+        room = self._rooms.get(rec_id)
+        if room is None:
+            room = self._rooms[rec_id] = {"first_seen": time.time(), "sessions": []}
+            return room, True
+        return room, False
+
+    def track(self, rec_id: str) -> None:
+        """Start the observation period of a room, if it is not tracked yet."""
+        with self._lock:
+            _, created = self._get_room(rec_id)
+        if created:
+            self.writer.mark_dirty()
+
+    def remove(self, rec_id: str) -> None:
+        with self._lock:
+            removed = self._rooms.pop(rec_id, None) is not None
+            self._profiles.pop(rec_id, None)
+        if removed:
+            self.writer.mark_dirty()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rooms.clear()
+            self._profiles.clear()
+        self.writer.mark_dirty()
+
+    def record_live_start(self, rec_id: str, timestamp: float | None = None) -> None:
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            sessions = self._get_room(rec_id)[0]["sessions"]
+            if sessions and sessions[-1][1] is None:
+                return
+            if sessions and timestamp - sessions[-1][1] <= SESSION_MERGE_GAP_SECONDS:
+                sessions[-1][1] = None
+            else:
+                sessions.append([timestamp, None])
+                del sessions[:-MAX_SESSIONS_PER_ROOM]
+            self._profiles.pop(rec_id, None)
+        # The writer takes the lock for its snapshot, it is marked once the lock is released.
+        self.writer.mark_dirty()
+
+    def record_live_end(self, rec_id: str, timestamp: float | None = None) -> None:
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            room = self._rooms.get(rec_id)
+            if not room or not room["sessions"] or room["sessions"][-1][1] is not None:
+                return
+            room["sessions"][-1][1] = timestamp
+            self._profiles.pop(rec_id, None)
+        self.writer.mark_dirty()
+
+    def get_profile(self, rec_id: str) -> LiveProfile | None:
+        with self._lock:
+            room = self._rooms.get(rec_id)
+            if room is None:
+                return None
+            profile = self._profiles.get(rec_id)
+            if profile is None:
+                profile = self._profiles[rec_id] = self._build_profile(room)
+            profile.observed_seconds = time.time() - room["first_seen"]
+            return profile
+
+    @staticmethod
+    def _build_profile(room: dict) -> LiveProfile:
+        profile = LiveProfile(session_count=len(room["sessions"]))
+        for start_ts, end_ts in room["sessions"]:
+            start = datetime.fromtimestamp(start_ts)
+            profile.start_hours[start.hour] = profile.start_hours.get(start.hour, 0) + 1
+            for lead in range(START_WINDOW_LEAD_HOURS + 1):
+                profile.hot_hours.add((start.hour - lead) % 24)
+            duration_hours = MAX_SESSION_HOURS if end_ts is None else (end_ts - start_ts) / 3600
+            for offset in range(int(min(duration_hours, MAX_SESSION_HOURS)) + 1):
+                profile.live_hours.add((start.hour + offset) % 24)
+        return profile
+
+    def get_polling_interval(self, rec_id: str, base_interval: int, now: datetime | None = None) -> int:
+        """
+        Get the polling interval of a room for the current hour.
+
+        Rooms poll at ``base_interval`` around their usual start hours and until enough history is
+        collected, at a moderate backoff during hours they have been live in, and are backed off
+        heavily otherwise, waking up again at the start of the next usual start window.
+        """
+        profile = self.get_profile(rec_id)
+        if profile is None or not profile.is_learned:
+            return base_interval
+
+        now = now or datetime.now()
+        if now.hour in profile.hot_hours:
+            return base_interval
+        if now.hour in profile.live_hours:
+            return base_interval * LIVE_HOUR_BACKOFF_FACTOR
+
+        interval = min(base_interval * IDLE_BACKOFF_FACTOR, max(base_interval, MAX_IDLE_INTERVAL_SECONDS))
+        for offset in range(1, 25):
+            if (now.hour + offset) % 24 in profile.hot_hours:
+                next_window = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=offset)
+                interval = min(interval, int((next_window - now).total_seconds()) + 1)
+                break
+        return max(base_interval, interval)
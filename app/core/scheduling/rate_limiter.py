@@ -0,0 +1,168 @@
+import asyncio
+import re
+import threading
+import time
+from contextlib import asynccontextmanager
+
+from ...utils.logger import logger
+
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_BURST = 5
+DEFAULT_CONCURRENCY = 3
+# The throttled rate never drops below this fraction of the configured rate.
+MIN_RATE_FRACTION = 0.05
+# Fraction of the configured rate recovered after each successful request.
+RECOVERY_STEP_FRACTION = 0.1
+MIN_THROTTLE_COOLDOWN_SECONDS = 30
+MAX_THROTTLE_COOLDOWN_SECONDS = 600
+
+# Error messages (as logged by trace_error_decorator) that indicate the platform is throttling us.
+RATE_LIMIT_ERROR_PATTERN = re.compile(
+    r"\b429\b|too many requests|rate.?limit|访问频繁|请求频繁|操作频繁|频率过高|稍后再试|captcha|验证码",
+    re.IGNORECASE,
+)
+
+
+def is_rate_limit_error(error_info: str | None) -> bool:
+    return bool(error_info) and bool(RATE_LIMIT_ERROR_PATTERN.search(error_info))
+
+
+class TokenBucketLimiter:
+    """
+    Requests/second, burst and concurrency limit for a single platform.
+
+    The rate adapts AIMD-style: a throttling response halves it and pauses the platform for a
+    cooldown that doubles on consecutive throttles, each success recovers a fraction of the
+    configured rate.
+    """
+
+    def __init__(self, platform_key: str, rate: float, burst: int, concurrency: int, clock=time.monotonic):
+        self.platform_key = platform_key
+        self.clock = clock
+        self.configured_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.concurrency = concurrency
+        self.blocked_until = 0.0
+        self.throttle_streak = 0
+        self.throttle_count = 0
+        self._updated_at = clock()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._lock = threading.Lock()
+
+    def configure(self, rate: float, burst: int, concurrency: int) -> None:
+        with self._lock:
+            if self.rate >= self.configured_rate or self.rate > rate:
+                self.rate = rate
+            self.configured_rate = rate
+            self.burst = burst
+            self.tokens = min(self.tokens, float(burst))
+            if concurrency != self.concurrency:
+                # Holders of the previous semaphore release it when they finish, new callers use the new one.
+                self.concurrency = concurrency
+                self._semaphore = asyncio.Semaphore(concurrency)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _try_take(self) -> float:
+        """Take a token if available and return 0, otherwise return the seconds to wait for one."""
+        with self._lock:
+            now = self.clock()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    @asynccontextmanager
+    async def acquire(self):
+        semaphore = self._semaphore
+        async with semaphore:
+            while (wait := self._try_take()) > 0:
+                await asyncio.sleep(wait)
+            yield
+
+    def report_success(self) -> None:
+        with self._lock:
+            self.throttle_streak = 0
+            if self.rate < self.configured_rate:
+                self.rate = min(self.configured_rate, self.rate + self.configured_rate * RECOVERY_STEP_FRACTION)
+
+    def report_throttled(self) -> None:
+        with self._lock:
+            self.throttle_streak += 1
+            self.throttle_count += 1
+            self.rate = max(self.configured_rate * MIN_RATE_FRACTION, self.rate / 2)
+            self.tokens = 0.0
+            cooldown = min(
+                MAX_THROTTLE_COOLDOWN_SECONDS, MIN_THROTTLE_COOLDOWN_SECONDS * 2 ** (self.throttle_streak - 1)
+            )
+            self.blocked_until = self.clock() + cooldown
+        logger.warning(
+            f"Platform {self.platform_key} is rate limiting requests, "
+            f"pausing for {cooldown}s and lowering the rate to {self.rate:.2f}/s"
+        )
+
+    def report_result(self, error_info: str | None) -> None:
+        """Adjust the rate from the outcome of a request; errors unrelated to throttling are ignored."""
+        if error_info is None:
+            self.report_success()
+        elif is_rate_limit_error(error_info):
+            self.report_throttled()
+
+
+class PlatformRateLimiter:
+    """
+    Per ``platform_key`` token-bucket limiters configured from user settings.
+
+    ``platform_requests_per_second``, ``platform_request_burst`` and ``platform_max_concurrent_requests``
+    are the defaults, ``platform_rate_limits`` overrides them per platform, for example
+    ``{"douyin": {"rate": 1, "burst": 3, "concurrency": 2}}``.
+    """
+
+    def __init__(self, user_config: dict):
+        self.user_config = user_config
+        self._limiters: dict[str, TokenBucketLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get_platform_config(self, platform_key: str | None) -> tuple[float, int, int]:
+        def _number(value, default, cast):
+            try:
+                value = cast(value)
+                return value if value > 0 else default
+            except (TypeError, ValueError):
+                return default
+
+        config = self.user_config
+        rate = _number(config.get("platform_requests_per_second"), DEFAULT_REQUESTS_PER_SECOND, float)
+        burst = _number(config.get("platform_request_burst"), DEFAULT_BURST, int)
+        concurrency = _number(config.get("platform_max_concurrent_requests"), DEFAULT_CONCURRENCY, int)
+
+        overrides = config.get("platform_rate_limits")
+        overrides = overrides.get(platform_key) if isinstance(overrides, dict) else None
+        if isinstance(overrides, dict):
+            rate = _number(overrides.get("rate"), rate, float)
+            burst = _number(overrides.get("burst"), burst, int)
+            concurrency = _number(overrides.get("concurrency"), concurrency, int)
+        return rate, burst, concurrency
+
+    def get(self, platform_key: str | None) -> TokenBucketLimiter:
+        key = platform_key or "unknown"
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = TokenBucketLimiter(key, *self.get_platform_config(platform_key))
+            return limiter
+
+    def reload(self) -> None:
+        """Apply changed settings to the existing limiters, keeping their adaptive state."""
+        with self._lock:
+            limiters = list(self._limiters.items())
+        for key, limiter in limiters:
+            limiter.configure(*self.get_platform_config(key))
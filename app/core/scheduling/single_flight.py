@@ -0,0 +1,105 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+
+def normalize_room_url(url: str) -> str:
+    """Normalize a room URL for deduplication: case-insensitive scheme and host, no fragment or trailing slash."""
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+class _LeaderCancelledError(Exception):
+    """Set on the shared future when the caller running the coroutine was cancelled."""
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key into one execution.
+
+    The first caller runs the coroutine, callers arriving while it is in flight wait for and share its
+    result, also when they run on another event loop. When the running caller is cancelled, a waiting
+    caller runs the coroutine instead of being cancelled as well. Results accepted by ``cacheable`` are
+    additionally served from a cache for ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0,
+        cacheable: Callable[[Any], bool] | None = None,
+        clock=time.monotonic,
+    ):
+        self.ttl = ttl
+        self.cacheable = cacheable or bool
+        self.clock = clock
+        self._in_flight: dict[Hashable, concurrent.futures.Future] = {}
+        self._cache: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_cached(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if self.clock() >= expires_at:
+            del self._cache[key]
+            return False, None
+        return True, value
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """
+        Run ``func`` once for all concurrent callers of ``key``.
+
+        :return: The result and whether this caller executed ``func`` itself.
+        """
+        while True:
+            with self._lock:
+                if self.ttl > 0:
+                    hit, value = self._get_cached(key)
+                    if hit:
+                        return value, False
+                future = self._in_flight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = self._in_flight[key] = concurrent.futures.Future()
+
+            if is_leader:
+                break
+            try:
+                # Shielded, so a cancelled waiter does not cancel the shared future of the other callers.
+                return await asyncio.shield(asyncio.wrap_future(future)), False
+            except _LeaderCancelledError:
+                continue
+
+        try:
+            value = await func()
+        except asyncio.CancelledError:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(_LeaderCancelledError())
+            raise
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if self.ttl > 0 and self.cacheable(value):
+                self._cache[key] = (self.clock() + self.ttl, value)
+        future.set_result(value)
+        return value, True
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._cache.pop(key, None)
@@ -8,12 +8,28 @@ from ..utils.logger import logger
 from .tray_manager import TrayManager
 
 
-async def _safe_destroy_window(page):
+def _flush_pending_writes(app):
+    """Write debounced recording and live history changes before the process exits, ``os._exit`` skips atexit."""
+    record_manager = getattr(app, "record_manager", None)
+    if record_manager is None:
+        return
+    try:
+        record_manager.recordings_writer.shutdown()
+    except Exception as ex:
+        logger.error(f"flush recordings error: {ex}")
+    try:
+        record_manager.live_history.shutdown()
+    except Exception as ex:
+        logger.error(f"flush live history error: {ex}")
+
+
+async def _safe_destroy_window(page, app):
     try:
         await page.window.destroy()
     except Exception as ex:
         logger.error(f"close window error: {ex}")
     finally:
+        _flush_pending_writes(app)
         os._exit(0)
 
 
@@ -73,13 +89,14 @@ async def handle_app_close(page: ft.Page, app, save_progress_overlay) -> None:
                         app.tray_manager.stop()
                     page.run_task(page.window.destroy)
                     time.sleep(0.3)
+                    _flush_pending_writes(app)
                     os._exit(0)
 
             threading.Thread(target=close_app, daemon=True).start()
         else:
             if not getattr(app, "is_web_mode", False) and hasattr(app, "tray_manager"):
                 app.tray_manager.stop()
-            await _safe_destroy_window(page)
+            await _safe_destroy_window(page, app)
 
         await close_dialog(e)
 
@@ -1,7 +1,187 @@
 from datetime import timedelta
+from operator import attrgetter
+
+# Attributes saved by ``to_dict``, kept on ``RecordingSpec``; changing one requires the recordings to be persisted.
+SPEC_FIELDS = (
+    "rec_id",
+    "url",
+    "streamer_name",
+    "record_format",
+    "quality",
+    "segment_record",
+    "segment_time",
+    "monitor_status",
+    "scheduled_recording",
+    "scheduled_start_time",
+    "monitor_hours",
+    "recording_dir",
+    "enabled_message_push",
+    "platform",
+    "platform_key",
+    "only_notify_no_record",
+    "flv_use_direct_download",
+    "video_bitrate",
+    "hls_use_native_engine",
+    "check_failure_count",
+    "next_retry_at",
+)
+# Volatile attributes, kept on ``RecordingRuntime``.
+RUNTIME_FIELDS = (
+    "title",
+    "display_title",
+    "speed",
+    "status_info",
+    "is_live",
+    "is_recording",
+    "is_checking",
+    "selected",
+    "start_time",
+    "cumulative_duration",  # Accumulated recording time
+    "last_duration",  # Save the total time of the last recording
+    "last_duration_str",
+    "scheduled_time_range",
+    "manually_stopped",
+    "force_stop",
+    "stopping_in_progress",
+    "stop_requested",
+    "notified_live_start",
+    "notified_live_end",
+    "showed_checking_status",
+    "live_title",
+    "detection_time",  # Wall-clock datetime of the last live check, for display only
+    "loop_time_seconds",
+    "use_proxy",
+    "record_url",
+    "preview_url",
+    "progress",  # Latest FFmpegProgress of the running ffmpeg recording
+)
+PERSISTENT_FIELDS = frozenset(SPEC_FIELDS)
+# Attributes shown on the recording card; changing one of them requires a card update.
+DISPLAY_FIELDS = frozenset(
+    {
+        "title",
+        "display_title",
+        "status_info",
+        "is_live",
+        "is_recording",
+        "is_checking",
+        "monitor_status",
+        "selected",
+        "speed",
+        "start_time",
+        "cumulative_duration",
+        "last_duration",
+    }
+)
+# Attributes the recording store indexes by; changing one of them refiles the recording in its store.
+INDEXED_FIELDS = frozenset(
+    {"url", "platform_key", "status_info", "is_live", "is_recording", "monitor_status", "selected"}
+)
+# Dirty fields are kept as bit masks, one bit per tracked field.
+_FIELD_BITS = {name: 1 << index for index, name in enumerate(sorted(PERSISTENT_FIELDS | DISPLAY_FIELDS))}
+_ZERO_DURATION = timedelta()
+_MISSING = object()
+
+
+def _fields_from_mask(mask: int) -> set[str]:
+    return {name for name, bit in _FIELD_BITS.items() if mask & bit}
+
+
+class RecordingSpec:
+    """Persisted configuration of a recording, the fields written by ``Recording.to_dict``."""
+
+    __slots__ = SPEC_FIELDS
+
+
+class RecordingRuntime:
+    """Volatile runtime state of a recording."""
+
+    __slots__ = RUNTIME_FIELDS
+
+    def __init__(self):
+        self.title = None
+        self.display_title = None
+        self.speed = "X KB/s"
+        self.status_info = None
+        self.is_live = False
+        self.is_recording = False
+        self.is_checking = False
+        self.selected = False
+        self.start_time = None
+        self.cumulative_duration = _ZERO_DURATION
+        self.last_duration = _ZERO_DURATION
+        self.last_duration_str = None
+        self.scheduled_time_range = None
+        self.manually_stopped = False
+        self.force_stop = False
+        self.stopping_in_progress = False
+        self.stop_requested = False
+        self.notified_live_start = False
+        self.notified_live_end = False
+        self.showed_checking_status = False
+        self.live_title = None
+        self.detection_time = None
+        self.loop_time_seconds = None
+        self.use_proxy = None
+        self.record_url = None
+        self.preview_url = None
+        self.progress = None
+
+
+class _Field:
+    """
+    Attribute of ``Recording`` stored on its spec or runtime object, recording changes of tracked fields.
+
+    A change of an indexed field also refiles the recording in the store it belongs to, so the store's
+    status and platform indexes stay current no matter which code path changed the state. The first
+    persistent change after a save adds the recording to the store's set of unsaved recordings.
+    """
+
+    __slots__ = ("name", "holder", "persistent_bit", "display_bit", "indexed")
+
+    def __init__(self, name: str, holder: str):
+        self.name = name
+        self.holder = attrgetter(holder)
+        bit = _FIELD_BITS.get(name, 0)
+        self.persistent_bit = bit if name in PERSISTENT_FIELDS else 0
+        self.display_bit = bit if name in DISPLAY_FIELDS else 0
+        self.indexed = name in INDEXED_FIELDS
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(self.holder(obj), self.name)
+
+    def __set__(self, obj, value):
+        holder = self.holder(obj)
+        if self.persistent_bit or self.display_bit:
+            current = getattr(holder, self.name, _MISSING)
+            try:
+                changed = current is _MISSING or not (current is value or current == value)
+            except Exception:
+                changed = True
+            if changed:
+                if self.persistent_bit and not obj._dirty_persistent and obj._store is not None:
+                    obj._store.mark_persist_dirty(obj)
+                obj._dirty_persistent |= self.persistent_bit
+                obj._dirty_display |= self.display_bit
+                setattr(holder, self.name, value)
+                if self.indexed and obj._store is not None:
+                    obj._store.reindex(obj)
+                return
+        setattr(holder, self.name, value)
 
 
 class Recording:
+    """
+    A live room to monitor and record.
+
+    Attributes are stored on two slotted objects, ``spec`` for the persisted configuration and
+    ``runtime`` for volatile state, and are accessed on the recording itself as before.
+    """
+
+    __slots__ = ("spec", "runtime", "_dirty_persistent", "_dirty_display", "_store")
+
     def __init__(
         self,
         rec_id,
@@ -20,6 +200,7 @@ class Recording:
         only_notify_no_record,
         flv_use_direct_download,
         video_bitrate=None,
+        hls_use_native_engine=False,
     ):
         """
         Initialize a recording object.
@@ -40,74 +221,88 @@ class Recording:
         :param only_notify_no_record: Whether to only notify when no record is made.
         :param flv_use_direct_download: Whether to use direct downloader to cache FLV stream.
         :param video_bitrate: Custom output video bitrate in kbps, or None to copy the source video stream.
+        :param hls_use_native_engine: Whether to record HLS sources with the built-in downloader instead of ffmpeg.
         """
 
-        self.rec_id = rec_id
-        self.url = url
-        self.quality = quality
-        self.record_format = record_format
-        self.monitor_status = monitor_status
-        self.segment_record = segment_record
-        self.segment_time = segment_time
-        self.streamer_name = streamer_name
-        self.scheduled_recording = scheduled_recording
-        self.scheduled_start_time = scheduled_start_time
-        self.monitor_hours = monitor_hours
-        self.recording_dir = recording_dir
-        self.enabled_message_push = enabled_message_push
-        self.only_notify_no_record = only_notify_no_record
-        self.flv_use_direct_download = flv_use_direct_download
-        self.video_bitrate = video_bitrate
-        self.scheduled_time_range = None
-        self.title = f"{streamer_name} - {self.quality}"
-        self.speed = "X KB/s"
-        self.is_live = False
-        self.is_recording = False
-        self.start_time = None
-        self.manually_stopped = False
-        self.force_stop = False
-        self.stopping_in_progress = False
-        self.stop_requested = False
-        self.platform = None
-        self.platform_key = None
-        self.notified_live_start = False
-        self.notified_live_end = False
+        spec = RecordingSpec()
+        spec.rec_id = rec_id
+        spec.url = url
+        spec.streamer_name = streamer_name
+        spec.record_format = record_format
+        spec.quality = quality
+        spec.segment_record = segment_record
+        spec.segment_time = segment_time
+        spec.monitor_status = monitor_status
+        spec.scheduled_recording = scheduled_recording
+        spec.scheduled_start_time = scheduled_start_time
+        spec.monitor_hours = monitor_hours
+        spec.recording_dir = recording_dir
+        spec.enabled_message_push = enabled_message_push
+        spec.platform = None
+        spec.platform_key = None
+        spec.only_notify_no_record = only_notify_no_record
+        spec.flv_use_direct_download = flv_use_direct_download
+        spec.video_bitrate = video_bitrate
+        spec.hls_use_native_engine = hls_use_native_engine
+        spec.check_failure_count = 0  # Consecutive failed live checks
+        spec.next_retry_at = None  # Epoch seconds before which a failing room is not checked again
 
-        self.cumulative_duration = timedelta()  # Accumulated recording time
-        self.last_duration = timedelta()  # Save the total time of the last recording
-        self.display_title = self.title
-        self.selected = False
-        self.is_checking = False
-        self.showed_checking_status = False
-        self.status_info = None
-        self.live_title = None
-        self.detection_time = None
-        self.loop_time_seconds = None
-        self.use_proxy = None
-        self.record_url = None
-        self.preview_url = None
+        runtime = RecordingRuntime()
+        runtime.title = runtime.display_title = f"{streamer_name} - {quality}"
+
+        self.spec = spec
+        self.runtime = runtime
+        self._dirty_persistent = 0
+        self._dirty_display = 0
+        self._store = None  # RecordingStore holding the recording, set by the store
+
+    @property
+    def is_persist_dirty(self) -> bool:
+        return bool(self._dirty_persistent)
+
+    @property
+    def is_display_dirty(self) -> bool:
+        return bool(self._dirty_display)
+
+    def pop_dirty_persistent(self) -> set[str]:
+        """Return and reset the persistent fields changed since the last call."""
+        mask, self._dirty_persistent = self._dirty_persistent, 0
+        return _fields_from_mask(mask) if mask else set()
+
+    def pop_dirty_display(self) -> set[str]:
+        """Return and reset the display fields changed since the last call."""
+        mask, self._dirty_display = self._dirty_display, 0
+        return _fields_from_mask(mask) if mask else set()
+
+    def clear_dirty(self):
+        self._dirty_persistent = 0
+        self._dirty_display = 0
 
     def to_dict(self):
         """Convert the Recording instance to a dictionary for saving."""
+        spec = self.spec
         return {
-            "rec_id": self.rec_id,
-            "url": self.url,
-            "streamer_name": self.streamer_name,
-            "record_format": self.record_format,
-            "quality": self.quality,
-            "segment_record": self.segment_record,
-            "segment_time": self.segment_time,
-            "monitor_status": self.monitor_status,
-            "scheduled_recording": self.scheduled_recording,
-            "scheduled_start_time": self.scheduled_start_time,
-            "monitor_hours": self.monitor_hours,
-            "recording_dir": self.recording_dir,
-            "enabled_message_push": self.enabled_message_push,
-            "platform": self.platform,
-            "platform_key": self.platform_key,
-            "only_notify_no_record": self.only_notify_no_record,
-            "flv_use_direct_download": self.flv_use_direct_download,
-            "video_bitrate": self.video_bitrate,
+            "rec_id": spec.rec_id,
+            "url": spec.url,
+            "streamer_name": spec.streamer_name,
+            "record_format": spec.record_format,
+            "quality": spec.quality,
+            "segment_record": spec.segment_record,
+            "segment_time": spec.segment_time,
+            "monitor_status": spec.monitor_status,
+            "scheduled_recording": spec.scheduled_recording,
+            "scheduled_start_time": spec.scheduled_start_time,
+            "monitor_hours": spec.monitor_hours,
+            "recording_dir": spec.recording_dir,
+            "enabled_message_push": spec.enabled_message_push,
+            "platform": spec.platform,
+            "platform_key": spec.platform_key,
+            "only_notify_no_record": spec.only_notify_no_record,
+            "flv_use_direct_download": spec.flv_use_direct_download,
+            "video_bitrate": spec.video_bitrate,
+            "hls_use_native_engine": spec.hls_use_native_engine,
+            "check_failure_count": spec.check_failure_count,
+            "next_retry_at": spec.next_retry_at,
         }
 
     @classmethod
@@ -130,14 +325,18 @@ class Recording:
             data.get("only_notify_no_record"),
             data.get("flv_use_direct_download"),
             data.get("video_bitrate"),
+            bool(data.get("hls_use_native_engine")),
         )
         recording.title = data.get("title", recording.title)
         recording.display_title = data.get("display_title", recording.title)
         recording.last_duration_str = data.get("last_duration")
         recording.platform = data.get("platform")
         recording.platform_key = data.get("platform_key")
+        recording.check_failure_count = data.get("check_failure_count") or 0
+        recording.next_retry_at = data.get("next_retry_at")
         if recording.last_duration_str is not None:
             recording.last_duration = timedelta(seconds=float(recording.last_duration_str))
+        recording.clear_dirty()
         return recording
 
     def update_title(self, quality_info, prefix=None):
@@ -145,8 +344,19 @@ class Recording:
         self.title = f"{self.streamer_name} - {quality_info}"
         self.display_title = f"{prefix or ''}{self.title}"
 
-    def update(self, updated_info: dict):
-        """Update the recording object with new information."""
+    def update(self, updated_info: dict) -> set[str]:
+        """Update the recording object with new information and return the names of the changed attributes."""
+        changed = set()
         for attr, value in updated_info.items():
             if hasattr(self, attr):
+                if getattr(self, attr) != value:
+                    changed.add(attr)
                 setattr(self, attr, value)
+        return changed
+
+
+for _name in SPEC_FIELDS:
+    setattr(Recording, _name, _Field(_name, "spec"))
+for _name in RUNTIME_FIELDS:
+    setattr(Recording, _name, _Field(_name, "runtime"))
+del _name
@@ -13,6 +13,11 @@ from ..state.recording_card_state import RecordingCardState
 from .recording_dialog import RecordingDialog
 from .video_player import VideoPlayer
 
+# Display fields (see ``Recording``) each part of a card depends on.
+STATE_FIELDS = frozenset({"status_info", "is_live", "is_recording", "is_checking", "monitor_status"})
+TITLE_FIELDS = frozenset({"title", "display_title", "is_live", "is_recording", "is_checking", "monitor_status"})
+DURATION_FIELDS = frozenset({"is_recording", "start_time", "cumulative_duration", "last_duration"})
+
 
 class RecordingCardManager:
     def __init__(self, app):
@@ -20,6 +25,8 @@ class RecordingCardManager:
         self.cards_obj = {}
         self.update_duration_tasks = {}
         self.selected_cards = {}
+        # Open info dialogs by rec_id, refreshed by the card updates of their recording.
+        self.info_dialogs = {}
         self.app.language_manager.add_observer(self)
         self._ = {}
         self.load()
@@ -34,14 +41,22 @@ class RecordingCardManager:
         self.app.page.pubsub.subscribe_topic("update", self.subscribe_update_card)
         self.app.page.pubsub.subscribe_topic("delete", self.subscribe_remove_cards)
 
-    async def create_card(self, recording: Recording, subscribe_add_cards: bool = False):
-        """Create a card for a given recording."""
+    async def create_card(
+        self, recording: Recording, subscribe_add_cards: bool = False, check_delay: float | None = None
+    ):
+        """Create a card for a given recording.
+
+        :param check_delay: Delay of the initial live check, used to ramp up checks of many cards at once.
+        """
         rec_id = recording.rec_id
         if not self.cards_obj.get(rec_id):
             check_live_on_browser_refresh = self.app.settings.user_config.get("check_live_on_browser_refresh", True)
             if self.app.recording_enabled and not subscribe_add_cards:
                 if check_live_on_browser_refresh or recording.streamer_name == self._["live_room"]:
-                    self.app.page.run_task(self.app.record_manager.check_if_live, recording)
+                    if check_delay:
+                        self.app.record_manager.schedule_live_check(recording, check_delay)
+                    else:
+                        self.app.page.run_task(self.app.record_manager.check_if_live, recording)
 
         card_data = self._create_card_components(recording)
         self.cards_obj[rec_id] = card_data
@@ -194,20 +209,35 @@ class RecordingCardManager:
             alignment=ft.alignment.Alignment.CENTER,
         )
 
-    async def update_card(self, recording):
-        """Update only the recordings cards in the scrollable content area."""
+    async def update_card(self, recording, fields: set[str] | None = None):
+        """
+        Update only the recordings cards in the scrollable content area.
+
+        :param fields: Changed display fields of the recording; only the affected controls are refreshed.
+            All controls are refreshed when not given.
+        """
+        info_dialog = self.info_dialogs.get(recording.rec_id)
+        if info_dialog is not None:
+            info_dialog.refresh_live_metrics(fields)
         if recording.rec_id in self.cards_obj:
             try:
                 recording_card = self.cards_obj[recording.rec_id]
 
-                display_title = RecordingCardState.get_display_title(recording, self._)
-                if recording_card.get("display_title_label"):
+                def changed(group):
+                    return fields is None or not fields.isdisjoint(group)
+
+                if changed(TITLE_FIELDS) and recording_card.get("display_title_label"):
+                    display_title = RecordingCardState.get_display_title(recording, self._)
                     recording_card["display_title_label"].value = display_title
                     recording_card["display_title_label"].weight = RecordingCardState.get_title_weight(recording)
 
-                new_status_label = self.create_status_label(recording)
-
-                if recording_card["card"] and recording_card["card"].content and recording_card["card"].content.content:
+                if (
+                    changed(STATE_FIELDS)
+                    and recording_card["card"]
+                    and recording_card["card"].content
+                    and recording_card["card"].content.content
+                ):
+                    new_status_label = self.create_status_label(recording)
                     title_row = recording_card["card"].content.content.controls[0]
                     title_row.alignment = ft.MainAxisAlignment.START
                     title_row.spacing = 5
@@ -223,23 +253,24 @@ class RecordingCardManager:
                         if len(title_row.controls) > 1:
                             title_row.controls.pop()
 
-                if recording_card.get("duration_label"):
+                if changed(DURATION_FIELDS) and recording_card.get("duration_label"):
                     recording_card["duration_label"].value = self.app.record_manager.get_duration(recording)
 
-                if recording_card.get("speed_label"):
+                if changed({"speed"}) and recording_card.get("speed_label"):
                     recording_card["speed_label"].value = recording.speed
 
-                if recording_card.get("record_button"):
+                if changed({"is_recording"}) and recording_card.get("record_button"):
                     recording_card["record_button"].icon = self.get_icon_for_recording_state(recording)
                     recording_card["record_button"].tooltip = self.get_tip_for_recording_state(recording)
 
-                if recording_card.get("monitor_button"):
+                if changed({"monitor_status"}) and recording_card.get("monitor_button"):
                     recording_card["monitor_button"].icon = self.get_icon_for_monitor_state(recording)
                     recording_card["monitor_button"].tooltip = self.get_tip_for_monitor_state(recording)
 
                 if recording_card["card"] and recording_card["card"].content:
-                    recording_card["card"].content.bgcolor = self.get_card_background_color(recording)
-                    recording_card["card"].content.border = ft.Border.all(2, self.get_card_border_color(recording))
+                    if changed(STATE_FIELDS | {"selected"}):
+                        recording_card["card"].content.bgcolor = self.get_card_background_color(recording)
+                        recording_card["card"].content.border = ft.Border.all(2, self.get_card_border_color(recording))
                     try:
                         self.app.page.update()
                     except (ft.FletPageDisconnectedException, AssertionError) as e:
@@ -252,6 +283,14 @@ class RecordingCardManager:
             except Exception as e:
                 logger.debug(f"Update card failed: {e}")
 
+    async def push_card_update(self, recording: Recording):
+        """Refresh the card in this session and the other sessions, limited to the display fields that changed."""
+        fields = recording.pop_dirty_display()
+        if not fields:
+            return
+        await self.update_card(recording, fields)
+        self.app.page.pubsub.send_others_on_topic("update", (recording, fields))
+
     async def update_monitor_state(self, recording: Recording):
         """Update the monitor button state based on the current monitoring status."""
         if recording.monitor_status:
@@ -277,8 +316,7 @@ class RecordingCardManager:
             self.app.page.run_task(self.app.record_manager.check_if_live, recording)
             self.app.page.run_task(self.app.snack_bar.show_snack_bar, self._["start_monitor_tip"], ft.Colors.GREEN)
 
-        await self.update_card(recording)
-        self.app.page.pubsub.send_others_on_topic("update", recording)
+        await self.push_card_update(recording)
         self.app.services.run_coro(self.app.record_manager.persist_recordings())
 
     async def show_recording_info_dialog(self, recording: Recording):
@@ -287,10 +325,14 @@ class RecordingCardManager:
             dialog = CardDialog(self.app, recording)
             dialog.open = True
             self.app.dialog_area.content = dialog
+            # The dialog area holds one dialog, opening this one replaces any other.
+            self.info_dialogs.clear()
+            self.info_dialogs[recording.rec_id] = dialog
             try:
                 self.app.page.update()
             except (ft.FletPageDisconnectedException, AssertionError) as e:
                 logger.debug(f"Update recording info dialog failed: {e}")
+            await dialog.load_session_history()
         except (ft.FletPageDisconnectedException, AssertionError) as e:
             logger.debug(f"Show recording info dialog failed: {e}")
         except Exception as e:
@@ -309,8 +351,7 @@ class RecordingCardManager:
             recording.scheduled_start_time, recording.monitor_hours
         )
 
-        await self.update_card(recording)
-        self.app.page.pubsub.send_others_on_topic("update", recording_dict)
+        await self.push_card_update(recording)
 
     async def on_toggle_recording(self, recording: Recording):
         """Toggle the recording state for a specific recording."""
@@ -329,8 +370,7 @@ class RecordingCardManager:
                 else:
                     await self.app.snack_bar.show_snack_bar(self._["please_start_monitor_tip"])
 
-            await self.update_card(recording)
-            self.app.page.pubsub.send_others_on_topic("update", recording)
+            await self.push_card_update(recording)
 
     async def on_delete_recording(self, recording: Recording):
         """Delete a recording from the list and update UI."""
@@ -500,6 +540,12 @@ class RecordingCardManager:
         if self.app.page.web and recording.record_url:
             video_player = VideoPlayer(self.app)
             await video_player.preview_video(recording.preview_url, is_file_path=False, room_url=recording.url)
+            return
+
+        session_history = self.app.record_manager.session_history
+        latest_video = await asyncio.to_thread(session_history.get_latest_output, recording.rec_id)
+        if latest_video:
+            await StoragePage(self.app).preview_file(latest_video, recording.url)
         elif recording.recording_dir and os.path.exists(recording.recording_dir):
             video_files = []
             for root, _, files in os.walk(recording.recording_dir):
@@ -532,8 +578,9 @@ class RecordingCardManager:
     async def recording_card_on_click(self, _, recording: Recording):
         await self.on_card_click(recording)
 
-    async def subscribe_update_card(self, _, recording: Recording):
-        await self.update_card(recording)
+    async def subscribe_update_card(self, _, update: tuple[Recording, set[str]]):
+        recording, fields = update
+        await self.update_card(recording, fields)
 
     async def subscribe_remove_cards(self, _, recordings: list[Recording]):
         await self.remove_recording_card(recordings)
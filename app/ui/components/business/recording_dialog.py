@@ -36,6 +36,7 @@ class RecordingDialog:
         segment_time = config.get_value("segment_time", "video_segment_time", 1800)
         only_notify_no_record = config.get_value("only_notify_no_record", default=False)
         flv_use_direct_download = config.get_value("flv_use_direct_download", default=False)
+        hls_use_native_engine = config.get_value("hls_use_native_engine", default=False)
 
         async def on_url_change(_):
             """Enable or disable the submit button based on whether the URL field is filled."""
@@ -131,6 +132,19 @@ class RecordingDialog:
             tooltip=self._["flv_use_direct_download_tip"],
         )
 
+        hls_use_native_engine_dropdown = ft.Dropdown(
+            label=self._["hls_use_native_engine"],
+            options=[
+                ft.dropdown.DropdownOption("true", self._["yes"]),
+                ft.dropdown.DropdownOption("false", self._["no"]),
+            ],
+            border_radius=5,
+            filled=False,
+            value="true" if hls_use_native_engine else "false",
+            width=500,
+            tooltip=self._["hls_use_native_engine_tip"],
+        )
+
         if self.app.is_mobile:
             media_type_dropdown.width = 500
             record_format_field.width = 500
@@ -349,6 +363,7 @@ class RecordingDialog:
                                         format_row,
                                         quality_row,
                                         video_bitrate_field,
+                                        hls_use_native_engine_dropdown,
                                         recording_dir_field,
                                         segment_setting_dropdown,
                                         segment_input,
@@ -377,14 +392,11 @@ class RecordingDialog:
             logger.warning(f"This platform does not support recording: {url}")
             await self.app.snack_bar.show_snack_bar(self._["platform_not_supported_tip"], duration=3000)
 
-        def get_existing_recordings():
-            existing_recordings = [rec.url for rec in self.app.record_manager.recordings]
-            return existing_recordings
+        def is_existing_url(url):
+            return bool(self.app.record_manager.recording_store.get_by_url(url))
 
         async def on_confirm(e):
 
-            existing_recordings = get_existing_recordings()
-
             if tabs.selected_index == 0:
                 video_bitrate = None
                 bitrate_value = (
@@ -440,10 +452,11 @@ class RecordingDialog:
                         "enabled_message_push": message_push_dropdown.value == "true",
                         "only_notify_no_record": no_record_dropdown.value == "true",
                         "flv_use_direct_download": flv_use_direct_download_dropdown.value == "true",
+                        "hls_use_native_engine": hls_use_native_engine_dropdown.value == "true",
                     }
                 ]
 
-                if live_url in existing_recordings and not rec_id:
+                if is_existing_url(live_url) and not rec_id:
 
                     async def confirm_duplicate():
                         async def close_duplicate_dialog(_):
@@ -479,7 +492,7 @@ class RecordingDialog:
             elif tabs.selected_index == 1:  # Batch entry
                 lines = batch_input.value.splitlines()
                 recordings_info = []
-                batch_url_list = []
+                batch_urls = set()
                 streamer_name = ""
                 quality = "OD"
                 quality_dict = {"0": "OD", "1": "UHD", "2": "HD", "3": "SD", "4": "LD"}
@@ -502,8 +515,7 @@ class RecordingDialog:
                         await not_supported(url)
                         continue
 
-                    existing_urls = set(batch_url_list) | set(existing_recordings)
-                    if url.strip() in existing_urls:
+                    if url.strip() in batch_urls or is_existing_url(url):
                         logger.info(f"Skip {url.strip()}, the live room URL already exists.")
                         continue
 
@@ -522,7 +534,7 @@ class RecordingDialog:
                         "title": title,
                         "display_title": display_title,
                     }
-                    batch_url_list.append(url.strip())
+                    batch_urls.add(url.strip())
                     recordings_info.append(recording_info)
 
                 await self.on_confirm_callback(recordings_info)
@@ -1,14 +1,29 @@
+import asyncio
+from datetime import datetime
+
 import flet as ft
 
+from ....core.media.ffmpeg_progress import format_seconds, format_size
+from ....core.scheduling.live_history import MIN_SESSIONS_FOR_POLICY
 from ....messages.message_pusher import MessagePusher
 from ....models.recording.recording_status_model import RecordingStatus
+from ....utils.logger import logger
+
+# Changed display fields after which the live metrics of an open dialog are refreshed; the speed changes
+# with every throttled progress push of a running recording.
+METRIC_FIELDS = frozenset({"speed", "status_info", "is_recording"})
 
 
 class CardDialog(ft.AlertDialog):
     def __init__(self, app, recording):
         self.app = app
+        self.recording = recording
         self._ = {}
         self.load()
+        self.recording_status_text = ft.Text(size=14)
+        self.recording_metrics_text = ft.Text(size=14)
+        self.recorded_sessions_text = ft.Text(f"{self._['recorded_sessions']}: ...", size=14)
+        self.stall_restarts_text = ft.Text(f"{self._['stall_restarts']}: ...", size=14)
         super().__init__(
             title=ft.Text(self._["recording_info"]),
             content=self.get_content(recording),
@@ -17,6 +32,7 @@ class CardDialog(ft.AlertDialog):
             ],
             actions_alignment=ft.MainAxisAlignment.END,
             modal=False,
+            on_dismiss=self.on_closed,
         )
 
     def load(self):
@@ -40,13 +56,27 @@ class CardDialog(ft.AlertDialog):
         scheduled_recording_status = self._["enabled"] if recording.scheduled_recording else self._["disabled"]
         scheduled_time_range = recording.scheduled_time_range or self._["none"]
         save_path = recording.recording_dir or self._["no_recording_dir_tip"]
-        status_info = RecordingStatus.MONITORING if recording.monitor_status else RecordingStatus.STOPPED_MONITORING
-        recording_status_info = self._[recording.status_info or status_info]
         should_push_message = MessagePusher.should_push_message(self.app.settings, recording, message_type="other")
         message_push = self._["enabled"] if should_push_message else self._["disabled"]
         if not should_push_message and recording.enabled_message_push:
             message_push = self._["disabled"] + f" ({self._['not_config_tip']})"
         only_notify_no_record = self._["enabled"] if recording.only_notify_no_record else self._["disabled"]
+        last_check_time = self._["none"]
+        if recording.detection_time:
+            last_check_time = recording.detection_time.strftime("%Y-%m-%d %H:%M:%S")
+        next_check_in = self.app.record_manager.live_check_scheduler.get_remaining(recording.rec_id)
+        next_check_time = self._["none"] if next_check_in is None else f"{int(next_check_in)}{self._['seconds']}"
+        live_schedule = self.get_live_schedule(recording)
+        polling_interval = f"{self.app.record_manager.get_polling_interval(recording)}{self._['seconds']}"
+        self.set_live_metrics(recording)
+        reconnect_stats = self.app.record_manager.reconnect_lane.get_stats(recording.rec_id)
+        reconnects = self._["none"]
+        if reconnect_stats is not None:
+            reconnects = self._["reconnects_summary"].format(
+                count=reconnect_stats.count,
+                last_gap=f"{reconnect_stats.last_gap:.1f}",
+                max_gap=f"{reconnect_stats.max_gap:.1f}",
+            )
 
         dialog_content = ft.Column(
             [
@@ -66,13 +96,112 @@ class CardDialog(ft.AlertDialog):
                 ft.Text(f"{self._['message_push']}: {message_push}", size=14),
                 ft.Text(f"{self._['only_notify_no_record']}: {only_notify_no_record}", size=14),
                 ft.Text(f"{self._['save_path']}: {save_path}", size=14, selectable=True),
-                ft.Text(f"{self._['recording_status']}: {recording_status_info}", size=14),
+                self.recording_status_text,
+                ft.Text(f"{self._['last_check_time']}: {last_check_time}", size=14),
+                ft.Text(f"{self._['next_check_time']}: {next_check_time}", size=14),
+                ft.Text(f"{self._['live_schedule']}: {live_schedule}", size=14),
+                ft.Text(f"{self._['polling_interval']}: {polling_interval}", size=14),
+                self.recording_metrics_text,
+                self.stall_restarts_text,
+                ft.Text(f"{self._['reconnects']}: {reconnects}", size=14),
+                self.recorded_sessions_text,
             ],
             spacing=8,
             scroll=ft.ScrollMode.AUTO,
         )
         return dialog_content
 
-    def close_panel(self, _):
+    def set_live_metrics(self, recording):
+        status_info = RecordingStatus.MONITORING if recording.monitor_status else RecordingStatus.STOPPED_MONITORING
+        recording_status_info = self._[recording.status_info or status_info]
+        self.recording_status_text.value = f"{self._['recording_status']}: {recording_status_info}"
+        self.recording_metrics_text.value = f"{self._['recording_metrics']}: {self.get_recording_metrics(recording)}"
+
+    def refresh_live_metrics(self, fields: set[str] | None = None):
+        """Refresh the status and metrics lines after a progress push of the recording, while the dialog is open."""
+        if fields is not None and fields.isdisjoint(METRIC_FIELDS):
+            return
+        self.set_live_metrics(self.recording)
+        try:
+            self.recording_status_text.update()
+            self.recording_metrics_text.update()
+        except (ft.FletPageDisconnectedException, AssertionError, RuntimeError) as e:
+            logger.debug(f"Refresh recording info dialog failed: {e}")
+
+    async def load_session_history(self):
+        """Fill in the session and stall summaries, queried off the UI loop since they read the session database."""
+        try:
+            recorded_sessions, stall_restarts = await asyncio.to_thread(self.get_session_history, self.recording)
+        except Exception as e:
+            logger.error(f"Failed to query the session history: {e}")
+            recorded_sessions = stall_restarts = self._["none"]
+        self.recorded_sessions_text.value = f"{self._['recorded_sessions']}: {recorded_sessions}"
+        self.stall_restarts_text.value = f"{self._['stall_restarts']}: {stall_restarts}"
+        try:
+            self.recorded_sessions_text.update()
+            self.stall_restarts_text.update()
+        except (ft.FletPageDisconnectedException, AssertionError, RuntimeError) as e:
+            logger.debug(f"Update session history failed: {e}")
+
+    def get_session_history(self, recording):
+        return self.get_recorded_sessions(recording), self.get_stall_restarts(recording)
+
+    def get_stall_restarts(self, recording):
+        """Summarize the stall restarts of the room over its whole session history."""
+        stall_stats = self.app.record_manager.stall_watchdog.get_stats(recording.rec_id)
+        if stall_stats is None:
+            return self._["none"]
+        return self._["stall_restarts_summary"].format(
+            count=stall_stats.stall_count, time_lost=format_seconds(stall_stats.time_lost)
+        )
+
+    def get_live_schedule(self, recording):
+        """Describe the live schedule learned from the recording's live history."""
+        profile = self.app.record_manager.live_history.get_profile(recording.rec_id)
+        if profile is None:
+            return self._["none"]
+        if not profile.is_learned:
+            return self._["live_schedule_learning"].format(count=profile.session_count, total=MIN_SESSIONS_FOR_POLICY)
+        if not profile.session_count:
+            return self._["live_schedule_never_live"].format(days=int(profile.observed_seconds // 86400))
+        hours = ", ".join(f"{hour:02d}:00" for hour in profile.usual_start_hours[:3])
+        return self._["live_schedule_usual_start"].format(hours=hours, count=profile.session_count)
+
+    def get_recording_metrics(self, recording):
+        """Describe the latest ffmpeg progress of a running recording, or the download speed without ffmpeg."""
+        progress = recording.progress
+        if progress is None:
+            return recording.speed if recording.is_recording else self._["none"]
+        return self._["recording_metrics_summary"].format(
+            bitrate="N/A" if progress.bitrate_kbps is None else f"{progress.bitrate_kbps:.0f}",
+            size=format_size(progress.total_size),
+            out_time=format_seconds(progress.out_time_seconds),
+            fps="N/A" if progress.fps is None else f"{progress.fps:.0f}",
+            dup=progress.dup_frames,
+            drop=progress.drop_frames,
+            speed="N/A" if progress.speed is None else f"{progress.speed:.2f}x",
+        )
+
+    def get_recorded_sessions(self, recording):
+        """Summarize the recording sessions of the room from the session history."""
+        session_history = self.app.record_manager.session_history
+        sessions = session_history.query(rec_id=recording.rec_id, limit=1)
+        if not sessions:
+            return self._["none"]
+        last = sessions[0]
+        return self._["recorded_sessions_summary"].format(
+            count=session_history.count(recording.rec_id),
+            time=datetime.fromtimestamp(last.started_at).strftime("%Y-%m-%d %H:%M:%S"),
+            size=f"{last.bytes / 1024 / 1024:.1f}",
+            segments=last.segments,
+        )
+
+    def close_panel(self, e):
         self.open = False
         self.update()
+        self.on_closed(e)
+
+    def on_closed(self, _):
+        info_dialogs = self.app.record_card_manager.info_dialogs
+        if info_dialogs.get(self.recording.rec_id) is self:
+            del info_dialogs[self.recording.rec_id]
@@ -48,6 +48,17 @@ class RecordingFilters:
     def get_platform_filter_result(cls, recording, platform_filter) -> bool:
         return platform_filter in ("all", recording.platform_key)
 
+    @classmethod
+    def get_matching_ids(cls, recording_store, filter_type, platform_filter) -> set[str] | None:
+        """``rec_id`` of the recordings passing both filters, from the store indexes; None when no filter is set."""
+        matching_ids = None
+        if filter_type != "all":
+            matching_ids = {rec.rec_id for rec in recording_store.get_by_status(filter_type)}
+        if platform_filter != "all":
+            platform_ids = {rec.rec_id for rec in recording_store.get_by_platform(platform_filter)}
+            matching_ids = platform_ids if matching_ids is None else matching_ids & platform_ids
+        return matching_ids
+
     @classmethod
     def should_show_recording(cls, filter_type, platform_filter, recording) -> bool:
         status_visible = cls.get_status_filter_result(recording, filter_type)
@@ -350,8 +350,8 @@ class HomePage(PageBase):
         )
 
     def create_stats_area(self):
-        total_recordings = len(self.app.record_manager.recordings)
-        active_recordings = len([r for r in self.app.record_manager.recordings if r.is_recording])
+        total_recordings = len(self.app.record_manager.recording_store)
+        active_recordings = self.app.record_manager.recording_store.count_by_status("recording")
 
         stopped_recordings = total_recordings - active_recordings
 
@@ -1,10 +1,12 @@
 import asyncio
 import uuid
+from collections import deque
 
 import flet as ft
 
 from ...core.platforms.platform_handlers import get_platform_info
 from ...core.recording.record_manager import RecordingManager
+from ...core.scheduling.circuit_breaker import CircuitState
 from ...models.recording.recording_model import Recording
 from ...utils.logger import logger
 from ..base_page import PageBase
@@ -13,6 +15,10 @@ from ..components.dialogs.help_dialog import HelpDialog
 from ..components.dialogs.search_dialog import SearchDialog
 from ..filters import RecordingFilters
 
+# Cards rendered before the page becomes interactive; the rest are appended in batches of CARD_BATCH_SIZE.
+CARD_FIRST_PAGE_SIZE = 60
+CARD_BATCH_SIZE = 200
+
 
 class RecordingsPage(PageBase):
     CARD_MIN_WIDTH = 320
@@ -259,10 +265,7 @@ class RecordingsPage(PageBase):
             ),
         ]
 
-        platforms = {}
-        for recording in self.app.record_manager.recordings:
-            if recording.platform and recording.platform_key:
-                platforms[recording.platform_key] = recording.platform
+        platforms = self.app.record_manager.recording_store.get_platform_names()
 
         platform_options = [ft.dropdown.DropdownOption(key="all", text=self._["filter_all"])]
 
@@ -290,7 +293,11 @@ class RecordingsPage(PageBase):
             platform_dropdown.menu_height = 320
 
         platform_filter_area = ft.Row(
-            [ft.Text(self._["platform_filter"] + ":", size=14), platform_dropdown],
+            [
+                *self.create_platform_circuit_indicators(platforms),
+                ft.Text(self._["platform_filter"] + ":", size=14),
+                platform_dropdown,
+            ],
             spacing=8,
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
@@ -325,6 +332,38 @@ class RecordingsPage(PageBase):
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             )
 
+    def create_platform_circuit_indicators(self, platforms: dict) -> list[ft.Control]:
+        """Create a badge for every platform whose live checks are paused by its circuit breaker."""
+        indicators = []
+        for breaker in self.app.record_manager.circuit_breakers.get_tripped():
+            half_open = breaker.state == CircuitState.HALF_OPEN
+            platform_name = platforms.get(breaker.platform_key, breaker.platform_key)
+            tooltip_key = "platform_circuit_half_open_tip" if half_open else "platform_circuit_open_tip"
+            indicators.append(
+                ft.Container(
+                    content=ft.Row(
+                        [
+                            ft.Icon(ft.Icons.CLOUD_OFF, size=14, color=ft.Colors.WHITE),
+                            ft.Text(platform_name, size=12, color=ft.Colors.WHITE),
+                        ],
+                        spacing=4,
+                        tight=True,
+                    ),
+                    bgcolor=ft.Colors.ORANGE if half_open else ft.Colors.RED,
+                    border_radius=5,
+                    padding=ft.Padding.symmetric(horizontal=8, vertical=4),
+                    tooltip=self._[tooltip_key].format(failures=breaker.consecutive_failures),
+                )
+            )
+        return indicators
+
+    async def refresh_filter_area(self):
+        """Rebuild the filter area, e.g. when a platform circuit breaker opens or closes."""
+        if self.app.current_page is not self or len(self.content_area.controls) < 2:
+            return
+        self.content_area.controls[1] = self.create_filter_area()
+        self.content_area.update()
+
     async def filter_all_on_click(self, _):
         self.current_filter = "all"
         await self.apply_filter()
@@ -356,22 +395,18 @@ class RecordingsPage(PageBase):
             self.content_area.controls.append(self.create_filter_area())
 
         cards_obj = self.app.record_card_manager.cards_obj
-        recordings = self.app.record_manager.recordings
-
-        for recording in recordings:
-            card_info = cards_obj.get(recording.rec_id)
-            if not card_info:
-                continue
-
-            status_visible = RecordingFilters.get_status_filter_result(recording, self.current_filter)
-            platform_visible = RecordingFilters.get_platform_filter_result(recording, self.current_platform_filter)
-
-            visible = status_visible and platform_visible
-            card_info["card"].visible = visible
+        matching_ids = self.get_filter_matching_ids()
+        for rec_id, card_info in cards_obj.items():
+            card_info["card"].visible = matching_ids is None or rec_id in matching_ids
 
         self.content_area.update()
         self.recording_card_area.update()
 
+    def get_filter_matching_ids(self) -> set[str] | None:
+        return RecordingFilters.get_matching_ids(
+            self.app.record_manager.recording_store, self.current_filter, self.current_platform_filter
+        )
+
     async def reset_cards_visibility(self):
         cards_obj = self.app.record_card_manager.cards_obj
         for card_info in cards_obj.values():
@@ -380,7 +415,6 @@ class RecordingsPage(PageBase):
                 card_info["card"].update()
 
     async def filter_recordings(self, query):
-        recordings = self.app.record_manager.recordings
         cards_obj = self.app.record_card_manager.cards_obj
 
         if not query.strip():
@@ -388,22 +422,19 @@ class RecordingsPage(PageBase):
             return {}
         else:
             lower_query = query.strip().lower()
-            search_ids = {
+            # Only the recordings passing the status and platform filters are searched.
+            matching_ids = self.get_filter_matching_ids()
+            if matching_ids is None:
+                candidates = self.app.record_manager.recordings
+            else:
+                store = self.app.record_manager.recording_store
+                candidates = [rec for rec in map(store.get, matching_ids) if rec is not None]
+            filtered_ids = {
                 rec.rec_id
-                for rec in recordings
+                for rec in candidates
                 if lower_query in str(rec.to_dict()).lower() or lower_query in rec.display_title
             }
 
-            filtered_ids = set()
-
-            for rec_id in search_ids:
-                recording = self.app.record_manager.find_recording_by_id(rec_id)
-                if not recording:
-                    continue
-
-                if RecordingFilters.should_show_recording(self.current_filter, self.current_platform_filter, recording):
-                    filtered_ids.add(rec_id)
-
             for card_info in cards_obj.values():
                 card_info["card"].visible = card_info["card"].key in filtered_ids
                 card_info["card"].update()
@@ -424,39 +455,85 @@ class RecordingsPage(PageBase):
         )
 
     async def add_record_cards(self):
+        """
+        Create the recording cards in stages.
 
+        The first page of cards is rendered right away and the page becomes interactive, the remaining
+        cards are appended in batches. Recordings still being loaded in the background are handed over
+        by the record manager batch by batch as they are hydrated.
+        """
         self.loading_indicator.visible = True
         self.loading_indicator.update()
 
-        cards_to_create = []
-        existing_cards = []
+        record_manager = self.app.record_manager
+        cards_obj = self.app.record_card_manager.cards_obj
+        loop = asyncio.get_running_loop()
+        hydrated_batches: asyncio.Queue[tuple[list[Recording], bool]] = asyncio.Queue()
 
-        for recording in self.app.record_manager.recordings:
-            if recording.rec_id not in self.app.record_card_manager.cards_obj:
-                cards_to_create.append(recording)
-            else:
-                existing_card = self.app.record_card_manager.cards_obj[recording.rec_id]["card"]
+        def on_batch_hydrated(batch: list[Recording], done: bool):
+            loop.call_soon_threadsafe(hydrated_batches.put_nowait, (batch, done))
+
+        recordings, hydrated = record_manager.subscribe_hydration(on_batch_hydrated)
+        room_count = len(recordings)
+        existing_cards = []
+        pending = deque()
+        for recording in recordings:
+            if recording.rec_id in cards_obj:
+                existing_card = cards_obj[recording.rec_id]["card"]
                 existing_card.visible = True
                 existing_cards.append(existing_card)
+            else:
+                pending.append(recording)
 
-        async def create_card_with_time_range(_recording: Recording):
-            _card = await self.app.record_card_manager.create_card(_recording)
-            _recording.scheduled_time_range = await self.app.record_manager.get_scheduled_time_range(
+        async def create_card_with_time_range(_recording: Recording, _ramp_window: float):
+            check_delay = record_manager.get_ramp_delay(_recording, _ramp_window)
+            _card = await self.app.record_card_manager.create_card(_recording, check_delay=check_delay)
+            _recording.scheduled_time_range = await record_manager.get_scheduled_time_range(
                 _recording.scheduled_start_time, _recording.monitor_hours
             )
             return _card, _recording
 
-        if cards_to_create:
-            results = await asyncio.gather(*[create_card_with_time_range(recording) for recording in cards_to_create])
-
-            for card, recording in results:
-                self.recording_card_area.content.controls.append(card)
-                self.app.record_card_manager.cards_obj[recording.rec_id]["card"] = card
+        is_first_page = True
+        try:
+            while True:
+                if not pending:
+                    if hydrated:
+                        break
+                    if is_first_page:
+                        await self._finish_first_card_page()
+                        is_first_page = False
+                    batch, hydrated = await hydrated_batches.get()
+                    room_count += len(batch)
+                    pending.extend(batch)
+                    continue
 
-            if existing_cards:
-                for card in existing_cards:
+                batch_size = CARD_FIRST_PAGE_SIZE if is_first_page else CARD_BATCH_SIZE
+                batch = [pending.popleft() for _ in range(min(batch_size, len(pending)))]
+                # Skip recordings deleted or given a card by another path since they were queued.
+                batch = [rec for rec in batch if rec.rec_id not in cards_obj and rec in record_manager.recording_store]
+                ramp_window = record_manager.get_ramp_window(room_count)
+                results = await asyncio.gather(*[create_card_with_time_range(rec, ramp_window) for rec in batch])
+                for card, recording in results:
                     self.recording_card_area.content.controls.append(card)
+                    cards_obj[recording.rec_id]["card"] = card
+
+                if is_first_page:
+                    self.recording_card_area.content.controls.extend(existing_cards)
+                    await self._finish_first_card_page()
+                    is_first_page = False
+                elif self.app.current_page is self:
+                    self.recording_card_area.update()
+                await asyncio.sleep(0)
+        finally:
+            record_manager.unsubscribe_hydration(on_batch_hydrated)
+
+        if is_first_page:
+            await self._finish_first_card_page()
+        elif self.app.current_page is self:
+            await self.refresh_filter_area()
+            await self.apply_filter()
 
+    async def _finish_first_card_page(self):
         self.loading_indicator.visible = False
         self.loading_indicator.update()
         self.recording_card_area.update()
@@ -500,6 +577,7 @@ class RecordingsPage(PageBase):
                     only_notify_no_record=recording_info["only_notify_no_record"],
                     flv_use_direct_download=recording_info["flv_use_direct_download"],
                     video_bitrate=recording_info["video_bitrate"],
+                    hls_use_native_engine=recording_info["hls_use_native_engine"],
                 )
             else:
                 recording = Recording(
@@ -519,6 +597,7 @@ class RecordingsPage(PageBase):
                     only_notify_no_record=user_config.get("only_notify_no_record"),
                     flv_use_direct_download=user_config.get("flv_use_direct_download"),
                     video_bitrate=None,
+                    hls_use_native_engine=user_config.get("hls_use_native_engine", False),
                 )
 
             platform, platform_key = get_platform_info(recording.url)
@@ -528,13 +607,15 @@ class RecordingsPage(PageBase):
 
             recording.loop_time_seconds = int(user_config.get("loop_time_seconds", 300))
             recording.update_title(self._[recording.quality])
-            await self.app.record_manager.add_recording(recording)
             new_recordings.append(recording)
 
         if new_recordings:
+            await self.app.record_manager.add_recordings(new_recordings)
+            ramp_window = self.app.record_manager.get_ramp_window(len(new_recordings))
 
             async def create_card_with_time_range(rec):
-                _card = await self.app.record_card_manager.create_card(rec)
+                check_delay = self.app.record_manager.get_ramp_delay(rec, ramp_window)
+                _card = await self.app.record_card_manager.create_card(rec, check_delay=check_delay)
                 rec.scheduled_time_range = await self.app.record_manager.get_scheduled_time_range(
                     rec.scheduled_start_time, rec.monitor_hours
                 )
@@ -177,10 +177,7 @@ class SettingsPage(PageBase):
             # For other controls, e.data is string
             self.user_config[key] = e.data
 
-        if key in ["folder_name_platform", "folder_name_author", "folder_name_time", "folder_name_title"]:
-            for recording in self.app.record_manager.recordings:
-                recording.recording_dir = None
-            self.app.services.run_coro(self.app.record_manager.persist_recordings())
+        self.app.record_manager.apply_settings_change({key})
 
         if key == "language":
             self.load_language()
@@ -188,8 +185,6 @@ class SettingsPage(PageBase):
             self.app.language_manager.notify_observers()
             self.page.run_task(self.load)
 
-        if key == "loop_time_seconds":
-            self.app.record_manager.initialize_dynamic_state()
         if key in {"scheduled_shutdown_enabled", "scheduled_shutdown_time"}:
             await self.app.shutdown_manager.reschedule()
         self.page.run_task(self.delay_handler.start_task_timer, self.save_user_config_after_delay, None)
@@ -412,6 +407,16 @@ class SettingsPage(PageBase):
                                 on_change=self.on_change,
                             ),
                         ),
+                        self.create_setting_row(
+                            self._["check_failure_backoff_max_seconds"],
+                            ft.TextField(
+                                value=str(self.get_config_value("check_failure_backoff_max_seconds", 3600)),
+                                width=100,
+                                data="check_failure_backoff_max_seconds",
+                                on_change=self.on_change,
+                                hint_text=self._["check_failure_backoff_max_seconds_tip"],
+                            ),
+                        ),
                         self.create_setting_row(
                             self._["is_segmented_recording_enabled"],
                             ft.Switch(
@@ -448,6 +453,15 @@ class SettingsPage(PageBase):
                                 tooltip=self._["flv_use_direct_download_tip"],
                             ),
                         ),
+                        self.create_setting_row(
+                            self._["hls_use_native_engine"],
+                            ft.Switch(
+                                value=self.get_config_value("hls_use_native_engine"),
+                                data="hls_use_native_engine",
+                                on_change=self.on_change,
+                                tooltip=self._["hls_use_native_engine_tip"],
+                            ),
+                        ),
                         self.create_setting_row(
                             self._["space_threshold"],
                             ft.TextField(
@@ -526,6 +540,26 @@ class SettingsPage(PageBase):
                                 hint_text=self._["platform_max_concurrent_requests_tip"],
                             ),
                         ),
+                        self.create_setting_row(
+                            self._["platform_requests_per_second"],
+                            ft.TextField(
+                                value=str(self.get_config_value("platform_requests_per_second", 2)),
+                                width=100,
+                                data="platform_requests_per_second",
+                                on_change=self.on_change,
+                                hint_text=self._["platform_requests_per_second_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["platform_request_burst"],
+                            ft.TextField(
+                                value=str(self.get_config_value("platform_request_burst", 5)),
+                                width=100,
+                                data="platform_request_burst",
+                                on_change=self.on_change,
+                                hint_text=self._["platform_request_burst_tip"],
+                            ),
+                        ),
                         self.create_setting_row(
                             self._["check_live_on_browser_refresh"],
                             ft.Switch(
@@ -535,6 +569,24 @@ class SettingsPage(PageBase):
                                 tooltip=self._["check_live_on_browser_refresh_tip"],
                             ),
                         ),
+                        self.create_setting_row(
+                            self._["adaptive_polling_enabled"],
+                            ft.Switch(
+                                value=self.get_config_value("adaptive_polling_enabled", True),
+                                data="adaptive_polling_enabled",
+                                on_change=self.on_change,
+                                tooltip=self._["adaptive_polling_enabled_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["live_check_ramp_enabled"],
+                            ft.Switch(
+                                value=self.get_config_value("live_check_ramp_enabled", True),
+                                data="live_check_ramp_enabled",
+                                on_change=self.on_change,
+                                tooltip=self._["live_check_ramp_enabled_tip"],
+                            ),
+                        ),
                     ],
                     is_mobile,
                 ),
@@ -1,16 +1,20 @@
 import asyncio
 import os
+import time
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
 import flet as ft
 from dotenv import find_dotenv, load_dotenv
 
+from ...core.recording.session_history import resolve_output_path
 from ...utils.logger import logger
 from ..base_page import PageBase as BasePage
 
 dotenv_path = find_dotenv()
 load_dotenv(dotenv_path)
 VIDEO_API_EXTERNAL_URL = os.getenv("VIDEO_API_EXTERNAL_URL")
+DATE_FILTER_DAYS = {"filter_today": 0, "filter_last_7_days": 7, "filter_last_30_days": 30}
 
 
 class StoragePage(BasePage):
@@ -22,6 +26,9 @@ class StoragePage(BasePage):
         self.path_display = None
         self.content = None
         self.file_list = None
+        self.session_filters = {"streamer_name": "all", "platform_key": "all", "date": "all"}
+        self.streamer_names = []
+        self.platform_names = {}
         self._ = {}
         self.executor = ThreadPoolExecutor(max_workers=4)
         self.load_language()
@@ -30,6 +37,10 @@ class StoragePage(BasePage):
     async def load(self):
         self.root_path = self.app.settings.get_video_save_path()
         self.current_path = self.root_path
+        session_history = self.app.record_manager.session_history
+        loop = asyncio.get_event_loop()
+        self.streamer_names = await loop.run_in_executor(self.executor, session_history.get_streamer_names)
+        self.platform_names = await loop.run_in_executor(self.executor, session_history.get_platform_names)
         self.setup_ui()
         await self.update_file_list()
 
@@ -41,10 +52,50 @@ class StoragePage(BasePage):
             selectable=True,
         )
         self.file_list = ft.ListView(expand=True, spacing=2, padding=10)
-        self.content = ft.Column(controls=[self.path_display, self.file_list])
+        self.content = ft.Column(controls=[self.path_display, self.create_session_filters(), self.file_list])
         self.app.content_area.controls = [self.content]
         self.app.content_area.update()
 
+    def create_session_filters(self):
+        """Filters by streamer, platform and date, answered from the session history."""
+        date_options = [("all", self._["filter_all"])] + [(key, self._[key]) for key in DATE_FILTER_DAYS]
+        filters = (
+            ("streamer_name", self._["filter_streamer"], [(name, name) for name in self.streamer_names]),
+            ("platform_key", self._["filter_platform"], list(self.platform_names.items())),
+            ("date", self._["filter_date"], date_options[1:]),
+        )
+        controls = []
+        for field, label, options in filters:
+            if self.session_filters[field] not in {"all", *(key for key, _ in options)}:
+                self.session_filters[field] = "all"
+            dropdown = ft.Dropdown(
+                options=[
+                    ft.dropdown.DropdownOption(key=key, text=text)
+                    for key, text in [("all", self._["filter_all"]), *options]
+                ],
+                value=self.session_filters[field],
+                on_select=lambda e, name=field: self.on_session_filter_change(name, e.control.value),
+                width=150,
+                text_size=14,
+                content_padding=ft.Padding.only(top=8, bottom=8, left=10, right=10),
+                border_radius=5,
+                border_color=ft.Colors.OUTLINE,
+                focused_border_color=ft.Colors.PRIMARY,
+                dense=True,
+            )
+            if len(options) > 8:
+                dropdown.menu_height = 320
+            controls.extend([ft.Text(label + ":", size=14), dropdown])
+        return ft.Row(controls, wrap=True, spacing=8)
+
+    def on_session_filter_change(self, field, value):
+        self.session_filters[field] = value
+        self.app.page.run_task(self.update_file_list)
+
+    @property
+    def has_session_filter(self):
+        return any(value != "all" for value in self.session_filters.values())
+
     def load_language(self):
         language = self.app.language_manager.language
         for key in ("storage_page", "base"):
@@ -55,6 +106,10 @@ class StoragePage(BasePage):
             self.path_display.value = self._["current_path"] + ":" + self.current_path
             self.file_list.controls.clear()
 
+            if self.has_session_filter:
+                await self.create_session_buttons()
+                return
+
             if self.current_path != self.root_path:
                 back_button = ft.Button(
                     self._["go_back"],
@@ -137,14 +192,60 @@ class StoragePage(BasePage):
 
         self.file_list.controls.extend(buttons)
 
-    def show_empty_folder_message(self):
+    async def create_session_buttons(self):
+        streamer_name = self.session_filters["streamer_name"]
+        platform_key = self.session_filters["platform_key"]
+        days = DATE_FILTER_DAYS.get(self.session_filters["date"])
+        since = None
+        if days is not None:
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            since = today.timestamp() - days * 86400
+
+        def _get_items():
+            _items = []
+            sessions = self.app.record_manager.session_history.query(
+                streamer_name=None if streamer_name == "all" else streamer_name,
+                platform_key=None if platform_key == "all" else platform_key,
+                since=since,
+            )
+            for session in sessions:
+                started = time.strftime("%Y-%m-%d %H:%M", time.localtime(session.started_at))
+                for index, path in enumerate(session.output_paths):
+                    resolved = resolve_output_path(path)
+                    if resolved:
+                        name = f"{started} {session.streamer_name} | {os.path.basename(resolved)}"
+                        # The start of a session that took over through a hand-off repeats the end of the previous one.
+                        if index == 0 and session.handoff_from is not None and session.overlap_seconds:
+                            name += " " + self._["session_overlap"].format(seconds=f"{session.overlap_seconds:.0f}")
+                        _items.append((name, resolved))
+            return _items
+
+        items = await asyncio.get_event_loop().run_in_executor(self.executor, _get_items)
+        if not items:
+            self.show_empty_folder_message(self._["no_sessions_found"])
+            return
+
+        for name, full_path in items:
+            if self.app.is_mobile:
+                item = ft.ListTile(
+                    leading=ft.Icon(ft.Icons.INSERT_DRIVE_FILE),
+                    title=ft.Text(name),
+                    on_click=lambda e, path=full_path: self.app.page.run_task(self.preview_file, path),
+                )
+            else:
+                item = ft.Button(
+                    f"📄 {name}", on_click=lambda e, path=full_path: self.app.page.run_task(self.preview_file, path)
+                )
+            self.file_list.controls.append(item)
+
+    def show_empty_folder_message(self, message=None):
         self.file_list.controls.append(
             ft.Card(
                 content=ft.Container(
                     content=ft.Row(
                         controls=[
                             ft.Icon(ft.Icons.FOLDER_OPEN),
-                            ft.Text(self._["empty_recording_folder"], size=16, weight=ft.FontWeight.BOLD),
+                            ft.Text(message or self._["empty_recording_folder"], size=16, weight=ft.FontWeight.BOLD),
                         ],
                         alignment=ft.MainAxisAlignment.CENTER,
                     ),
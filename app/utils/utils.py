@@ -10,6 +10,7 @@ import string
 import subprocess
 import sys
 import traceback
+from contextvars import ContextVar
 from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Any, Optional
@@ -44,6 +45,9 @@ URL_PATTERN = re.compile(r"^(https?://)" r"([a-zA-Z0-9-]+\.)+[a-zA-Z0-9]{1,6}" r
 
 CONTAINS_URL_PATTERN = re.compile(r"(?i)\bhttps?://" r"(?:[a-zA-Z0-9-]+\.)+[a-zA-Z0-9]{1,6}" r"(?::\d+)?" r"(?:/\S*)?")
 
+# Error swallowed by the last trace_error_decorator call in the current task, so callers can react to it.
+last_traced_error: ContextVar[str | None] = ContextVar("last_traced_error", default=None)
+
 
 def is_web_session_alive(page) -> bool:
     """Return True if the flet page session/connection is still healthy."""
@@ -98,13 +102,16 @@ class Color:
 def trace_error_decorator(func: callable) -> callable:
     @functools.wraps(func)
     async def wrapper(*args: list, **kwargs: dict) -> Any:
+        last_traced_error.set(None)
         try:
             return await func(*args, **kwargs)
         except execjs.ProgramError:
+            last_traced_error.set("Failed to execute JS code")
             logger.warning("Failed to execute JS code. Please check if the Node.js environment")
         except Exception as e:
             error_line = traceback.extract_tb(e.__traceback__)[-1].lineno
             error_info = f"Type: {type(e).__name__}, {e} in function {func.__name__} at line: {error_line}"
+            last_traced_error.set(error_info)
             logger.error(error_info)
             return []
 
@@ -228,20 +235,20 @@ def is_current_time_within_range(time_range_str: str):
         return start_time <= now <= end_time
 
 
-def is_time_interval_exceeded(last_check_time, interval_seconds=60):
+def get_seconds_until_time_range_start(time_range_str: str) -> float:
     """
-    Check if the time interval between the current time and the last check time exceeds the specified seconds.
+    Get the number of seconds until the next start of a daily time range such as '18:30:00~23:30:00'.
 
-    :param last_check_time: The time of the last check. type: datetime.Time
-    :param interval_seconds: The time interval in seconds. Default is 60 seconds. type: int
-    :return: Returns True if the time interval exceeds the specified seconds, otherwise returns False.
+    :param time_range_str: The time range, only the start part is used.
+    :return: Seconds until the start time is reached next, today or tomorrow.
     """
-    now = datetime.now().time()
-    if not last_check_time or last_check_time > now:
-        return True
-    last_check_datetime = datetime.combine(datetime.today(), last_check_time)
-    time_diff = datetime.combine(datetime.today(), now) - last_check_datetime
-    return time_diff.total_seconds() > interval_seconds
+    start_str = time_range_str.split("~")[0].strip()
+    start_time = datetime.strptime(start_str, "%H:%M:%S").time()
+    now = datetime.now()
+    next_start = datetime.combine(now.date(), start_time)
+    if next_start <= now:
+        next_start += timedelta(days=1)
+    return (next_start - now).total_seconds()
 
 
 def clean_name(input_text, default=None):
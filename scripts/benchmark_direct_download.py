@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiofiles
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.core.media.direct_downloader import DirectStreamDownloader
+from app.utils.logger import logger
+
+SEND_INTERVAL = 0.1
+
+
+def serve(bitrate_kbps: int, port_queue) -> None:
+    """Endless FLV-like responses sent at ``bitrate_kbps`` per connection."""
+    payload = b"\x00" * int(bitrate_kbps * 1000 / 8 * SEND_INTERVAL)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: video/x-flv\r\nConnection: close\r\n\r\n")
+            next_send = time.monotonic()
+            while True:
+                writer.write(payload)
+                await writer.drain()
+                next_send += SEND_INTERVAL
+                await asyncio.sleep(max(0.0, next_send - time.monotonic()))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=4096)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def download_aiofiles(url: str, save_path: str, stop_event: asyncio.Event, counter: list[int]) -> None:
+    """Previous write path: one aiofiles write, a thread pool round trip, per 16 KB chunk."""
+    async with httpx.AsyncClient(timeout=None) as client:
+        async with client.stream("GET", url) as response:
+            async with aiofiles.open(save_path, "wb") as f:
+                async for chunk in response.aiter_bytes(1024 * 16):
+                    if stop_event.is_set():
+                        break
+                    await f.write(chunk)
+                    counter[0] += len(chunk)
+
+
+async def measure_loop_lag(stop_event: asyncio.Event, lags: list[float]) -> None:
+    while not stop_event.is_set():
+        started = time.monotonic()
+        await asyncio.sleep(0.1)
+        lags.append(time.monotonic() - started - 0.1)
+
+
+async def run(
+    mode: str, url: str, streams: int, seconds: float, warmup: float, out_dir: Path
+) -> tuple[float, int, float]:
+    """CPU time, bytes received and worst event loop lag over ``seconds``, after ``warmup`` to connect."""
+    stop_event = asyncio.Event()
+    if mode == "write-behind":
+        downloaders = [
+            DirectStreamDownloader(f"{url}/{index}.flv", str(out_dir / f"{index}.flv")) for index in range(streams)
+        ]
+        for downloader in downloaders:
+            await downloader.start_download()
+
+        def get_received() -> int:
+            return sum(downloader.total_bytes for downloader in downloaders)
+
+        async def stop() -> None:
+            await asyncio.gather(*(downloader.stop_download() for downloader in downloaders))
+    else:
+        counters = [[0] for _ in range(streams)]
+        tasks = [
+            asyncio.create_task(download_aiofiles(f"{url}/{index}.flv", str(out_dir / f"{index}.flv"), stop_event, c))
+            for index, c in enumerate(counters)
+        ]
+
+        def get_received() -> int:
+            return sum(c[0] for c in counters)
+
+        async def stop() -> None:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Opening the connections is not part of the write path, it is left out of the measurement.
+    await asyncio.sleep(warmup)
+    lags: list[float] = []
+    lag_task = asyncio.create_task(measure_loop_lag(stop_event, lags))
+    cpu_started, received_started = time.process_time(), get_received()
+    await asyncio.sleep(seconds)
+    cpu, received = time.process_time() - cpu_started, get_received() - received_started
+    stop_event.set()
+    await lag_task
+    await stop()
+    return cpu, received, max(lags, default=0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure the direct download write path against a local server: CPU, loop lag and throughput."
+    )
+    parser.add_argument("--streams", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--seconds", type=float, default=15.0, help="measured time of every run")
+    parser.add_argument("--warmup", type=float, default=5.0, help="time to open the connections, not measured")
+    parser.add_argument("--bitrate-kbps", type=int, default=4000)
+    parser.add_argument(
+        "--modes", nargs="+", choices=["aiofiles", "write-behind"], default=["aiofiles", "write-behind"]
+    )
+    args = parser.parse_args()
+    logger.remove()
+
+    port_queue = multiprocessing.Queue()
+    # The server runs in its own process, so its CPU time is not counted for the downloads.
+    server = multiprocessing.Process(target=serve, args=(args.bitrate_kbps, port_queue), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{port_queue.get(timeout=10)}/live"
+    expected_rate = args.bitrate_kbps * 1000 / 8
+
+    print(f"{'streams':>8} {'mode':>13} {'cpu':>7} {'streams/core':>13} {'max lag':>9} {'throughput':>11}")
+    try:
+        for streams in args.streams:
+            for mode in args.modes:
+                out_dir = Path(tempfile.mkdtemp(prefix="streamcap_direct_"))
+                try:
+                    cpu, received, max_lag = asyncio.run(run(mode, url, streams, args.seconds, args.warmup, out_dir))
+                finally:
+                    shutil.rmtree(out_dir, ignore_errors=True)
+                cpu_share = cpu / args.seconds
+                # Streams one core could keep up with at this bitrate, extrapolated from the CPU time used.
+                per_core = streams / cpu_share if cpu_share else float("inf")
+                throughput = received / (streams * expected_rate * args.seconds)
+                print(
+                    f"{streams:>8} {mode:>13} {cpu_share:>6.0%} {per_core:>13.0f} {max_lag * 1000:>7.0f}ms"
+                    f" {throughput:>10.0%}"
+                )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.core.media.hls_downloader import HLSStreamDownloader
+from app.utils.logger import logger
+
+TS_PACKET_SIZE = 188
+PLAYLIST_WINDOW = 6
+
+
+def make_segment(seconds: float, bitrate_kbps: int) -> bytes:
+    """One TS segment: encoded test video when ffmpeg is available, otherwise null TS packets of the same size."""
+    if shutil.which("ffmpeg"):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "segment.ts")
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-loglevel",
+                    "error",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "testsrc=size=1280x720:rate=30",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "sine",
+                    "-t",
+                    str(seconds),
+                    "-c:v",
+                    "libx264",
+                    "-b:v",
+                    f"{bitrate_kbps}k",
+                    "-c:a",
+                    "aac",
+                    "-f",
+                    "mpegts",
+                    path,
+                ],
+                check=True,
+            )
+            return Path(path).read_bytes()
+    packets = int(seconds * bitrate_kbps * 1000 / 8 / TS_PACKET_SIZE)
+    return (b"\x47\x1f\xff\x10" + b"\xff" * (TS_PACKET_SIZE - 4)) * packets
+
+
+class LiveHLSHandler(BaseHTTPRequestHandler):
+    """Live playlist of every stream id, sliding forward one segment per segment duration."""
+
+    segment = b""
+    segment_duration = 2.0
+    started_at = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if len(parts) == 2 and parts[0] == "live" and parts[1].endswith(".m3u8"):
+            stream = parts[1].removesuffix(".m3u8")
+            last = int((time.time() - self.started_at) / self.segment_duration) + PLAYLIST_WINDOW
+            first = last - PLAYLIST_WINDOW + 1
+            lines = [
+                "#EXTM3U",
+                "#EXT-X-VERSION:3",
+                f"#EXT-X-TARGETDURATION:{int(self.segment_duration)}",
+                f"#EXT-X-MEDIA-SEQUENCE:{first}",
+            ]
+            for sequence in range(first, last + 1):
+                lines += [f"#EXTINF:{self.segment_duration:.3f},", f"/seg/{stream}/{sequence}.ts"]
+            self._send(("\n".join(lines) + "\n").encode(), "application/vnd.apple.mpegurl")
+        elif len(parts) == 3 and parts[0] == "seg":
+            self._send(self.segment, "video/mp2t")
+        else:
+            self.send_error(404)
+
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(segment: bytes, segment_duration: float, port_queue) -> None:
+    LiveHLSHandler.segment = segment
+    LiveHLSHandler.segment_duration = segment_duration
+    LiveHLSHandler.started_at = time.time()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LiveHLSHandler)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def read_rss_kb(pid: int | str = "self") -> int:
+    """Resident set size from /proc, 0 where it is not available."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+async def measure_native(base_url: str, streams: int, seconds: float, out_dir: Path) -> tuple[float, float, int]:
+    baseline_rss = read_rss_kb()
+    cpu_started = time.process_time()
+    downloaders = [
+        HLSStreamDownloader(f"{base_url}/live/{index}.m3u8", str(out_dir / f"native_{index}.ts"))
+        for index in range(streams)
+    ]
+    for downloader in downloaders:
+        await downloader.start_download()
+    peak_rss = baseline_rss
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.5)
+        peak_rss = max(peak_rss, read_rss_kb())
+    await asyncio.gather(*(downloader.stop_download() for downloader in downloaders))
+    cpu = time.process_time() - cpu_started
+    return cpu, (peak_rss - baseline_rss) / 1024, sum(downloader.total_bytes for downloader in downloaders)
+
+
+def measure_ffmpeg(base_url: str, streams: int, seconds: float, out_dir: Path) -> tuple[float, float, int]:
+    cpu_started = os.times()
+    processes = [
+        subprocess.Popen(
+            [
+                "ffmpeg",
+                "-loglevel",
+                "error",
+                "-y",
+                "-i",
+                f"{base_url}/live/{index}.m3u8",
+                "-c",
+                "copy",
+                "-f",
+                "mpegts",
+                str(out_dir / f"ffmpeg_{index}.ts"),
+            ],
+            stdin=subprocess.PIPE,
+        )
+        for index in range(streams)
+    ]
+    peak_rss = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        time.sleep(0.5)
+        peak_rss = max(peak_rss, sum(read_rss_kb(process.pid) for process in processes))
+    for process in processes:
+        process.communicate(b"q", timeout=15)
+    cpu_finished = os.times()
+    cpu = (cpu_finished.children_user - cpu_started.children_user) + (
+        cpu_finished.children_system - cpu_started.children_system
+    )
+    written = sum((out_dir / f"ffmpeg_{index}.ts").stat().st_size for index in range(streams))
+    return cpu, peak_rss / 1024, written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare CPU and memory per stream of the native HLS engine and ffmpeg on a local HLS server."
+    )
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--seconds", type=float, default=20.0, help="recording time of every run")
+    parser.add_argument("--segment-duration", type=float, default=2.0)
+    parser.add_argument("--bitrate-kbps", type=int, default=2500)
+    args = parser.parse_args()
+    logger.remove()
+
+    port_queue = multiprocessing.Queue()
+    segment = make_segment(args.segment_duration, args.bitrate_kbps)
+    # The server runs in its own process, so its CPU time is not counted for the native engine.
+    server = multiprocessing.Process(target=serve, args=(segment, args.segment_duration, port_queue), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+    use_ffmpeg = shutil.which("ffmpeg") is not None
+    if not use_ffmpeg:
+        print("ffmpeg not found, measuring the native engine only (null TS segments)")
+
+    print(f"{'streams':>8} {'engine':>8} {'cpu/stream':>12} {'rss/stream':>12} {'written':>10}")
+    try:
+        for streams in args.streams:
+            out_dir = Path(tempfile.mkdtemp(prefix="streamcap_hls_"))
+            try:
+                results = [("native", asyncio.run(measure_native(base_url, streams, args.seconds, out_dir)))]
+                if use_ffmpeg:
+                    results.append(("ffmpeg", measure_ffmpeg(base_url, streams, args.seconds, out_dir)))
+            finally:
+                shutil.rmtree(out_dir, ignore_errors=True)
+            for engine, (cpu, rss_mb, written) in results:
+                print(
+                    f"{streams:>8} {engine:>8} {cpu / streams * 1000:>10.1f}ms {rss_mb / streams:>10.2f}MB"
+                    f" {written / 1024 / 1024:>8.1f}MB"
+                )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
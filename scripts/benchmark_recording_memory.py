@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.models.recording.recording_model import Recording
+
+
+def make_record(index: int) -> dict:
+    return {
+        "rec_id": f"{index:032x}",
+        "url": f"https://live.example.com/room/{index}",
+        "streamer_name": f"streamer_{index}",
+        "record_format": "ts",
+        "quality": "OD",
+        "segment_record": True,
+        "segment_time": "1800",
+        "monitor_status": index % 3 != 0,
+        "scheduled_recording": False,
+        "scheduled_start_time": None,
+        "monitor_hours": None,
+        "recording_dir": None,
+        "enabled_message_push": False,
+        "platform": "Example",
+        "platform_key": "example",
+        "only_notify_no_record": False,
+        "flv_use_direct_download": False,
+        "video_bitrate": None,
+        "check_failure_count": 0,
+        "next_retry_at": None,
+    }
+
+
+def measure_memory(records: list[dict]) -> tuple[list[Recording], int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    recordings = [Recording.from_dict(record) for record in records]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return recordings, allocated
+
+
+def measure_to_dict(recordings: list[Recording], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for recording in recordings:
+            recording.to_dict()
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure memory per room and to_dict cost of Recording objects.")
+    parser.add_argument("--rooms", type=int, default=10_000, help="number of recordings to create")
+    parser.add_argument("--rounds", type=int, default=5, help="to_dict passes over all recordings")
+    args = parser.parse_args()
+
+    # Build the input outside the measured window, so only the Recording objects are counted.
+    records = [make_record(i) for i in range(args.rooms)]
+    recordings, allocated = measure_memory(records)
+    to_dict_seconds = measure_to_dict(recordings, args.rounds)
+
+    print(f"rooms:               {args.rooms}")
+    print(f"memory total:        {allocated / 1024 / 1024:.2f} MiB")
+    print(f"memory per room:     {allocated / args.rooms:.0f} bytes")
+    print(f"to_dict all rooms:   {to_dict_seconds * 1000:.2f} ms")
+    print(f"to_dict per room:    {to_dict_seconds / args.rooms * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
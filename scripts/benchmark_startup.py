@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.core.recording.record_manager import GlobalRecordingState, RecordingManager
+from app.core.runtime.backend_services import BackendServices
+from app.models.recording.recording_model import Recording
+from app.utils.logger import logger
+
+
+def make_record(index: int) -> dict:
+    return {
+        "rec_id": f"{index:032x}",
+        "url": f"https://live.example.com/room/{index}",
+        "streamer_name": f"streamer_{index}",
+        "record_format": "ts",
+        "quality": "OD",
+        "segment_record": True,
+        "segment_time": "1800",
+        "monitor_status": False,
+        "scheduled_recording": False,
+        "scheduled_start_time": None,
+        "monitor_hours": None,
+        "recording_dir": None,
+        "enabled_message_push": False,
+        "platform": "Example",
+        "platform_key": "example",
+        "only_notify_no_record": False,
+        "flv_use_direct_download": False,
+        "video_bitrate": None,
+        "check_failure_count": 0,
+        "next_retry_at": None,
+    }
+
+
+def prepare_run_path(rooms: int, storage: str) -> Path:
+    run_path = Path(tempfile.mkdtemp(prefix="streamcap_startup_"))
+    shutil.copytree(ROOT / "config", run_path / "config")
+    shutil.copytree(ROOT / "locales", run_path / "locales")
+    settings = json.loads((run_path / "config" / "default_settings.json").read_text(encoding="utf-8"))
+    settings["recordings_storage"] = storage
+    (run_path / "config" / "user_settings.json").write_text(json.dumps(settings), encoding="utf-8")
+    records = [make_record(i) for i in range(rooms)]
+    (run_path / "config" / "recordings.json").write_text(json.dumps(records, indent=4), encoding="utf-8")
+    return run_path
+
+
+def measure_eager(run_path: Path) -> float:
+    """Previous behaviour: parse the whole file and build every recording before anything is shown."""
+    started = time.perf_counter()
+    with open(run_path / "config" / "recordings.json", encoding="utf-8") as file:
+        records = json.load(file)
+    for record in records:
+        Recording.from_dict(record)
+    return time.perf_counter() - started
+
+
+def measure_staged(run_path: Path) -> tuple[float, float, int]:
+    GlobalRecordingState.store.clear()
+    services = BackendServices(str(run_path))
+    started = time.perf_counter()
+    manager = RecordingManager(services)
+    first_page = time.perf_counter() - started
+    first_page_rooms = len(manager.recordings)
+
+    started = time.perf_counter()
+    asyncio.run(manager.hydrate_recordings())
+    hydration = time.perf_counter() - started
+    manager.recordings_writer.shutdown()
+    return first_page, hydration, first_page_rooms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure staged startup: first page of rooms and background hydration."
+    )
+    parser.add_argument("--rooms", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--storage", choices=["json", "sqlite"], default="json")
+    args = parser.parse_args()
+    logger.remove()
+
+    print(f"{'rooms':>8} {'eager load':>12} {'first page':>12} {'hydration':>12}")
+    for rooms in args.rooms:
+        run_path = prepare_run_path(rooms, args.storage)
+        try:
+            eager = measure_eager(run_path)
+            first_page, hydration, first_page_rooms = measure_staged(run_path)
+        finally:
+            shutil.rmtree(run_path, ignore_errors=True)
+        print(
+            f"{rooms:>8} {eager * 1000:>10.1f}ms {first_page * 1000:>10.1f}ms {hydration * 1000:>10.1f}ms"
+            f"  ({first_page_rooms} rooms on the first page)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.core.media.hls_downloader import HLSStreamDownloader, parse_playlist
+
+
+def media_playlist(first: int, last: int, ended: bool = False, discontinuity: int = 0, extra: str = "") -> str:
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-TARGETDURATION:0.05",
+        f"#EXT-X-MEDIA-SEQUENCE:{first}",
+        f"#EXT-X-DISCONTINUITY-SEQUENCE:{discontinuity}",
+    ]
+    if extra:
+        lines.append(extra)
+    for sequence in range(first, last + 1):
+        lines += ["#EXTINF:0.05,", f"/segments/{sequence}.ts"]
+    if ended:
+        lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def segment_data(sequence: int) -> bytes:
+    return f"<segment {sequence}>".encode()
+
+
+class ScriptedHLSHandler(BaseHTTPRequestHandler):
+    """Serves each playlist path from a list of versions, one per reload; the last version is repeated."""
+
+    playlists: dict[str, list[str]] = {}
+    missing_segments: set[int] = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path in self.playlists:
+            versions = self.playlists[self.path]
+            body = (versions.pop(0) if len(versions) > 1 else versions[0]).encode()
+        elif self.path.startswith("/segments/"):
+            sequence = int(self.path.removeprefix("/segments/").removesuffix(".ts"))
+            if sequence in self.missing_segments:
+                self.send_error(404)
+                return
+            body = segment_data(sequence)
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ParsePlaylistTest(unittest.TestCase):
+    def test_media_playlist(self):
+        playlist = parse_playlist(media_playlist(10, 12, ended=True, discontinuity=2), "http://host/live/index.m3u8")
+        assert playlist.target_duration == 0.05
+        assert playlist.media_sequence == 10
+        assert playlist.discontinuity_sequence == 2
+        assert [segment.sequence for segment in playlist.segments] == [10, 11, 12]
+        assert playlist.segments[0].url == "http://host/segments/10.ts"
+        assert playlist.ended
+        assert playlist.unsupported is None
+
+    def test_master_playlist(self):
+        text = (
+            "#EXTM3U\n"
+            "#EXT-X-STREAM-INF:BANDWIDTH=800000,RESOLUTION=640x360\nlow/index.m3u8\n"
+            "#EXT-X-STREAM-INF:BANDWIDTH=2500000,RESOLUTION=1280x720\nhigh/index.m3u8\n"
+        )
+        playlist = parse_playlist(text, "http://host/live/master.m3u8")
+        assert playlist.variants == [
+            (800000, "http://host/live/low/index.m3u8"),
+            (2500000, "http://host/live/high/index.m3u8"),
+        ]
+        assert not playlist.segments
+
+    def test_unsupported_streams(self):
+        encrypted = media_playlist(0, 1, extra='#EXT-X-KEY:METHOD=AES-128,URI="key.bin"')
+        assert parse_playlist(encrypted, "http://host/").unsupported == "encrypted segments"
+        clear = media_playlist(0, 1, extra="#EXT-X-KEY:METHOD=NONE")
+        assert parse_playlist(clear, "http://host/").unsupported is None
+        fmp4 = media_playlist(0, 1, extra='#EXT-X-MAP:URI="init.mp4"')
+        assert parse_playlist(fmp4, "http://host/").unsupported == "fMP4 segments"
+
+
+class HLSStreamDownloaderTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ScriptedHLSHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ScriptedHLSHandler.playlists = {}
+        ScriptedHLSHandler.missing_segments = set()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.save_path = os.path.join(self.tmp.name, "record.ts")
+
+    async def record(self, path: str) -> HLSStreamDownloader:
+        downloader = HLSStreamDownloader(f"{self.base_url}{path}", self.save_path)
+        await downloader.start_download()
+        await downloader.download_task
+        return downloader
+
+    def read_output(self) -> bytes:
+        with open(self.save_path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def expected(*sequences: int) -> bytes:
+        return b"".join(segment_data(sequence) for sequence in sequences)
+
+    async def test_selects_highest_bandwidth_variant(self):
+        ScriptedHLSHandler.playlists = {
+            "/master.m3u8": [
+                "#EXTM3U\n"
+                "#EXT-X-STREAM-INF:BANDWIDTH=2500000\n/high.m3u8\n"
+                "#EXT-X-STREAM-INF:BANDWIDTH=800000\n/low.m3u8\n"
+            ],
+            "/high.m3u8": [media_playlist(0, 1, ended=True)],
+            "/low.m3u8": [media_playlist(100, 101, ended=True)],
+        }
+        downloader = await self.record("/master.m3u8")
+        assert downloader.error is None
+        assert self.read_output() == self.expected(0, 1)
+
+    async def test_deduplicates_segments_across_reloads(self):
+        ScriptedHLSHandler.playlists = {
+            "/live.m3u8": [media_playlist(0, 5), media_playlist(3, 7), media_playlist(5, 9, ended=True)],
+        }
+        downloader = await self.record("/live.m3u8")
+        # The recording starts three segments before the live edge and writes every later segment once.
+        assert self.read_output() == self.expected(3, 4, 5, 6, 7, 8, 9)
+        assert downloader.segments_written == 7
+        assert downloader.segments_skipped == 0
+
+    async def test_counts_skipped_segments(self):
+        ScriptedHLSHandler.playlists = {
+            "/live.m3u8": [media_playlist(0, 3), media_playlist(6, 9, ended=True)],
+        }
+        ScriptedHLSHandler.missing_segments = {8}
+        downloader = await self.record("/live.m3u8")
+        # Segments 4 and 5 left the playlist between reloads and segment 8 could not be fetched.
+        assert self.read_output() == self.expected(1, 2, 3, 6, 7, 9)
+        assert downloader.segments_written == 6
+        assert downloader.segments_skipped == 3
+
+    async def test_reanchors_after_origin_restart(self):
+        ScriptedHLSHandler.playlists = {
+            "/live.m3u8": [media_playlist(100, 105), media_playlist(0, 1), media_playlist(0, 3, ended=True)],
+        }
+        downloader = await self.record("/live.m3u8")
+        assert self.read_output() == self.expected(103, 104, 105, 0, 1, 2, 3)
+        assert downloader.segments_skipped == 0
+
+    async def test_reanchors_when_discontinuity_sequence_goes_back(self):
+        ScriptedHLSHandler.playlists = {
+            "/live.m3u8": [
+                media_playlist(10, 12, discontinuity=3),
+                media_playlist(11, 13, discontinuity=0, ended=True),
+            ],
+        }
+        await self.record("/live.m3u8")
+        assert self.read_output() == self.expected(10, 11, 12, 11, 12, 13)
+
+    async def test_ignores_stale_playlist(self):
+        ScriptedHLSHandler.playlists = {
+            "/live.m3u8": [media_playlist(10, 15), media_playlist(9, 14), media_playlist(12, 17, ended=True)],
+        }
+        await self.record("/live.m3u8")
+        assert self.read_output() == self.expected(13, 14, 15, 16, 17)
+
+    async def test_refuses_encrypted_stream(self):
+        ScriptedHLSHandler.playlists = {
+            "/live.m3u8": [media_playlist(0, 3, extra='#EXT-X-KEY:METHOD=AES-128,URI="/key.bin"')],
+        }
+        downloader = await self.record("/live.m3u8")
+        assert downloader.error == "Unsupported HLS stream: encrypted segments"
+        assert not os.path.exists(self.save_path)
+
+    async def test_refuses_fmp4_stream(self):
+        ScriptedHLSHandler.playlists = {
+            "/live.m3u8": [media_playlist(0, 3, extra='#EXT-X-MAP:URI="/init.mp4"')],
+        }
+        downloader = await self.record("/live.m3u8")
+        assert downloader.error == "Unsupported HLS stream: fMP4 segments"
+        assert not os.path.exists(self.save_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
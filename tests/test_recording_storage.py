@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from app.core.recording.recording_storage import SQLiteRecordingStorage
+
+
+def record(rec_id: str, **fields) -> dict:
+    return {"rec_id": rec_id, "url": f"https://live.example.com/{rec_id}", "platform_key": "example", **fields}
+
+
+class SQLiteRecordingStorageTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config_manager = SimpleNamespace(
+            recordings_db_path=os.path.join(tmp.name, "recordings.db"),
+            recordings_config_path=os.path.join(tmp.name, "recordings.json"),
+        )
+        self.storage = SQLiteRecordingStorage(config_manager)
+        self.addCleanup(self.storage.close)
+
+    def test_save_rows_writes_only_the_given_rows(self):
+        self.storage.save([record("a"), record("b"), record("c")])
+        changes = self.storage._conn.total_changes
+
+        self.storage.save_rows([record("b", monitor_status=True), record("d")], removed=["c"])
+        # One upsert of b, one insert of d and one delete of c; a is not touched.
+        assert self.storage._conn.total_changes - changes == 3
+        assert self.storage.load() == [record("a"), record("b", monitor_status=True), record("d")]
+
+    def test_save_rows_skips_unchanged_rows(self):
+        self.storage.save_rows([record("a"), record("b")])
+        changes = self.storage._conn.total_changes
+        self.storage.save_rows([record("a"), record("b")], removed=["missing"])
+        assert self.storage._conn.total_changes == changes
+
+    def test_save_rewrites_the_full_list(self):
+        self.storage.save_rows([record("a"), record("b"), record("c")])
+        self.storage.save([record("c"), record("a")])
+        # Existing rows keep their position, rows missing from the list are deleted.
+        assert self.storage.load() == [record("a"), record("c")]
+
+
+if __name__ == "__main__":
+    unittest.main()
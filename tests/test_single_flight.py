@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+
+from app.core.scheduling.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_followers_share_the_result(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "live"
+
+        results = await asyncio.gather(*(flight.do("room", fetch) for _ in range(3)))
+        assert calls == 1
+        assert sorted(results) == [("live", False), ("live", False), ("live", True)]
+
+    async def test_follower_runs_when_leader_is_cancelled(self):
+        flight = SingleFlight()
+        leader_started = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                leader_started.set()
+                await asyncio.sleep(10)
+            return "live"
+
+        leader = asyncio.create_task(flight.do("room", fetch))
+        await leader_started.wait()
+        follower = asyncio.create_task(flight.do("room", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await follower == ("live", True)
+        await asyncio.gather(leader, return_exceptions=True)
+        assert leader.cancelled()
+        assert calls == 2
+
+    async def test_cancelled_follower_does_not_cancel_others(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "live"
+
+        leader = asyncio.create_task(flight.do("room", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("room", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        followers[0].cancel()
+        release.set()
+
+        assert await leader == ("live", True)
+        assert await followers[1] == ("live", False)
+        await asyncio.gather(followers[0], return_exceptions=True)
+        assert followers[0].cancelled()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from app.core.media.ffmpeg_progress import FFmpegProgressParser
+from app.core.recording.stall_watchdog import StallWatchdog
+from app.core.recording.stream_manager import LiveStreamRecorder
+
+
+def feed_progress(recorder: LiveStreamRecorder, *lines: str) -> None:
+    """Feed one ``-progress`` block to the recorder like ``_read_progress`` does."""
+    parser = FFmpegProgressParser()
+    for line in (*lines, "progress=continue"):
+        progress = parser.feed(line)
+    recorder._on_progress(progress)
+
+
+class SegmentedRecordingTest(unittest.TestCase):
+    """The segment muxer reports ``total_size=N/A``; the output files show the progress instead."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output_dir = tmp.name
+        self.recording = SimpleNamespace(
+            rec_id="room", url="https://live.example.com/room", title="room", progress=None, speed=None
+        )
+        self.session_history = SimpleNamespace(add_stall_time=lambda session_id, seconds: None)
+        self.recording_manager = SimpleNamespace(active_recorders={}, session_history=self.session_history)
+        self.services = SimpleNamespace(
+            settings_config=SimpleNamespace(user_config={}, accounts_config={}, cookies_config={}),
+            subprocess_start_up_info=None,
+            language_manager=SimpleNamespace(add_observer=lambda observer: None, language={}),
+            recording_manager=self.recording_manager,
+            broadcast_card_update=lambda recording: None,
+        )
+
+    def make_recorder(self) -> LiveStreamRecorder:
+        recording_info = {"live_url": "https://live.example.com/room", "output_dir": self.output_dir}
+        recorder = LiveStreamRecorder(self.services, self.recording, recording_info)
+        recorder.save_file_path = os.path.join(self.output_dir, "room_%03d.ts")
+        return recorder
+
+    def append_segment_data(self, index: int, size: int) -> None:
+        with open(os.path.join(self.output_dir, f"room_{index:03d}.ts"), "ab") as f:
+            f.write(b"\0" * size)
+
+    def test_growing_segments_are_not_stalled(self):
+        recorder = self.make_recorder()
+        self.recording_manager.active_recorders["room"] = recorder
+        watchdog = StallWatchdog(self.recording_manager, {"stall_timeout_seconds": 60})
+
+        self.append_segment_data(0, 1024)
+        feed_progress(recorder, "total_size=N/A", "out_time_us=2000000")
+        assert recorder.get_bytes_written() == 1024
+        assert watchdog.check(now=0) == []
+
+        self.append_segment_data(0, 1024)
+        self.append_segment_data(1, 512)
+        feed_progress(recorder, "total_size=N/A", "out_time_us=64000000")
+        assert watchdog.check(now=61) == []
+        assert recorder.get_bytes_written() == 2560
+
+        # Segments that stop growing are still detected.
+        assert watchdog.check(now=122) == [recorder]
+
+    def test_handoff_completes_on_output_time(self):
+        old_recorder = self.make_recorder()
+        recorder = self.make_recorder()
+        recorder.handoff_from = old_recorder
+
+        feed_progress(recorder, "total_size=N/A", "out_time_us=N/A")
+        assert recorder.handoff_from is old_recorder
+        assert not old_recorder.should_stop
+
+        feed_progress(recorder, "total_size=N/A", "out_time_us=1500000")
+        assert recorder.handoff_from is None
+        assert old_recorder.should_stop
+        assert not old_recorder.owns_recording
+        assert old_recorder.handed_off_to is recorder
+        assert self.recording.progress.out_time_seconds == 1.5
+
+
+if __name__ == "__main__":
+    unittest.main()